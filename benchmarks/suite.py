@@ -0,0 +1,399 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from optimisation.bee_colony_optimiser import BeeColonyOptimiser
+from optimisation.fcfs import FCFS
+from optimisation.ga import GeneticOptimiser
+from optimisation.tabu_search import TabuSearchOptimiser
+from optimisation.trace import ConvergenceTrace
+from problem.acs import ACS
+from utils.input import load_acs_from_csv
+from utils.synthetic import fit_profile, generate_acs
+
+# The IKLI instances every benchmark runs on, besides the generated sizes
+INSTANCE_PATTERN = "./dataset/ikli_instances/*.csv"
+BASELINE_PATH = "./benchmarks/baseline.json"
+# The unit of every benchmark, rates are better when higher and times when lower
+RATE_UNITS = {"evaluate": "evals/s", "next": "next/s", "bco": "iter/s", "ga": "iter/s"}
+TIME_UNIT = "s"
+# The overhead of recording a convergence trace, as a fraction of the time of a run
+# without it, is a regression above TRACE_OVERHEAD_LIMIT whatever the baseline
+OVERHEAD_UNIT = "fraction"
+TRACE_OVERHEAD_LIMIT = 0.01
+
+
+def instances(
+    num_runways: int, sizes: Sequence[int], seed: int, only: Optional[str] = None
+) -> Iterator[Tuple[str, ACS]]:
+    """
+    Yields the instances of the suite: every IKLI instance, then a synthetic instance
+    of every size
+
+    :param num_runways: Number of runways
+    :param sizes: The numbers of airplanes of the synthetic instances
+    :param seed: The seed of the synthetic instances
+    :param only: A substring of the names of the instances yielded, None for all
+    :return: Iterator over the name and problem of every instance
+    """
+    for path in sorted(glob.glob(INSTANCE_PATTERN)):
+        name = os.path.splitext(os.path.basename(path))[0]
+        if only is None or only in name:
+            yield name, load_acs_from_csv(path, num_runways)
+    profile = None
+    for size in sizes:
+        name = f"synthetic_{size}"
+        if only is None or only in name:
+            profile = fit_profile() if profile is None else profile
+            yield name, generate_acs(size, num_runways, seed, profile)
+
+
+def measure_rate(step: Callable[[], Any], min_time: float) -> float:
+    """
+    Calls a function until at least min_time seconds have passed, checking the clock
+    in batches that double so that short calls are not dominated by the timer
+
+    :param step: The function measured
+    :param min_time: The minimum time measured in seconds
+    :return: The number of calls per second
+    """
+    calls, batch = 0, 1
+    start = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            step()
+        calls += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+        batch *= 2
+
+
+def bench_evaluate(problem: ACS, min_time: float) -> float:
+    """
+    Measures the evaluations per second of random solutions, without the fitness
+    cache
+
+    :param problem: The problem
+    :param min_time: The minimum time measured in seconds
+    :return: The evaluations per second
+    """
+    values = [problem.generate_solution().value for _ in range(64)]
+    cache_size, problem.fitness_cache_size = problem.fitness_cache_size, 0
+    index = iter(range(sys.maxsize))
+    try:
+        return measure_rate(
+            lambda: problem.evaluate(values[next(index) % len(values)]), min_time
+        )
+    finally:
+        problem.fitness_cache_size = cache_size
+
+
+def bench_next(problem: ACS, min_time: float) -> float:
+    """
+    Measures the neighbours per second generated by ACS.next
+
+    :param problem: The problem
+    :param min_time: The minimum time measured in seconds
+    :return: The neighbours per second
+    """
+    solution = problem.generate_solution()
+    companion = problem.generate_solution()
+    return measure_rate(lambda: problem.next(solution, companion), min_time)
+
+
+def bench_bco(problem: ACS, min_time: float, params: Dict[str, Any]) -> float:
+    """
+    Measures the iterations per second of the bee colony optimiser
+
+    :param problem: The problem
+    :param min_time: The minimum time measured in seconds
+    :param params: The parameters of the optimiser
+    :return: The iterations per second
+    """
+    optimiser = BeeColonyOptimiser(problem, **params)
+    return measure_rate(lambda: optimiser.optimise_iter(1), min_time)
+
+
+def bench_ga(problem: ACS, min_time: float, params: Dict[str, Any]) -> float:
+    """
+    Measures the generations per second of the genetic optimiser. The number of
+    generations is doubled until a run takes min_time, so the population is only
+    created once per run.
+
+    :param problem: The problem
+    :param min_time: The minimum time measured in seconds
+    :param params: The parameters of the optimiser, without generations
+    :return: The generations per second
+    """
+    generations = 1
+    while True:
+        optimiser = GeneticOptimiser(problem, generations=generations, **params)
+        start = time.perf_counter()
+        optimiser.optimise()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return generations / elapsed
+        generations *= 2
+
+
+def bench_time_to_target(
+    problem: ACS, target_ratio: float, max_iter: int, min_time: float, seed: int
+) -> Optional[float]:
+    """
+    Measures the time tabu search takes to reach a target cost of target_ratio times
+    the FCFS cost. The target is set as the target fitness of the optimiser, so that
+    it stops as soon as it reaches it. Short runs are repeated with the same seed
+    until min_time has passed and the fastest is kept.
+
+    :param problem: The problem
+    :param target_ratio: The target cost as a fraction of the FCFS cost
+    :param max_iter: The iterations of tabu search after which the target counts as
+        missed
+    :param min_time: The minimum time measured in seconds
+    :param seed: The seed of every run
+    :return: The time to the target in seconds, None if it was missed
+    """
+    target = target_ratio * FCFS(problem).optimise().fitness
+    fastest, total = float("inf"), 0.0
+    while total < min_time:
+        random.seed(seed)
+        optimiser = TabuSearchOptimiser(problem, max_iter)
+        optimiser.target_fitness = target
+        start = time.perf_counter()
+        solution = optimiser.optimise()
+        elapsed = time.perf_counter() - start
+        if solution.fitness > target:
+            return None
+        fastest, total = min(fastest, elapsed), total + elapsed
+    return fastest
+
+
+def bench_trace_overhead(
+    problem: ACS, max_iter: int, min_time: float, seed: int
+) -> float:
+    """
+    Measures the overhead of recording a convergence trace on tabu search. Runs of
+    max_iter iterations with an attached trace are repeated with the same seed until
+    min_time has passed, timing the calls of the trace apart from the rest of the
+    runs. Timing the calls themselves keeps the result stable, where the difference
+    of traced and untraced runs is dominated by noise.
+
+    :param problem: The problem
+    :param max_iter: The iterations of every run
+    :param min_time: The minimum time measured in seconds
+    :param seed: The seed of every run
+    :return: The time of the trace as a fraction of the time of the runs without it
+    """
+    traced = 0.0
+    total = 0.0
+
+    def timed(trace: ConvergenceTrace) -> Callable[[Any, int, float], None]:
+        def call(optimiser: Any, iteration: int, fitness: float) -> None:
+            nonlocal traced
+            start = time.perf_counter()
+            trace(optimiser, iteration, fitness)
+            traced += time.perf_counter() - start
+
+        return call
+
+    while total < min_time:
+        random.seed(seed)
+        optimiser = TabuSearchOptimiser(problem, max_iter)
+        optimiser.on_improvement = timed(ConvergenceTrace().attach(optimiser))
+        start = time.perf_counter()
+        optimiser.optimise()
+        total += time.perf_counter() - start
+    return traced / (total - traced)
+
+
+def run_suite(
+    num_runways: int = 3,
+    sizes: Sequence[int] = (1000, 10000),
+    min_time: float = 0.5,
+    target_ratio: float = 0.9,
+    target_iterations: int = 1000,
+    seed: int = 0,
+    only: Optional[str] = None,
+    trace_iterations: int = 50,
+) -> Dict[str, Any]:
+    """
+    Runs every benchmark on every instance of the suite. The random generators are
+    seeded before every benchmark, so the runs only differ in their timings.
+
+    :param num_runways: Number of runways
+    :param sizes: The numbers of airplanes of the synthetic instances
+    :param min_time: The minimum time of every rate measurement in seconds
+    :param target_ratio: The target cost as a fraction of the FCFS cost
+    :param target_iterations: The iterations of tabu search after which a target
+        counts as missed
+    :param seed: The seed of the instances and optimisers
+    :param only: A substring of the names of the instances to run, None for all
+    :param trace_iterations: The iterations of tabu search of the trace overhead
+        runs
+    :return: The machine description and the results keyed by instance/benchmark
+    """
+    bco_params = {"number_of_bees": 20, "max_iter": sys.maxsize, "trial_limit": 5}
+    ga_params = {"population_size": 20}
+    benchmarks = {
+        "evaluate": lambda problem: bench_evaluate(problem, min_time),
+        "next": lambda problem: bench_next(problem, min_time),
+        "bco": lambda problem: bench_bco(problem, min_time, bco_params),
+        "ga": lambda problem: bench_ga(problem, min_time, ga_params),
+        "time_to_target": lambda problem: bench_time_to_target(
+            problem, target_ratio, target_iterations, min_time, seed
+        ),
+        "trace_overhead": lambda problem: bench_trace_overhead(
+            problem, trace_iterations, min_time, seed
+        ),
+    }
+
+    results = {}
+    for name, problem in instances(num_runways, sizes, seed, only):
+        for benchmark, run in benchmarks.items():
+            random.seed(seed)
+            np.random.seed(seed)
+            results[f"{name}/{benchmark}"] = {
+                "value": run(problem),
+                "unit": RATE_UNITS.get(
+                    benchmark,
+                    OVERHEAD_UNIT if benchmark == "trace_overhead" else TIME_UNIT,
+                ),
+                "num_aircraft": len(problem.all_ac),
+            }
+
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "settings": {
+            "num_runways": num_runways,
+            "sizes": list(sizes),
+            "min_time": min_time,
+            "target_ratio": target_ratio,
+            "target_iterations": target_iterations,
+            "seed": seed,
+            "trace_iterations": trace_iterations,
+        },
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Compares results with a baseline. A rate is a regression if it falls below
+    1 - tolerance times the baseline, and a time if it exceeds 1 + tolerance times
+    the baseline or the target is missed where the baseline reached it. An overhead
+    is a regression above TRACE_OVERHEAD_LIMIT, with or without a baseline.
+
+    :param results: The results of run_suite
+    :param baseline: The results of run_suite stored as baseline
+    :param tolerance: The relative change allowed
+    :return: A description of every regression
+    """
+    regressions = []
+    for key, result in results["results"].items():
+        if result["unit"] == OVERHEAD_UNIT:
+            if result["value"] > TRACE_OVERHEAD_LIMIT:
+                regressions.append(
+                    f"{key}: {result['value']:.2%} overhead, limit "
+                    f"{TRACE_OVERHEAD_LIMIT:.0%}"
+                )
+            continue
+        if key not in baseline["results"]:
+            continue
+        value, expected = result["value"], baseline["results"][key]["value"]
+        if expected is None:
+            continue
+        if result["unit"] == TIME_UNIT:
+            if value is None:
+                regressions.append(f"{key}: missed, baseline {expected:.4g} s")
+            elif value > expected * (1 + tolerance):
+                regressions.append(f"{key}: {value:.4g} s, baseline {expected:.4g} s")
+        elif value < expected * (1 - tolerance):
+            regressions.append(
+                f"{key}: {value:.4g} {result['unit']}, baseline {expected:.4g}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmark suite, writes the results as JSON and compares them with the
+    baseline
+
+    :param argv: The arguments, those of the process if None
+    :return: The exit status, 1 if there are regressions or no baseline to compare
+        with
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks the evaluator and the optimisers on the IKLI "
+        "instances and synthetic instances.",
+    )
+    parser.add_argument("--output", default=None, help="write the results here")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the results as the baseline instead of comparing",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--runways", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000])
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--target-ratio", type=float, default=0.9)
+    parser.add_argument("--target-iterations", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-iterations", type=int, default=50)
+    parser.add_argument("--only", default=None, help="substring of instance names")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        args.runways,
+        args.sizes,
+        args.min_time,
+        args.target_ratio,
+        args.target_iterations,
+        args.seed,
+        args.only,
+        args.trace_iterations,
+    )
+    for key, result in results["results"].items():
+        value = "missed" if result["value"] is None else f"{result['value']:.4g}"
+        print(f"{key:<40} {value:>12} {result['unit']}")
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline")
+        return 1
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["settings"] != results["settings"]:
+        print(f"The settings differ from those of {args.baseline}")
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"Regression {regression}")
+    if len(regressions) == 0:
+        print(f"No regressions against {args.baseline}")
+    return 1 if len(regressions) > 0 else 0
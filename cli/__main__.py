@@ -0,0 +1,4 @@
+import sys
+from cli.solve import main
+
+sys.exit(main())
@@ -0,0 +1,232 @@
+import argparse
+import importlib
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
+import numpy as np
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+# The optimisers by name, as module and class so that only the chosen one is imported
+OPTIMISERS = {
+    "fcfs": ("optimisation.fcfs", "FCFS"),
+    "bco": ("optimisation.bee_colony_optimiser", "BeeColonyOptimiser"),
+    "ga": ("optimisation.ga", "GeneticOptimiser"),
+    "tabu": ("optimisation.tabu_search", "TabuSearchOptimiser"),
+    "bnb": ("optimisation.branch_and_bound", "BranchAndBoundOptimiser"),
+    "mip": ("optimisation.mip", "MIPOptimiser"),
+    "cps-dp": ("optimisation.cps_dp", "CPSDynamicProgrammingOptimiser"),
+    "greedy-cost": ("optimisation.constructive", "CostWeightedGreedy"),
+    "greedy-wake": ("optimisation.constructive", "WakeBatchingGreedy"),
+    "greedy-lookahead": ("optimisation.constructive", "LookAheadGreedy"),
+}
+# The optimisers that stop at their deadline with the best solution found so far, the
+# others build their one solution to the end and cannot take a time limit
+TIME_LIMITED_OPTIMISERS = {"bco", "ga", "tabu", "bnb", "mip"}
+
+
+def optimiser_class(name: str) -> Type[Optimiser[ACSolution]]:
+    """
+    Imports the optimiser registered under a name
+
+    :param name: The name of the optimiser, a key of OPTIMISERS
+    :return: The optimiser class
+    """
+    module, class_name = OPTIMISERS[name]
+    return getattr(importlib.import_module(module), class_name)
+
+
+def parse_param(param: str) -> Tuple[str, Any]:
+    """
+    Parses an optimiser parameter of the form name=value. The value is read as JSON
+    and kept as a string if it is not valid JSON.
+
+    :param param: The parameter
+    :return: The name and value of the parameter
+    """
+    name, separator, value = param.partition("=")
+    if not separator or not name:
+        raise argparse.ArgumentTypeError(f"expected name=value, got {param!r}")
+    try:
+        return name, json.loads(value)
+    except json.JSONDecodeError:
+        return name, value
+
+
+def load_problem(path: str, num_runways: Optional[int]) -> ACS:
+    """
+    Builds the problem of an instance file. Binary instance files are mapped, csv
+    files in the IKLI format are read with num_runways runways and any other file is
+    read as an input file.
+
+    :param path: Path of the instance file
+    :param num_runways: Number of runways for csv files
+    :return: The problem
+    """
+    # imported here so that pandas is only loaded for csv instances
+    from utils.input import load_acs_from_csv, read_input
+    from utils.instance_file import BINARY_EXTENSION, load_acs
+
+    if path.endswith(".csv"):
+        if num_runways is None:
+            raise ValueError("--runways is needed for csv instances")
+        return load_acs_from_csv(path, num_runways)
+    if path.endswith(BINARY_EXTENSION):
+        return load_acs(path)
+    return ACS(*read_input(path))
+
+
+def run_optimiser(
+    optimiser: Optimiser[ACSolution], time_limit: Optional[float]
+) -> ACSolution:
+    """
+    Runs an optimiser within a time limit. The optimiser stops at the deadline with
+    the best solution found so far, an RHCSolver schedules the windows left after it
+    with FCFS.
+
+    :param optimiser: The optimiser
+    :param time_limit: The time limit in seconds, None for no limit
+    :return: The best solution found
+    """
+    optimiser.set_time_limit(time_limit)
+    return optimiser.optimise()
+
+
+def solve(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Solves an instance as given by the command line arguments
+
+    :param args: The parsed arguments
+    :return: The result, with the cost, the timings in seconds and the paths of the
+        schedule and the trace
+    """
+    if (
+        args.time_limit is not None
+        and args.time_window is None
+        and args.optimiser not in TIME_LIMITED_OPTIMISERS
+    ):
+        raise ValueError(
+            f"{args.optimiser} runs to the end and cannot take --time-limit, it is "
+            f"taken by {', '.join(sorted(TIME_LIMITED_OPTIMISERS))} and with "
+            f"--time-window"
+        )
+
+    timings = {}
+    start = time.perf_counter()
+    problem = load_problem(args.instance, args.runways)
+    timings["load"] = time.perf_counter() - start
+
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    cls = optimiser_class(args.optimiser)
+    params = dict(args.param)
+
+    start = time.perf_counter()
+    if args.time_window is not None:
+        # imported here so that the solver is only loaded for receding horizons
+        from problem.rhc_solver import RHCSolver
+
+        optimiser = RHCSolver(problem, args.time_window, args.num_windows, cls, params)
+    else:
+        optimiser = cls(problem, **params)
+    if args.trace is not None:
+        # imported here so that the trace is only loaded when recorded
+        from optimisation.trace import ConvergenceTrace
+
+        trace = ConvergenceTrace().attach(optimiser)
+    solution = run_optimiser(optimiser, args.time_limit)
+    timings["solve"] = time.perf_counter() - start
+
+    if args.schedule is not None:
+        start = time.perf_counter()
+        solution.export(args.schedule, problem)
+        timings["export"] = time.perf_counter() - start
+    if args.trace is not None:
+        trace.save(args.trace)
+
+    return {
+        "instance": args.instance,
+        "optimiser": args.optimiser,
+        "params": params,
+        "seed": args.seed,
+        "num_aircraft": len(problem.all_ac),
+        "num_runways": problem.no_of_runways,
+        "cost": solution.fitness,
+        "time_limit_applied": args.time_limit is not None,
+        "timings": timings,
+        "schedule": args.schedule,
+        "trace": args.trace,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command line arguments
+
+    :param argv: The arguments, those of the process if None
+    :return: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Solves an aircraft scheduling instance and prints the result "
+        "as JSON.",
+    )
+    parser.add_argument(
+        "instance", help="binary instance (.acsb), IKLI csv or input file"
+    )
+    parser.add_argument("optimiser", choices=sorted(OPTIMISERS))
+    parser.add_argument(
+        "-p",
+        "--param",
+        action="append",
+        type=parse_param,
+        default=[],
+        metavar="NAME=VALUE",
+        help="optimiser parameter, the value is read as JSON",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="seconds, the optimiser stops with the best solution found by then",
+    )
+    parser.add_argument("--runways", type=int, default=None, help="for csv instances")
+    parser.add_argument(
+        "--time-window",
+        type=int,
+        default=None,
+        help="solve with receding horizon control, windows of this many seconds",
+    )
+    parser.add_argument("--num-windows", type=int, default=2)
+    parser.add_argument(
+        "--schedule", default=None, help="write the schedule to this csv or .npy file"
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        help="write the convergence trace of the optimiser to this .npy file",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line solver. The result is printed to stdout as one line of
+    JSON, and failures print an error object and return a non zero status.
+
+    :param argv: The arguments, those of the process if None
+    :return: The exit status
+    """
+    args = parse_args(argv)
+    start = time.perf_counter()
+    try:
+        result = solve(args)
+    except Exception as error:  # pylint: disable=broad-except
+        print(json.dumps({"error": f"{type(error).__name__}: {error}"}))
+        return 1
+    result["timings"]["total"] = time.perf_counter() - start
+    print(json.dumps(result))
+    return 0
@@ -1,5 +1,5 @@
 import random
-from typing import Generic, List, Tuple, TypeVar
+from typing import Generic, List, Optional, Tuple, TypeVar
 from enum import Enum
 from optimisation.optimiser import Optimiser
 from optimisation.problem import Problem, Solution
@@ -94,7 +94,7 @@ class BeeColonyOptimiser(Optimiser[T]):
     trail_limits : int
         The maximum number of trials
     best_solution : Bee[T]
-        The best solution found
+        The best solution found, the best first food source until the optimiser runs
     bees : List[Bee[T]]
         The list of bees
     """
@@ -106,6 +106,8 @@ class BeeColonyOptimiser(Optimiser[T]):
         max_iter: int,
         trial_limit: int,
         max_scouts: int = 1,
+        target_gap: Optional[float] = None,
+        seeds: Optional[List[T]] = None,
     ):
         """
         Constructor for Bee Colony Optimiser
@@ -115,20 +117,27 @@ class BeeColonyOptimiser(Optimiser[T]):
         :param max_iter: maximum number of iterations (stopping condition)
         :param trial_limit: maximum number of trials before abandoning food source
         :param max_scouts: maximum number of scouts
+        :param target_gap: gap to the lower bound of the problem at which to stop
+        :param seeds: solutions, e.g. from constructive heuristics, used as the first
+            food sources instead of random ones
         """
         super().__init__(problem)
         self.number_of_bees = number_of_bees
         self.max_iter = max_iter
         self.max_scouts = max_scouts
         self.trail_limits = trial_limit
+        self.target_gap = target_gap
         self.best_solution = Bee(
             self.problem.generate_empty_solution(), BeeType.EMPLOYED
         )
         self.employed_bees: List[Bee] = []
         self.unemployed_bees: List[Bee] = []
+        seeds = list(seeds or [])
 
         for i in range(self.number_of_bees):
-            if i < self.number_of_bees / 2:
+            if i < self.number_of_bees / 2 and seeds:
+                self.employed_bees.append(Bee(seeds.pop(0), BeeType.EMPLOYED, i))
+            elif i < self.number_of_bees / 2:
                 sol = problem.generate_solution()
                 assert isinstance(sol, Solution)
                 self.employed_bees.append(
@@ -138,6 +147,9 @@ class BeeColonyOptimiser(Optimiser[T]):
                 self.unemployed_bees.append(
                     Bee(Solution(None, float("inf")), BeeType.UNEMPLOYED, i)
                 )
+        if self.employed_bees:
+            best = min(self.employed_bees, key=lambda x: x.solution.fitness)
+            self.best_solution = Bee(best.solution, BeeType.EMPLOYED)
 
     def employed_exploit(self) -> None:
         """
@@ -222,6 +234,18 @@ class BeeColonyOptimiser(Optimiser[T]):
         """
         return [(bee, 1 / (1 + bee.solution.fitness)) for bee in self.employed_bees]
 
+    def update_best_solution(self) -> None:
+        """
+        Function to keep the best solution found so far. The best bee is copied, as
+        the onlookers later overwrite the solutions of the bees
+
+        :return: None
+        """
+        current_best = min(self.employed_bees, key=lambda x: x.solution.fitness)
+        if current_best.solution.fitness < self.best_solution.solution.fitness:
+            self.best_solution = Bee(current_best.solution, BeeType.EMPLOYED)
+            self.report_improvement(current_best.solution.fitness)
+
     def optimise(self) -> T:
         """
         Function to optimise the problem
@@ -234,23 +258,25 @@ class BeeColonyOptimiser(Optimiser[T]):
     def optimise_iter(self, num_iter: int):
         """
         Run the optimiser for a given number of iterations. Runs the employed exploit,
-        onlooker exploit and explore phases for each iteration
+        onlooker exploit and explore phases for each iteration, timed as the employed,
+        onlooker and scout phases. Stops early once the best solution is within the
+        target gap or the deadline has passed. The first call reports the best first
+        food source, the starting point of the run as for the other optimisers
 
         :param num_iter: Number of iterations
         """
-        self.best_solution = min(
-            min(self.employed_bees, key=lambda x: x.solution.fitness),
-            self.best_solution,
-            key=lambda x: x.solution.fitness,
-        )
+        if self.improvements == 0:
+            self.report_improvement(self.best_solution.solution.fitness)
+        self.update_best_solution()
         for _ in range(num_iter):
-            self.employed_exploit()
+            if self.out_of_time():
+                break
+            self.run_phase("employed", self.employed_exploit)
+            self.update_best_solution()
             probabilities = self.get_probablility_array()
-            self.onlooker_exploit(probabilities)
-            self.explore()
-            current_best = min(self.employed_bees, key=lambda x: x.solution.fitness)
-            self.best_solution = min(
-                current_best,
-                self.best_solution,
-                key=lambda x: x.solution.fitness,
-            )
+            self.run_phase("onlooker", self.onlooker_exploit, probabilities)
+            self.run_phase("scout", self.explore)
+            self.update_best_solution()
+            self.end_iteration()
+            if self.reached_target(self.best_solution.solution.fitness):
+                break
@@ -0,0 +1,218 @@
+import time
+from typing import Dict, List, Optional, Tuple
+from optimisation.fcfs import FCFS
+from optimisation.local_search import LocalSearchPolisher
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+
+class BranchAndBoundOptimiser(Optimiser[ACSolution]):
+    """
+    Class to solve small ACS problems exactly with a depth first branch and bound.
+    The airplanes are assigned to runways in the order of all_ac, trying the cheapest
+    runway first. A branch is pruned when its cost plus a lower bound on the cost of
+    the remaining airplanes is no better than the incumbent. The bound lands every
+    remaining airplane on its best runway as if nothing else landed after the current
+    airplanes, at the gap of ACS.min_landing_gaps after the last one. This gap is the
+    separation plus one when the separation matrix satisfies the triangle inequality
+    and shorter otherwise, as other airplanes may land in between, so the bound is
+    valid for any matrix but weaker for non metric ones. An empty runway is only
+    tried if no identical runway before it is empty. Partial assignments that leave
+    the runways in a state already reached at no higher cost are pruned as well. The
+    FCFS solution is the first incumbent and is improved on until the search ends or
+    the node budget or time limit runs out. The incumbent is polished with a
+    LocalSearchPolisher before the search starts.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    max_nodes : Optional[int]
+        The maximum number of nodes explored
+    max_memo : int
+        The maximum number of runway states remembered for pruning
+    time_limit : Optional[float]
+        The time limit of the search in seconds
+    nodes : int
+        The number of nodes explored in the last run
+    start_time : float
+        The perf_counter time the last run started at
+    optimal : bool
+        Whether the last run completed the search, proving the solution optimal
+    """
+
+    def __init__(
+        self,
+        problem: ACS,
+        max_nodes: Optional[int] = 1000000,
+        time_limit: Optional[float] = None,
+        max_memo: int = 1000000,
+    ):
+        super().__init__(problem)
+        self.problem = problem
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.max_memo = max_memo
+        self.memo: Dict[Tuple, float] = {}
+        self.nodes = 0
+        self.start_time = 0.0
+        self.optimal = False
+
+        self.eta = [ac.eta_etd for ac in problem.all_ac]
+        self.types = [ac.ac_type - 1 for ac in problem.all_ac]
+        self.delay_costs = [ac.delay_cost for ac in problem.all_ac]
+        self.separation = problem.separation_matrix
+        self.gaps = problem.min_landing_gaps()
+        self.runways = range(problem.no_of_runways)
+
+    def remaining_bound(
+        self, start: int, last_time: List[float], last_type: List[int], limit: float
+    ) -> float:
+        """
+        Returns a lower bound on the cost of the airplanes from start onwards, from
+        the smallest gap after the last landing of every runway. The sum stops early
+        once it reaches limit.
+
+        :param start: The index of the first unassigned airplane
+        :param last_time: The last landing time on every runway
+        :param last_type: The type of the last airplane on every runway, -1 if empty
+        :param limit: The bound above which the branch is pruned anyway
+        :return: The lower bound
+        """
+        bound = 0.0
+        for i in range(start, len(self.eta)):
+            best = float("inf")
+            for r in self.runways:
+                if last_type[r] < 0:
+                    best = 0.0
+                    break
+                ready = last_time[r] + self.gaps[last_type[r]][self.types[i]]
+                best = min(best, max(0, ready - self.eta[i][r]))
+            bound += best * self.delay_costs[i]
+            if bound >= limit:
+                break
+        return bound
+
+    def seen_cheaper(
+        self, i: int, cost: float, last_time: List[float], last_type: List[int]
+    ) -> bool:
+        """
+        Checks whether the runways were left in the same state, up to the labels of
+        identical runways, at no higher cost before, and remembers the state if not
+
+        :param i: The index of the next airplane to be assigned
+        :param cost: The cost of the airplanes assigned so far
+        :param last_time: The last landing time on every runway
+        :param last_type: The type of the last airplane on every runway, -1 if empty
+        :return: Whether the branch can be pruned
+        """
+        groups = self.problem.runway_groups
+        key = (i,) + tuple(
+            sorted((groups[r], last_time[r], last_type[r]) for r in self.runways)
+        )
+        seen = self.memo.get(key)
+        if seen is not None and seen <= cost:
+            return True
+        if seen is not None or len(self.memo) < self.max_memo:
+            self.memo[key] = cost
+        return False
+
+    def out_of_budget(self) -> bool:
+        """
+        Checks the node budget and, every thousand nodes, the time limit and the
+        deadline
+
+        :return: Whether the search has to stop
+        """
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            return True
+        if self.nodes % 1000 != 0:
+            return False
+        if self.time_limit is not None:
+            if time.perf_counter() - self.start_time >= self.time_limit:
+                return True
+        return self.out_of_time()
+
+    def search(
+        self,
+        i: int,
+        cost: float,
+        last_time: List[float],
+        last_type: List[int],
+        value: List[int],
+    ) -> bool:
+        """
+        Explores the assignments of the airplanes from i onwards
+
+        :param i: The index of the airplane to be assigned
+        :param cost: The cost of the airplanes assigned so far
+        :param last_time: The last landing time on every runway
+        :param last_type: The type of the last airplane on every runway, -1 if empty
+        :param value: The runways assigned so far
+        :return: Whether the search ran out of budget
+        """
+        self.nodes += 1
+        if self.problem.instrumented:
+            self.problem.delta_evaluations += 1
+        if i == len(self.eta):
+            if cost < self.best_solution.fitness:
+                self.best_solution = ACSolution(list(value), cost, self.problem.all_ac)
+                self.report_improvement(cost)
+            return False
+        if self.out_of_budget():
+            return True
+
+        groups = self.problem.runway_groups
+        children = []
+        for r in self.runways:
+            if last_type[r] < 0:
+                if any(last_type[q] < 0 and groups[q] == groups[r] for q in range(r)):
+                    continue
+                landing = self.eta[i][r]
+            else:
+                separation = self.separation[last_type[r]][self.types[i]]
+                landing = max(self.eta[i][r], last_time[r] + separation + 1)
+            children.append(
+                (max(0, (landing - self.eta[i][r]) * self.delay_costs[i]), landing, r)
+            )
+        children.sort()
+
+        for child_cost, landing, r in children:
+            previous_time, previous_type = last_time[r], last_type[r]
+            last_time[r], last_type[r] = landing, self.types[i]
+            limit = self.best_solution.fitness - cost - child_cost
+            if self.remaining_bound(
+                i + 1, last_time, last_type, limit
+            ) < limit and not self.seen_cheaper(
+                i + 1, cost + child_cost, last_time, last_type
+            ):
+                value.append(r + 1)
+                stopped = self.search(
+                    i + 1, cost + child_cost, last_time, last_type, value
+                )
+                value.pop()
+            else:
+                stopped = False
+            last_time[r], last_type[r] = previous_time, previous_type
+            if stopped:
+                return True
+
+        return False
+
+    def optimise(self) -> ACSolution:
+        self.best_solution = LocalSearchPolisher(FCFS(self.problem)).optimise()
+        self.report_improvement(self.best_solution.fitness)
+        self.nodes = 0
+        self.memo = {}
+        self.start_time = time.perf_counter()
+
+        runways = self.problem.no_of_runways
+        stopped = self.search(0, 0.0, [0.0] * runways, [-1] * runways, [])
+        self.optimal = not stopped
+
+        value = self.problem.canonical(self.best_solution.value)
+        self.best_solution = ACSolution(
+            value, self.problem.evaluate(value), self.problem.all_ac
+        )
+        return self.best_solution
@@ -0,0 +1,235 @@
+from abc import abstractmethod
+from typing import List
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+
+class GreedyConstructor(Optimiser[ACSolution]):
+    """
+    Base class of the constructive heuristics. Like FCFS, the airplanes are assigned
+    to runways one at a time in the order of all_ac, and each runway is described by
+    the landing time and type of its last airplane. Sub classes only choose the
+    runway of the next airplane, so a solution is built in O(N·R) time for a fixed
+    amount of work per runway.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    """
+
+    def __init__(self, problem: ACS):
+        super().__init__(problem)
+        self.problem = problem
+
+    def landing_time(
+        self, i: int, runway: int, last_times: List[int], last_types: List[int]
+    ) -> int:
+        """
+        Returns the landing time of an airplane if it is the next one on a runway
+
+        :param i: The index of the airplane in all_ac
+        :param runway: The runway, starting at 0
+        :param last_times: The landing time of the last airplane of each runway
+        :param last_types: The type of the last airplane of each runway, 0 if empty
+        :return: The landing time
+        """
+        ac = self.problem.all_ac[i]
+        if last_types[runway] == 0:
+            return ac.eta_etd[runway]
+        separation = self.problem.separation_matrix[last_types[runway] - 1][
+            ac.ac_type - 1
+        ]
+        return max(ac.eta_etd[runway], last_times[runway] + separation + 1)
+
+    def delay_cost(self, i: int, runway: int, landing_time: int) -> float:
+        """
+        Returns the delay cost of an airplane landing on a runway at a given time
+
+        :param i: The index of the airplane in all_ac
+        :param runway: The runway, starting at 0
+        :param landing_time: The landing time
+        :return: The delay cost
+        """
+        ac = self.problem.all_ac[i]
+        return max(0, (landing_time - ac.eta_etd[runway]) * ac.delay_cost)
+
+    @abstractmethod
+    def choose_runway(
+        self, i: int, last_times: List[int], last_types: List[int]
+    ) -> int:
+        """
+        Chooses the runway of the next airplane
+
+        :param i: The index of the airplane in all_ac
+        :param last_times: The landing time of the last airplane of each runway
+        :param last_types: The type of the last airplane of each runway, 0 if empty
+        :return: The runway, starting at 0
+        """
+
+    def optimise(self) -> ACSolution:
+        last_times = [0] * self.problem.no_of_runways
+        last_types = [0] * self.problem.no_of_runways
+        value = []
+        for i, ac in enumerate(self.problem.all_ac):
+            runway = self.choose_runway(i, last_times, last_types)
+            last_times[runway] = self.landing_time(i, runway, last_times, last_types)
+            last_types[runway] = ac.ac_type
+            value.append(runway + 1)
+
+        value = self.problem.canonical(value)
+        self.best_solution = ACSolution(
+            value, self.problem.evaluate(value), self.problem.all_ac
+        )
+        self.report_improvement(self.best_solution.fitness)
+        return self.best_solution
+
+
+class CostWeightedGreedy(GreedyConstructor):
+    """
+    Class to assign every airplane to the runway with the lowest delay cost. Runways
+    with the same cost are told apart by how long they are blocked: the landing time
+    plus the largest separation to any follower, weighted by the average delay cost
+    of the airplanes. Unlike FCFS, a free runway is kept for later airplanes when
+    another runway lands the airplane just as cheaply.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    blocking_weight : float
+        The weight of the blocked time of a runway against the delay cost
+    """
+
+    def __init__(self, problem: ACS, blocking_weight: float = 0.05):
+        super().__init__(problem)
+        self.blocking_weight = blocking_weight
+        costs = [ac.delay_cost for ac in problem.all_ac]
+        self.mean_cost = sum(costs) / len(costs) if costs else 0.0
+        self.max_separation = [max(row) for row in problem.separation_matrix]
+
+    def choose_runway(
+        self, i: int, last_times: List[int], last_types: List[int]
+    ) -> int:
+        ac = self.problem.all_ac[i]
+        best_runway, best_score = 0, float("inf")
+        for runway in range(self.problem.no_of_runways):
+            landing_time = self.landing_time(i, runway, last_times, last_types)
+            # time the runway is blocked for longer, counted from the eta_etd
+            released = ac.eta_etd[runway]
+            if last_types[runway] != 0:
+                released = max(
+                    released,
+                    last_times[runway] + self.max_separation[last_types[runway] - 1],
+                )
+            blocked = landing_time + self.max_separation[ac.ac_type - 1] - released
+            score = (
+                self.delay_cost(i, runway, landing_time)
+                + self.blocking_weight * self.mean_cost * blocked
+            )
+            if score < best_score:
+                best_runway, best_score = runway, score
+        return best_runway
+
+
+class WakeBatchingGreedy(GreedyConstructor):
+    """
+    Class to batch airplanes of the same wake category on a runway. Of the runways
+    that land an airplane at most tolerance seconds after its earliest landing time,
+    a runway whose last airplane is of the same type is preferred, then the earliest
+    landing time. Heavy and light airplanes then tend to land on different runways
+    and avoid the largest separations.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    tolerance : int
+        The delay in seconds accepted to land behind a lighter separation
+    """
+
+    def __init__(self, problem: ACS, tolerance: int = 10):
+        super().__init__(problem)
+        self.tolerance = tolerance
+
+    def choose_runway(
+        self, i: int, last_times: List[int], last_types: List[int]
+    ) -> int:
+        ac_type = self.problem.all_ac[i].ac_type
+        landing_times = [
+            self.landing_time(i, runway, last_times, last_types)
+            for runway in range(self.problem.no_of_runways)
+        ]
+        earliest = min(landing_times)
+
+        return min(
+            (
+                runway
+                for runway, landing_time in enumerate(landing_times)
+                if landing_time <= earliest + self.tolerance
+            ),
+            key=lambda runway: (last_types[runway] != ac_type, landing_times[runway]),
+        )
+
+
+class LookAheadGreedy(GreedyConstructor):
+    """
+    Class to choose the runway of every airplane by looking a few airplanes ahead.
+    For every runway, the airplane is landed on it and the next depth airplanes are
+    landed greedily on their cheapest runway. The runway with the lowest total cost
+    is chosen, so the work per airplane grows with depth and the square of the number
+    of runways.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    depth : int
+        The number of following airplanes landed in the look-ahead
+    """
+
+    def __init__(self, problem: ACS, depth: int = 2):
+        super().__init__(problem)
+        self.depth = depth
+
+    def greedy_cost(
+        self, start: int, last_times: List[int], last_types: List[int]
+    ) -> float:
+        """
+        Returns the cost of landing the airplanes from start onwards, at most depth of
+        them, on their cheapest runway
+
+        :param start: The index in all_ac of the first airplane
+        :param last_times: The landing time of the last airplane of each runway
+        :param last_types: The type of the last airplane of each runway, 0 if empty
+        :return: The total delay cost
+        """
+        last_times, last_types = list(last_times), list(last_types)
+        total = 0.0
+        for i in range(start, min(start + self.depth, len(self.problem.all_ac))):
+            runway = min(
+                range(self.problem.no_of_runways),
+                key=lambda r: self.landing_time(i, r, last_times, last_types),
+            )
+            last_times[runway] = self.landing_time(i, runway, last_times, last_types)
+            last_types[runway] = self.problem.all_ac[i].ac_type
+            total += self.delay_cost(i, runway, last_times[runway])
+        return total
+
+    def choose_runway(
+        self, i: int, last_times: List[int], last_types: List[int]
+    ) -> int:
+        best_runway, best_cost = 0, float("inf")
+        for runway in range(self.problem.no_of_runways):
+            landing_time = self.landing_time(i, runway, last_times, last_types)
+            cost = self.delay_cost(i, runway, landing_time)
+            if cost >= best_cost:
+                continue
+            times, types = list(last_times), list(last_types)
+            times[runway] = landing_time
+            types[runway] = self.problem.all_ac[i].ac_type
+            cost += self.greedy_cost(i + 1, times, types)
+            if cost < best_cost:
+                best_runway, best_cost = runway, cost
+        return best_runway
@@ -0,0 +1,167 @@
+from typing import List, Optional
+import numpy as np
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+
+class CPSDynamicProgrammingOptimiser(Optimiser[ACSolution]):
+    """
+    Class to solve the ACS problem by dynamic programming over the airplanes in the
+    order of all_ac, which is the FCFS order every runway of ACS lands in.
+
+    A state holds, for every runway and airplane type, the earliest time the next
+    airplane of that type may land on the runway. States with the same times are
+    merged and states that are no earlier anywhere and no cheaper than another state
+    are pruned, which keeps the result exact. Interchangeable runways are sorted
+    within their group so that relabelled states merge as well. When more than
+    max_states states remain, only the cheapest are kept and the result is no
+    longer guaranteed to be optimal.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    max_states : Optional[int]
+        The number of states kept per airplane, None to keep all of them
+    dominance_limit : int
+        The largest number of states that is checked for dominance
+    truncated : bool
+        Whether states were dropped because of max_states in the last run
+    """
+
+    def __init__(
+        self,
+        problem: ACS,
+        max_states: Optional[int] = 1000,
+        dominance_limit: int = 1000,
+    ):
+        super().__init__(problem)
+        self.problem = problem
+        self.max_states = max_states
+        self.dominance_limit = dominance_limit
+        self.truncated = False
+
+        self.separation = np.array(problem.separation_matrix, dtype=float) + 1
+        self.groups = [
+            np.array(
+                [r for r, g in enumerate(problem.runway_groups) if g == group]
+            )
+            for group in sorted(set(problem.runway_groups))
+        ]
+
+    def dominated(self, ready: np.ndarray) -> np.ndarray:
+        """
+        Finds the states dominated by a cheaper state. The states must be sorted by
+        cost and free of duplicates.
+
+        :param ready: The earliest landing times of the states, shape (S, R * T)
+        :return: Mask of the dominated states
+        """
+        dominated = np.zeros(len(ready), dtype=bool)
+        chunk = max(1, 2**22 // max(1, len(ready) * ready.shape[1]))
+        for start in range(1, len(ready), chunk):
+            end = min(start + chunk, len(ready))
+            earlier = ready[:end]
+            # covers[a, b]: state a is no later than state b + start everywhere
+            covers = (earlier[:, None, :] <= ready[None, start:end, :]).all(axis=2)
+            covers &= np.arange(end)[:, None] < np.arange(start, end)[None, :]
+            dominated[start:end] = covers.any(axis=0)
+        return dominated
+
+    def canonical_order(self, ready: np.ndarray) -> np.ndarray:
+        """
+        Returns the permutation that sorts the interchangeable runways of every state
+
+        :param ready: The earliest landing times of the states, shape (S, R, T)
+        :return: For every state, the runway each sorted slot is taken from
+        """
+        count, runways, types = ready.shape
+        permutation = np.tile(np.arange(runways), (count, 1))
+        keys = ready @ (1.0 + np.arange(types) / (types + 1.0))
+        for group in self.groups:
+            if len(group) > 1:
+                order = np.argsort(keys[:, group], axis=1, kind="stable")
+                permutation[:, group] = group[order]
+        return permutation
+
+    def optimise(self) -> ACSolution:
+        all_ac = self.problem.all_ac
+        runways = self.problem.no_of_runways
+        types = self.separation.shape[0]
+        self.truncated = False
+
+        ready = np.full((1, runways, types), -np.inf)
+        cost = np.zeros(1)
+        parents: List[np.ndarray] = []
+        choices: List[np.ndarray] = []
+        permutations: List[np.ndarray] = []
+
+        for ac in all_ac:
+            count = len(ready)
+            eta = np.array(ac.eta_etd, dtype=float)
+            landing = np.maximum(eta[None, :], ready[:, :, ac.ac_type - 1])
+
+            # children of every state for every runway
+            delay = landing - eta[None, :]
+            child_cost = (cost[:, None] + ac.delay_cost * delay).ravel()
+            child_ready = np.repeat(ready[:, None], runways, axis=1)
+            diagonal = np.arange(runways)
+            child_ready[:, diagonal, diagonal, :] = (
+                landing[:, :, None] + self.separation[ac.ac_type - 1][None, None, :]
+            )
+            child_ready = child_ready.reshape(count * runways, runways, types)
+            parent = np.repeat(np.arange(count), runways)
+            choice = np.tile(np.arange(runways), count)
+
+            # an empty runway is only used if no earlier identical runway is empty
+            empty = np.isneginf(ready[:, :, 0])
+            allowed = np.ones((count, runways), dtype=bool)
+            for group in self.groups:
+                for k in range(1, len(group)):
+                    earlier_empty = empty[:, group[:k]].any(axis=1)
+                    allowed[:, group[k]] &= ~(empty[:, group[k]] & earlier_empty)
+            allowed = allowed.ravel()
+            child_cost, child_ready = child_cost[allowed], child_ready[allowed]
+            parent, choice = parent[allowed], choice[allowed]
+
+            permutation = self.canonical_order(child_ready)
+            child_ready = np.take_along_axis(
+                child_ready, permutation[:, :, None], axis=1
+            )
+
+            # merging identical states keeping the cheapest
+            flat = child_ready.reshape(len(child_ready), -1)
+            order = np.lexsort((child_cost,) + tuple(flat.T[::-1]))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = (flat[order[1:]] != flat[order[:-1]]).any(axis=1)
+            keep = order[first]
+            keep = keep[np.argsort(child_cost[keep], kind="stable")]
+
+            if len(keep) <= self.dominance_limit:
+                keep = keep[~self.dominated(child_ready[keep].reshape(len(keep), -1))]
+            if self.max_states is not None and len(keep) > self.max_states:
+                keep = keep[: self.max_states]
+                self.truncated = True
+
+            ready, cost = child_ready[keep], child_cost[keep]
+            parents.append(parent[keep])
+            choices.append(choice[keep])
+            permutations.append(permutation[keep])
+
+        # walking back from the cheapest state, labelling the runway slots of the
+        # final state with their own index
+        value = [0] * len(all_ac)
+        state = int(np.argmin(cost)) if len(all_ac) > 0 else 0
+        labels = np.arange(runways)
+        for i in range(len(all_ac) - 1, -1, -1):
+            parent_labels = np.empty(runways, dtype=int)
+            parent_labels[permutations[i][state]] = labels
+            value[i] = int(parent_labels[choices[i][state]]) + 1
+            labels = parent_labels
+            state = int(parents[i][state])
+
+        value = self.problem.canonical(value)
+        self.best_solution = ACSolution(value, self.problem.evaluate(value), all_ac)
+        self.report_improvement(self.best_solution.fitness)
+        return self.best_solution
@@ -1,7 +1,6 @@
 from problem.acs import ACS
 from problem.acs_solution import ACSolution
 from optimisation.optimiser import Optimiser
-from optimisation.problem import Solution
 
 
 class FCFS(Optimiser[ACSolution]):
@@ -57,5 +56,8 @@ class FCFS(Optimiser[ACSolution]):
             runway_delay[min_runway - 1] = int(min_delay)
             solution.append(min_runway)
 
-        fcfs_solution = Solution(solution, self.problem.evaluate(solution))
+        fcfs_solution = ACSolution(
+            solution, self.problem.evaluate(solution), self.problem.all_ac
+        )
+        self.report_improvement(fcfs_solution.fitness)
         return fcfs_solution
@@ -1,5 +1,5 @@
 import random
-from typing import List, Tuple, TypeVar
+from typing import List, Optional, Tuple, TypeVar
 from optimisation.optimiser import Optimiser
 from optimisation.problem import Problem
 from problem.acs_solution import ACSolution
@@ -10,18 +10,28 @@ class GeneticOptimiser(Optimiser[T]):
     """
     Generic class to implement Genetic Algorithm for optimisation
     """
-    def __init__(self, problem: Problem[T], population_size: int, generations: int):
+    def __init__(
+        self,
+        problem: Problem[T],
+        population_size: int,
+        generations: int,
+        target_gap: Optional[float] = None,
+        seeds: Optional[List[T]] = None,
+    ):
         super().__init__(problem)
         self.problem = problem
         self.population_size = population_size
         self.generations = generations
+        self.target_gap = target_gap
+        self.seeds = list(seeds or [])
 
     def generate_population(self) -> List[T]:
         """
-        Generates a population of solutions for the problem using random values
+        Generates a population of solutions for the problem, starting with the seed
+        solutions and filling up the rest with random values
         """
-        population = []
-        for _ in range(self.population_size):
+        population = self.seeds[: self.population_size]
+        for _ in range(self.population_size - len(population)):
             solution = self.problem.generate_solution()
             population.append(solution)
         return population
@@ -68,23 +78,33 @@ class GeneticOptimiser(Optimiser[T]):
         """
         new_population = []
         for _ in range(self.population_size//2):
-            parent1 = self.select(population)
-            parent2 = self.select(population)
-            (child1, child2) = self.crossover(parent1, parent2)
-            child1 = self.mutate(child1)
-            child2 = self.mutate(child2)
+            parent1 = self.run_phase("selection", self.select, population)
+            parent2 = self.run_phase("selection", self.select, population)
+            (child1, child2) = self.run_phase("crossover", self.crossover, parent1, parent2)
+            child1 = self.run_phase("mutation", self.mutate, child1)
+            child2 = self.run_phase("mutation", self.mutate, child2)
             new_population.extend((child1, child2))
         return new_population
 
     def optimise(self) -> T:
         """
         Performs genetic optimisation on the problem and returns the best
-        solution found
+        solution found. Stops early once the best solution is within the target gap
+        or the deadline has passed
         """
-        population = self.generate_population()
-        best_solution = self.problem.generate_empty_solution()
+        population = self.run_phase("initial", self.generate_population)
+        best_solution = min(population, key=lambda x: x.fitness)
+        self.report_improvement(best_solution.fitness)
         for _ in range(self.generations):
+            if self.out_of_time():
+                break
             population = self.generate_new_population(population)
-            best_solution = min(population, key=lambda x: x.fitness)
+            generation_best = min(population, key=lambda x: x.fitness)
+            if generation_best.fitness < best_solution.fitness:
+                best_solution = generation_best
+                self.report_improvement(best_solution.fitness)
+            self.end_iteration()
+            if self.reached_target(best_solution.fitness):
+                break
 
         return best_solution
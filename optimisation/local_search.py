@@ -0,0 +1,138 @@
+from typing import Callable, List
+from optimisation.optimiser import Optimiser
+from optimisation.problem import Solution
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+from problem.schedule_state import ScheduleState
+
+# smallest change of cost counted as an improvement
+IMPROVEMENT_TOLERANCE = 1e-9
+
+
+class LocalSearchPolisher(Optimiser[ACSolution]):
+    """
+    Class to polish the solution of another optimiser with a deterministic variable
+    neighbourhood descent. The neighbourhoods are, in order, moving an airplane to
+    another runway, swapping the runways of adjacent airplanes and swapping the
+    runways of airplanes at most swap_window apart. The first improving move is
+    applied and the descent restarts from the first neighbourhood, until no
+    neighbourhood improves the solution. Moves are evaluated incrementally with a
+    ScheduleState. The solution is polished on the original problem of an
+    RHCSolver, as the problem it optimises is a copy whose carried-over etas change.
+
+    Attributes
+    ----------
+    optimiser : Optimiser[ACSolution]
+        The optimiser whose solution is polished
+    problem : ACS
+        The problem to be solved, the original problem of an RHCSolver
+    swap_window : int
+        The largest distance in all_ac between two airplanes swapped
+    moves : int
+        The number of improving moves applied in the last run
+    """
+
+    def __init__(self, optimiser: Optimiser[ACSolution], swap_window: int = 5):
+        problem = getattr(optimiser, "original_problem", optimiser.problem)
+        super().__init__(problem)
+        self.optimiser = optimiser
+        self.problem: ACS = problem
+        self.swap_window = swap_window
+        self.moves = 0
+
+    def reassign_neighbourhood(self, state: ScheduleState) -> bool:
+        """
+        Applies the first move of an airplane to another runway that improves the cost
+
+        :param state: The current schedule
+        :return: Whether an improving move was found
+        """
+        for i in range(len(state.value)):
+            for runway in range(1, self.problem.no_of_runways + 1):
+                if runway == state.value[i]:
+                    continue
+                if state.reassign_delta(i, runway) < -IMPROVEMENT_TOLERANCE:
+                    state.reassign(i, runway)
+                    return True
+        return False
+
+    def swap_neighbourhood(
+        self, state: ScheduleState, min_distance: int, max_distance: int
+    ) -> bool:
+        """
+        Applies the first swap of the runways of two airplanes that improves the cost
+
+        :param state: The current schedule
+        :param min_distance: The smallest distance in all_ac between the airplanes
+        :param max_distance: The largest distance in all_ac between the airplanes
+        :return: Whether an improving move was found
+        """
+        n = len(state.value)
+        for i in range(n):
+            for j in range(i + min_distance, min(n, i + max_distance + 1)):
+                if state.value[i] == state.value[j]:
+                    continue
+                if state.swap_delta(i, j) < -IMPROVEMENT_TOLERANCE:
+                    state.swap(i, j)
+                    return True
+        return False
+
+    def aligned_value(self, solution: Solution) -> List[int]:
+        """
+        Returns the runways of a solution in the order of all_ac of the problem. The
+        aircraft sequence of a solution of an RHCSolver lists the airplanes of the
+        original problem in the order they were committed.
+
+        :param solution: The solution
+        :return: The runway of every airplane of all_ac
+        """
+        sequence = getattr(solution, "aircraft_sequence", None)
+        if sequence is None or sequence is self.problem.all_ac:
+            return list(solution.value)
+        runways = {id(ac): runway for ac, runway in zip(sequence, solution.value)}
+        if len(runways) != len(self.problem.all_ac):
+            raise ValueError(
+                f"The solution assigns {len(runways)} aircrafts, the problem has "
+                f"{len(self.problem.all_ac)}"
+            )
+        return [runways[id(ac)] for ac in self.problem.all_ac]
+
+    def polish(self, solution: Solution) -> ACSolution:
+        """
+        Runs the variable neighbourhood descent on a solution
+
+        :param solution: The solution to be polished
+        :return: The polished solution, with the landing time of every airplane
+        """
+        state = ScheduleState(self.problem, self.aligned_value(solution))
+        neighbourhoods: List[Callable[[ScheduleState], bool]] = [
+            self.reassign_neighbourhood,
+            lambda state: self.swap_neighbourhood(state, 1, 1),
+            lambda state: self.swap_neighbourhood(state, 2, self.swap_window),
+        ]
+
+        self.moves = 0
+        k = 0
+        while k < len(neighbourhoods):
+            if neighbourhoods[k](state):
+                self.moves += 1
+                k = 0
+            else:
+                k += 1
+
+        # relabelling interchangeable runways keeps the landing times
+        value = self.problem.canonical(state.value)
+        return ACSolution(
+            value,
+            self.problem.evaluate(value),
+            self.problem.all_ac,
+            list(state.landing_times),
+        )
+
+    def optimise(self) -> ACSolution:
+        solution = self.optimiser.optimise()
+        self.report_improvement(solution.fitness)
+        self.best_solution = self.polish(solution)
+        if self.best_solution.fitness < solution.fitness:
+            self.report_improvement(self.best_solution.fitness)
+        return self.best_solution
@@ -0,0 +1,220 @@
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import coo_array
+from optimisation.fcfs import FCFS
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+
+def landing_time_bounds(problem: ACS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns bounds on the landing time of every airplane that hold for any runway
+    assignment. The upper bound chains all airplanes on a single runway with the
+    largest separation and eta_etd.
+
+    :param problem: The problem
+    :return: The lower and upper bounds of the landing times
+    """
+    eta = np.array([ac.eta_etd for ac in problem.all_ac], dtype=float)
+    max_separation = max(max(row) for row in problem.separation_matrix) + 1
+
+    upper = eta.max(axis=1)
+    for i in range(1, len(upper)):
+        upper[i] = max(upper[i], upper[i - 1] + max_separation)
+
+    return eta.min(axis=1), upper
+
+
+def assignment_model(
+    problem: ACS,
+) -> Tuple[np.ndarray, List[LinearConstraint], np.ndarray, Bounds]:
+    """
+    Builds the multi runway model of Beasley et al. for the ACS problem. As ACS
+    lands the airplanes of a runway in the order of all_ac, the sequencing variables
+    of the original model are fixed and only the runway assignment is free.
+
+    The variables are y (airplane i on runway r), x (landing time of airplane i)
+    and z (airplanes i < j share a runway). Pairs that can never be separated on the
+    same runway are left out of the model.
+
+    Every pair sharing a runway is separated, not only consecutive landings, which is
+    exact when the separation matrix satisfies the triangle inequality. Otherwise the
+    pairs are separated by the shortest chain of gaps from ACS.min_landing_gaps, so
+    the model is a relaxation: its bound stays valid but its solution may be
+    suboptimal once evaluated.
+
+    :param problem: The problem
+    :return: The objective, constraints, integrality and bounds of the model
+    """
+    n = len(problem.all_ac)
+    r = problem.no_of_runways
+    eta = np.array([ac.eta_etd for ac in problem.all_ac], dtype=float)
+    cost = np.array([ac.delay_cost for ac in problem.all_ac], dtype=float)
+    types = np.array([ac.ac_type for ac in problem.all_ac]) - 1
+    separation = np.array(problem.min_landing_gaps(), dtype=float)
+    lower, upper = landing_time_bounds(problem)
+
+    # big M of every pair, the pair is only kept when the separation can bind
+    first, second = np.triu_indices(n, k=1)
+    pair_separation = separation[types[first], types[second]]
+    big_m = upper[first] + pair_separation - lower[second]
+    keep = big_m > 0
+    first, second = first[keep], second[keep]
+    pair_separation, big_m = pair_separation[keep], big_m[keep]
+    p = len(first)
+
+    # variable layout: y (n * r), x (n), z (p)
+    y_index = np.arange(n * r).reshape(n, r)
+    x_index = n * r + np.arange(n)
+    z_index = n * r + n + np.arange(p)
+    num_vars = n * r + n + p
+
+    objective = np.zeros(num_vars)
+    objective[y_index] = -cost[:, None] * eta
+    objective[x_index] = cost
+
+    rows, cols, vals, row_lower, row_upper = [], [], [], [], []
+    row = 0
+
+    def add_rows(count, columns, values, low, high):
+        nonlocal row
+        row_ids = row + np.arange(count)
+        for column, value in zip(columns, values):
+            rows.append(row_ids)
+            cols.append(column)
+            vals.append(np.broadcast_to(value, (count,)))
+        row_lower.append(np.broadcast_to(low, (count,)))
+        row_upper.append(np.broadcast_to(high, (count,)))
+        row += count
+
+    # every airplane lands on exactly one runway
+    add_rows(n, [y_index[:, k] for k in range(r)], [1.0] * r, 1.0, 1.0)
+    # the landing time is not earlier than the eta_etd of the runway
+    add_rows(
+        n,
+        [x_index] + [y_index[:, k] for k in range(r)],
+        [1.0] + [-eta[:, k] for k in range(r)],
+        0.0,
+        np.inf,
+    )
+    # z is 1 when both airplanes are on the same runway
+    for k in range(r):
+        add_rows(
+            p, [z_index, y_index[first, k], y_index[second, k]], [1.0, -1.0, -1.0],
+            -1.0, np.inf,
+        )
+    # separation between airplanes sharing a runway
+    add_rows(
+        p,
+        [x_index[second], x_index[first], z_index],
+        [1.0, -1.0, -(pair_separation + big_m)],
+        -big_m,
+        np.inf,
+    )
+
+    matrix = coo_array(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(row, num_vars),
+    ).tocsr()
+    constraints = [
+        LinearConstraint(matrix, np.concatenate(row_lower), np.concatenate(row_upper))
+    ]
+
+    integrality = np.ones(num_vars)
+    integrality[x_index] = 0
+
+    variable_lower = np.zeros(num_vars)
+    variable_upper = np.ones(num_vars)
+    variable_lower[x_index] = lower
+    variable_upper[x_index] = upper
+
+    return objective, constraints, integrality, Bounds(variable_lower, variable_upper)
+
+
+class MIPOptimiser(Optimiser[ACSolution]):
+    """
+    Class to solve the ACS problem exactly with a mixed integer program on the HiGHS
+    solver of scipy. The FCFS solution is used as the incumbent: the objective is
+    bounded by its cost and it is returned when the solver finds nothing better
+    within the time limit.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    time_limit : Optional[float]
+        The time limit of the solver in seconds, shortened to the time left before
+        the deadline
+    mip_gap : float
+        The relative gap at which the solver stops
+    warm_start : bool
+        Whether the FCFS solution is used as the incumbent
+    status : str
+        The status message of the last solve
+    exact : bool
+        Whether the model is exact, see assignment_model, or only a relaxation
+    lower_bound : float
+        The lower bound proven by the last solve
+    """
+
+    def __init__(
+        self,
+        problem: ACS,
+        time_limit: Optional[float] = None,
+        mip_gap: float = 1e-4,
+        warm_start: bool = True,
+    ):
+        super().__init__(problem)
+        self.problem = problem
+        self.time_limit = time_limit
+        self.mip_gap = mip_gap
+        self.warm_start = warm_start
+        self.status = ""
+        self.exact = problem.has_metric_separation()
+        self.lower_bound = 0.0
+
+    def optimise(self) -> ACSolution:
+        n = len(self.problem.all_ac)
+        r = self.problem.no_of_runways
+        objective, constraints, integrality, bounds = assignment_model(self.problem)
+
+        incumbent = None
+        if self.warm_start:
+            fcfs = FCFS(self.problem).optimise()
+            incumbent = ACSolution(fcfs.value, fcfs.fitness, self.problem.all_ac)
+            self.report_improvement(incumbent.fitness)
+            constraints.append(
+                LinearConstraint(objective, -np.inf, incumbent.fitness + 1e-6)
+            )
+
+        options = {"mip_rel_gap": self.mip_gap}
+        time_limit = self.time_limit
+        if self.deadline is not None:
+            remaining = max(0.0, self.deadline - time.perf_counter())
+            time_limit = remaining if time_limit is None else min(time_limit, remaining)
+        if time_limit is not None:
+            options["time_limit"] = time_limit
+        result = milp(
+            objective,
+            constraints=constraints,
+            integrality=integrality,
+            bounds=bounds,
+            options=options,
+        )
+        self.status = result.message
+        if not self.exact:
+            self.status += " (relaxed model, the separation matrix is not metric)"
+        self.lower_bound = getattr(result, "mip_dual_bound", None) or 0.0
+
+        self.best_solution = incumbent or self.problem.generate_empty_solution()
+        if result.x is not None:
+            value = (np.argmax(result.x[: n * r].reshape(n, r), axis=1) + 1).tolist()
+            fitness = self.problem.evaluate(value)
+            if fitness < self.best_solution.fitness:
+                self.best_solution = ACSolution(value, fitness, self.problem.all_ac)
+                self.report_improvement(fitness)
+
+        return self.best_solution
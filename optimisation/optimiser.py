@@ -1,9 +1,29 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
 from optimisation.problem import Problem, Solution
 
 T = TypeVar("T", bound="Solution")
 
+# Called with the optimiser and the number of iterations done
+IterationCallback = Callable[["Optimiser", int], None]
+# Called with the optimiser, the number of iterations done and the new best fitness
+ImprovementCallback = Callable[["Optimiser", int, float], None]
+
+
+def optimality_gap(cost: float, lower_bound: float) -> float:
+    """
+    Returns the relative gap between the cost of a solution and a lower bound
+
+    :param cost: The cost of the solution
+    :param lower_bound: The lower bound on the cost
+    :return: The gap as a fraction of the cost
+    """
+    if cost <= 0:
+        return 0.0
+    return max(0.0, (cost - lower_bound) / cost)
+
+
 class Optimiser(ABC, Generic[T]):
     """
     Optimiser class to represent an optimiser
@@ -14,6 +34,23 @@ class Optimiser(ABC, Generic[T]):
         The problem to be optimised
     best_solution : T
         The best solution found
+    target_gap : Optional[float]
+        The gap to the lower bound of the problem at which the optimiser may stop
+    target_fitness : Optional[float]
+        The fitness at or below which the optimiser may stop
+    deadline : Optional[float]
+        The perf_counter time at which the optimiser stops with the best solution
+        found so far, None for no time limit
+    iterations : int
+        The number of iterations done
+    improvements : int
+        The number of times the best solution improved
+    on_iteration : Optional[IterationCallback]
+        Called after every iteration
+    on_improvement : Optional[ImprovementCallback]
+        Called whenever the best solution improves
+    phase_times : Optional[Dict[str, float]]
+        The time in seconds spent in every phase, None while the timers are off
     """
 
     def __init__(self, problem: Problem[T]):
@@ -24,6 +61,112 @@ class Optimiser(ABC, Generic[T]):
         """
         self.problem = problem
         self.best_solution = None
+        self.target_gap: Optional[float] = None
+        self.target_fitness: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.lower_bound: Optional[float] = None
+        self.iterations = 0
+        self.improvements = 0
+        self.on_iteration: Optional[IterationCallback] = None
+        self.on_improvement: Optional[ImprovementCallback] = None
+        self.phase_times: Optional[Dict[str, float]] = None
+
+    def enable_phase_timers(self, enabled: bool = True) -> None:
+        """
+        Switches the phase timers on, starting from zero, or off
+
+        :param enabled: Whether the phases are timed
+        """
+        self.phase_times = {} if enabled else None
+
+    def run_phase(self, name: str, phase: Callable[..., Any], *args) -> Any:
+        """
+        Runs a phase of the optimiser, timing it if the phase timers are on
+
+        :param name: The name of the phase
+        :param phase: The function of the phase
+        :param args: The arguments of the phase
+        :return: The result of the phase
+        """
+        if self.phase_times is None:
+            return phase(*args)
+        start = time.perf_counter()
+        result = phase(*args)
+        self.phase_times[name] = (
+            self.phase_times.get(name, 0.0) + time.perf_counter() - start
+        )
+        return result
+
+    def evaluation_count(self) -> int:
+        """
+        Returns the number of evaluations of the problem so far, whole and
+        incremental, 0 if the problem is not instrumented
+
+        :return: The number of evaluations
+        """
+        return getattr(self.problem, "evaluations", 0) + getattr(
+            self.problem, "delta_evaluations", 0
+        )
+
+    def end_iteration(self) -> None:
+        """
+        Counts an iteration and calls on_iteration
+        """
+        self.iterations += 1
+        if self.on_iteration is not None:
+            self.on_iteration(self, self.iterations)
+
+    def report_improvement(self, fitness: float) -> None:
+        """
+        Counts an improvement of the best solution and calls on_improvement
+
+        :param fitness: The fitness of the new best solution
+        """
+        self.improvements += 1
+        if self.on_improvement is not None:
+            self.on_improvement(self, self.iterations, fitness)
+
+    def set_time_limit(self, time_limit: Optional[float]) -> None:
+        """
+        Sets the deadline of the optimiser time_limit seconds from now
+
+        :param time_limit: The time limit in seconds, None for no time limit
+        """
+        self.deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    def out_of_time(self) -> bool:
+        """
+        Checks whether the deadline has passed
+
+        :return: Whether the optimiser has to stop
+        """
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def within_target_gap(self, fitness: float) -> bool:
+        """
+        Checks whether a fitness is within the target gap of the lower bound of the
+        problem. The lower bound is only computed once a target gap is set.
+
+        :param fitness: The fitness of the best solution found
+        :return: Whether the optimiser may stop
+        """
+        if self.target_gap is None:
+            return False
+        if self.lower_bound is None:
+            self.lower_bound = self.problem.lower_bound()
+        return optimality_gap(fitness, self.lower_bound) <= self.target_gap
+
+    def reached_target(self, fitness: float) -> bool:
+        """
+        Checks the stop criteria of the optimiser: the target fitness and the
+        target gap
+
+        :param fitness: The fitness of the best solution found
+        :return: Whether the optimiser may stop
+        """
+        if self.target_fitness is not None and fitness <= self.target_fitness:
+            return True
+        return self.within_target_gap(fitness)
 
     @abstractmethod
     def optimise(self) -> T:
@@ -0,0 +1,318 @@
+import multiprocessing
+import time
+from multiprocessing.connection import Connection, wait
+from multiprocessing.synchronize import Event
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+from optimisation.fcfs import FCFS
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+PortfolioMember = Tuple[Type[Optimiser[ACSolution]], Dict[str, Any]]
+
+# seconds a member is given to stop after its current chunk before it is killed
+STOP_TIMEOUT = 0.5
+
+
+class ResultCollector:
+    """
+    Class to collect the best solutions reported by the members of a portfolio.
+    Every member sends its reports over its own pipe and the collector keeps the
+    best of them in the parent process. Nothing is shared between the members,
+    which run independently, and a member killed while reporting only loses that
+    report, as the pipe then ends.
+
+    Attributes
+    ----------
+    value : Optional[List[int]]
+        The value of the best solution reported, None until a member reports one
+    fitness : float
+        The fitness of the best solution reported, infinity until a member reports
+    member : int
+        The index of the member that reported the best solution, -1 if none
+    member_fitness : List[float]
+        The fitness of the best solution reported by each member
+    connections : Dict[int, Connection]
+        The receiving end of the pipe of every member that may still report
+    """
+
+    def __init__(self, num_members: int):
+        self.value: Optional[List[int]] = None
+        self.fitness = float("inf")
+        self.member = -1
+        self.member_fitness = [float("inf")] * num_members
+        self.connections: Dict[int, Connection] = {}
+
+    def add(self, member: int, connection: Connection) -> None:
+        """
+        Collects the reports of a member from now on
+
+        :param member: The index of the member
+        :param connection: The receiving end of the pipe of the member
+        """
+        self.connections[member] = connection
+
+    def offer(self, member: int, value: List[int], fitness: float) -> bool:
+        """
+        Records the best solution of a member and keeps it if it beats the best one
+
+        :param member: The index of the member
+        :param value: The value of the solution
+        :param fitness: The fitness of the solution
+        :return: Whether the solution became the best one
+        """
+        self.member_fitness[member] = min(self.member_fitness[member], fitness)
+        if fitness >= self.fitness:
+            return False
+        self.value = list(value)
+        self.fitness = fitness
+        self.member = member
+        return True
+
+    def collect(self) -> None:
+        """
+        Records every report received, without waiting, and closes the pipes that
+        ended, because their member finished or was killed
+        """
+        for member, connection in list(self.connections.items()):
+            try:
+                while connection.poll():
+                    value, fitness = connection.recv()
+                    self.offer(member, value, fitness)
+            except (EOFError, OSError):
+                connection.close()
+                del self.connections[member]
+
+    def best(self) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Returns a copy of the best solution reported
+
+        :return: The value, fitness and member of the solution, value None if no
+            member has reported a solution
+        """
+        if self.value is None:
+            return None, float("inf"), -1
+        return list(self.value), self.fitness, self.member
+
+
+def run_member(
+    problem: ACS,
+    optimiser_class: Type[Optimiser[ACSolution]],
+    optimiser_params: Dict[str, Any],
+    chunk_iterations: int,
+    connection: Connection,
+    stop: Event,
+) -> None:
+    """
+    Runs one member of a portfolio in a worker process. Optimisers with an
+    optimise_iter method run in chunks of iterations and report their best solution
+    after every chunk, until max_iter iterations are done or stop is set. Other
+    optimisers report once their optimise call returns.
+
+    :param problem: The problem to be solved
+    :param optimiser_class: The optimiser of the member
+    :param optimiser_params: The parameters of the optimiser
+    :param chunk_iterations: The number of iterations between two reports
+    :param connection: The sending end of the pipe of the member
+    :param stop: The event asking the member to stop after its current chunk
+    """
+    try:
+        optimiser = optimiser_class(problem, **optimiser_params)
+        if not hasattr(optimiser, "optimise_iter"):
+            solution = optimiser.optimise()
+            connection.send((solution.value, solution.fitness))
+            return
+
+        max_iter = getattr(optimiser, "max_iter", None)
+        done = 0
+        while (max_iter is None or done < max_iter) and not stop.is_set():
+            num_iter = chunk_iterations
+            if max_iter is not None:
+                num_iter = min(num_iter, max_iter - done)
+            optimiser.optimise_iter(num_iter)
+            done += num_iter
+
+            solution = optimiser.best_solution
+            if hasattr(solution, "get_solution"):
+                solution = solution.get_solution()
+            connection.send((solution.value, solution.fitness))
+            if optimiser.reached_target(solution.fitness):
+                return
+    finally:
+        connection.close()
+
+
+class PortfolioOptimiser(Optimiser[ACSolution]):
+    """
+    Class to race several optimisers on the same problem, each in its own process.
+    The members report their best solutions to a ResultCollector. The race ends when
+    every member has finished, the time limit expires or the best solution is within
+    the target gap of the lower bound, and the best solution is returned. After the
+    grace period, a member whose best solution costs more than cancel_ratio times
+    the best one is cancelled. Members that have not reported yet are never
+    cancelled, as optimisers without optimise_iter only report when they finish.
+    A member is stopped by asking it to stop after its current chunk, and killed
+    if it has not stopped within STOP_TIMEOUT seconds.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    members : Sequence[PortfolioMember]
+        The optimiser classes and their parameters
+    time_limit : float
+        The time limit of the race in seconds
+    grace_period : float
+        The time in seconds before members may be cancelled
+    cancel_ratio : Optional[float]
+        The ratio to the incumbent above which a member is cancelled, None to never
+        cancel members
+    chunk_iterations : int
+        The number of iterations between two reports of optimisers with optimise_iter
+    winner : int
+        The index of the member that found the returned solution, -1 for the FCFS
+        fallback used when no member reported a solution
+    cancelled : List[int]
+        The indices of the members cancelled in the last run
+    killed : List[int]
+        The indices of the members killed in the last run, as they did not stop
+        within STOP_TIMEOUT seconds
+    """
+
+    def __init__(
+        self,
+        problem: ACS,
+        members: Sequence[PortfolioMember],
+        time_limit: float,
+        grace_period: Optional[float] = None,
+        cancel_ratio: Optional[float] = 1.5,
+        chunk_iterations: int = 10,
+        target_gap: Optional[float] = None,
+    ):
+        super().__init__(problem)
+        self.problem = problem
+        self.members = members
+        self.time_limit = time_limit
+        self.grace_period = time_limit / 4 if grace_period is None else grace_period
+        self.cancel_ratio = cancel_ratio
+        self.chunk_iterations = chunk_iterations
+        self.target_gap = target_gap
+        self.winner = -1
+        self.cancelled: List[int] = []
+        self.killed: List[int] = []
+
+    def should_cancel(
+        self, member: int, elapsed: float, collector: ResultCollector
+    ) -> bool:
+        """
+        Checks whether a member is clearly losing the race
+
+        :param member: The index of the member
+        :param elapsed: The time since the start of the race in seconds
+        :param collector: The collector of the reported solutions
+        :return: Whether the member should be cancelled
+        """
+        if self.cancel_ratio is None or elapsed < self.grace_period:
+            return False
+        own = collector.member_fitness[member]
+        return own < float("inf") and own > self.cancel_ratio * collector.fitness
+
+    def stop_members(
+        self,
+        members: Sequence[int],
+        processes: Dict[int, multiprocessing.Process],
+        stops: Dict[int, Event],
+    ) -> None:
+        """
+        Asks members to stop, waits for them up to STOP_TIMEOUT seconds in total and
+        kills those still running
+
+        :param members: The indices of the members to stop
+        :param processes: The process of every running member, the stopped ones are
+            removed
+        :param stops: The stop event of every member
+        """
+        for member in members:
+            stops[member].set()
+        deadline = time.perf_counter() + STOP_TIMEOUT
+        for member in members:
+            process = processes.pop(member)
+            process.join(max(0.0, deadline - time.perf_counter()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+                self.killed.append(member)
+
+    def optimise(self) -> ACSolution:
+        collector = ResultCollector(len(self.members))
+        processes: Dict[int, multiprocessing.Process] = {}
+        stops: Dict[int, Event] = {}
+        self.cancelled = []
+        self.killed = []
+        reported = float("inf")
+        start = time.perf_counter()
+
+        try:
+            for member, (optimiser_class, optimiser_params) in enumerate(self.members):
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                stops[member] = multiprocessing.Event()
+                process = multiprocessing.Process(
+                    target=run_member,
+                    args=(
+                        self.problem,
+                        optimiser_class,
+                        optimiser_params,
+                        self.chunk_iterations,
+                        sender,
+                        stops[member],
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                # the pipe ends once the member closes the only other sending end
+                sender.close()
+                collector.add(member, receiver)
+                processes[member] = process
+
+            while len(processes) > 0:
+                elapsed = time.perf_counter() - start
+                if elapsed >= self.time_limit:
+                    break
+                collector.collect()
+                if collector.fitness < reported:
+                    reported = collector.fitness
+                    self.report_improvement(reported)
+                if reported < float("inf") and self.reached_target(reported):
+                    break
+
+                for member in list(processes.keys()):
+                    process = processes[member]
+                    if not process.is_alive():
+                        process.join()
+                        del processes[member]
+                    elif self.should_cancel(member, elapsed, collector):
+                        self.stop_members([member], processes, stops)
+                        self.cancelled.append(member)
+
+                timeout = min(0.05, max(0.0, self.time_limit - elapsed))
+                wait(
+                    [process.sentinel for process in processes.values()]
+                    + list(collector.connections.values()),
+                    timeout,
+                )
+        finally:
+            self.stop_members(list(processes.keys()), processes, stops)
+            collector.collect()
+            for connection in collector.connections.values():
+                connection.close()
+
+        value, _, self.winner = collector.best()
+        if value is None:
+            value = FCFS(self.problem).optimise().value
+        value = self.problem.canonical(value)
+        self.best_solution = ACSolution(
+            value, self.problem.evaluate(value), self.problem.all_ac
+        )
+        if self.best_solution.fitness < reported:
+            self.report_improvement(self.best_solution.fitness)
+        return self.best_solution
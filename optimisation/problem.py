@@ -1,9 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Dict, Generic, TypeVar
 
 T = TypeVar("T", bound="Solution")
 
 
+def counted(problem: "Problem", method: Callable, counter: str) -> Callable:
+    """
+    Wraps a bound method of a problem so that every call increments a counter of
+    the problem
+
+    :param problem: The problem
+    :param method: The bound method
+    :param counter: The name of the counter attribute
+    :return: The wrapped method
+    """
+    state = problem.__dict__
+
+    def wrapper(*args, **kwargs):
+        state[counter] += 1
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
 class Solution:
     """
     Class to represent a solution to a problem
@@ -18,10 +37,67 @@ class Solution:
 
 class Problem(ABC, Generic[T]):
     """
-    Class to represent a problem to be solved
+    Class to represent a problem to be solved. The methods in COUNTED_METHODS are
+    counted by wrappers set on the instance, so that with the counters switched off
+    the methods of the class are called directly without any overhead.
+
+    Attributes
+    ----------
+    evaluations : int
+        The number of solutions evaluated while instrumented
+    delta_evaluations : int
+        The number of changes to a solution evaluated incrementally, without
+        evaluating the whole solution, while instrumented
+    neighbours : int
+        The number of neighbours generated while instrumented
+    instrumented : bool
+        Whether the counters are switched on
     """
-    def __init__(self):
-        pass
+
+    # The counted methods and the counter each of them increments
+    COUNTED_METHODS: Dict[str, str] = {
+        "evaluate_solution": "evaluations",
+        "next": "neighbours",
+    }
+
+    def __init__(self, instrumented: bool = True):
+        self.evaluations = 0
+        self.delta_evaluations = 0
+        self.neighbours = 0
+        self.instrumented = False
+        self.instrument(instrumented)
+
+    def instrument(self, enabled: bool = True) -> None:
+        """
+        Switches the counters on or off. The counts are kept when switching off.
+
+        :param enabled: Whether the counters are switched on
+        """
+        for name, counter in self.COUNTED_METHODS.items():
+            self.__dict__.pop(name, None)
+            if enabled:
+                setattr(self, name, counted(self, getattr(self, name), counter))
+        self.instrumented = enabled
+
+    def reset_counters(self) -> None:
+        """
+        Sets the counters back to zero
+        """
+        self.evaluations = 0
+        self.delta_evaluations = 0
+        self.neighbours = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the wrappers refer to this instance, copies and pickles get their own
+        state = self.__dict__.copy()
+        for name in self.COUNTED_METHODS:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.instrumented:
+            self.instrument(True)
 
     @abstractmethod
     def next(self, solution: T, companion: T) -> T:
@@ -56,3 +132,11 @@ class Problem(ABC, Generic[T]):
 
         :return: A solution to the problem
         """
+
+    def lower_bound(self) -> float:
+        """
+        Returns a lower bound on the cost of any solution.
+
+        :return: The lower bound
+        """
+        return 0.0
@@ -0,0 +1,190 @@
+import random
+from typing import List, Optional, Tuple
+from optimisation.fcfs import FCFS
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+from problem.schedule_state import ScheduleState
+
+
+class TabuSearchOptimiser(Optimiser[ACSolution]):
+    """
+    Class to implement Tabu Search for the ACS problem. Starting from the FCFS
+    solution, every iteration takes the best move that is not tabu, either moving
+    one airplane to another runway or swapping the runways of two airplanes at most
+    swap_window apart. After airplane i leaves runway r, moving it back to r is tabu
+    for tenure iterations, unless the move leads to a new best solution. When there
+    are more moves than candidate_size, a random sample of that size is evaluated.
+    Moves are evaluated incrementally with a ScheduleState.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem to be solved
+    max_iter : int
+        The maximum number of iterations
+    tenure : int
+        The number of iterations a reverse move stays tabu
+    candidate_size : Optional[int]
+        The number of moves evaluated per iteration, None to evaluate all of them
+    swap_window : int
+        The largest distance in all_ac between two airplanes swapped
+    max_no_improve : Optional[int]
+        The number of iterations without a new best solution before stopping
+    """
+
+    def __init__(
+        self,
+        problem: ACS,
+        max_iter: int,
+        tenure: int = 7,
+        candidate_size: Optional[int] = 200,
+        swap_window: int = 5,
+        max_no_improve: Optional[int] = None,
+        target_gap: Optional[float] = None,
+    ):
+        super().__init__(problem)
+        self.problem = problem
+        self.max_iter = max_iter
+        self.tenure = tenure
+        self.candidate_size = candidate_size
+        self.swap_window = swap_window
+        self.max_no_improve = max_no_improve
+        self.target_gap = target_gap
+
+    def candidate_moves(self, state: ScheduleState) -> List[Tuple[int, int]]:
+        """
+        Returns the moves evaluated in an iteration. A move (i, r) with r > 0 moves
+        airplane i to runway r and a move (i, -j) swaps the runways of i and j.
+
+        :param state: The current schedule
+        :return: The moves
+        """
+        n = len(state.value)
+        runways = self.problem.no_of_runways
+        num_reassign = n * (runways - 1)
+        num_moves = num_reassign + n * self.swap_window
+        if self.candidate_size is None or num_moves <= self.candidate_size:
+            moves = [
+                (i, r)
+                for i in range(n)
+                for r in range(1, runways + 1)
+                if r != state.value[i]
+            ]
+            moves.extend(
+                (i, -j)
+                for i in range(n)
+                for j in range(i + 1, min(n, i + self.swap_window + 1))
+                if state.value[i] != state.value[j]
+            )
+            return moves
+
+        moves = []
+        for _ in range(self.candidate_size):
+            i = random.randrange(n)
+            if random.randrange(num_moves) < num_reassign:
+                r = random.randint(1, runways - 1)
+                moves.append((i, r if r < state.value[i] else r + 1))
+                continue
+            j = i + random.randint(1, self.swap_window)
+            if j < n and state.value[i] != state.value[j]:
+                moves.append((i, -j))
+        return moves
+
+    def select_move(
+        self,
+        state: ScheduleState,
+        moves: List[Tuple[int, int]],
+        tabu_until: List[List[int]],
+        iteration: int,
+        best_fitness: float,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Returns the best move that is not tabu, or that is tabu but leads to a new
+        best solution
+
+        :param state: The current schedule
+        :param moves: The candidate moves
+        :param tabu_until: The first iteration each airplane may move to each runway
+        :param iteration: The current iteration
+        :param best_fitness: The fitness of the best solution found
+        :return: The best move, None if every move is tabu
+        """
+        best_move = None
+        best_delta = float("inf")
+        for i, r in moves:
+            if r > 0:
+                delta = state.reassign_delta(i, r)
+                tabu = tabu_until[i][r] > iteration
+            else:
+                delta = state.swap_delta(i, -r)
+                tabu = (
+                    tabu_until[i][state.value[-r]] > iteration
+                    or tabu_until[-r][state.value[i]] > iteration
+                )
+            if delta >= best_delta:
+                continue
+            aspiration = state.fitness + delta < best_fitness - 1e-9
+            if not tabu or aspiration:
+                best_move, best_delta = (i, r), delta
+        return best_move
+
+    def optimise(self) -> ACSolution:
+        initial = FCFS(self.problem).optimise()
+        state = ScheduleState(self.problem, initial.value)
+        best_value, best_fitness = list(state.value), state.fitness
+        self.report_improvement(best_fitness)
+        if (
+            self.problem.no_of_runways < 2
+            or len(state.value) == 0
+            or self.reached_target(best_fitness)
+        ):
+            # relabelling interchangeable runways keeps the fitness
+            value = self.problem.canonical(state.value)
+            self.best_solution = ACSolution(value, state.fitness, self.problem.all_ac)
+            return self.best_solution
+
+        # tabu_until[i][r]: first iteration airplane i may move to runway r again
+        tabu_until = [[0] * (self.problem.no_of_runways + 1) for _ in state.value]
+        no_improve = 0
+
+        for iteration in range(self.max_iter):
+            if self.out_of_time():
+                break
+            moves = self.run_phase("candidates", self.candidate_moves, state)
+            best_move = self.run_phase(
+                "evaluation",
+                self.select_move,
+                state,
+                moves,
+                tabu_until,
+                iteration,
+                best_fitness,
+            )
+            if best_move is None:
+                break
+            i, r = best_move
+            tabu_until[i][state.value[i]] = iteration + 1 + self.tenure
+            if r > 0:
+                state.reassign(i, r)
+            else:
+                tabu_until[-r][state.value[-r]] = iteration + 1 + self.tenure
+                state.swap(i, -r)
+
+            self.end_iteration()
+            if state.fitness < best_fitness - 1e-9:
+                best_value, best_fitness = list(state.value), state.fitness
+                self.report_improvement(best_fitness)
+                no_improve = 0
+                if self.reached_target(best_fitness):
+                    break
+            else:
+                no_improve += 1
+                if self.max_no_improve is not None and no_improve >= self.max_no_improve:
+                    break
+
+        best_value = self.problem.canonical(best_value)
+        self.best_solution = ACSolution(
+            best_value, self.problem.evaluate(best_value), self.problem.all_ac
+        )
+        return self.best_solution
@@ -0,0 +1,120 @@
+import time
+from typing import Optional
+import numpy as np
+from optimisation.optimiser import ImprovementCallback, Optimiser
+
+# One row of a trace, appended whenever the best solution improves
+TRACE_DTYPE = np.dtype(
+    [
+        ("elapsed", np.float64),
+        ("evaluations", np.int64),
+        ("iteration", np.int64),
+        ("best", np.float64),
+    ]
+)
+
+
+class ConvergenceTrace:
+    """
+    Class to record the convergence of an optimiser, the best fitness as a function
+    of time and of evaluations. A row is appended only when the best solution
+    improves, into a preallocated buffer that doubles when full, so recording costs
+    nothing per evaluation and can be left on. The trace is attached to an optimiser
+    as its on_improvement callback, which calls the callback it replaces in turn,
+    and the elapsed time and evaluations are counted from then on.
+
+    Attributes
+    ----------
+    buffer : np.ndarray
+        The preallocated rows, of dtype TRACE_DTYPE, the first size of them recorded
+    size : int
+        The number of rows recorded
+    start_time : float
+        The perf_counter time the elapsed times are measured from
+    start_evaluations : int
+        The evaluations of the optimiser when the trace was attached
+    previous : Optional[ImprovementCallback]
+        The on_improvement callback of the optimiser before the trace was attached
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.buffer = np.empty(max(capacity, 1), dtype=TRACE_DTYPE)
+        self.size = 0
+        self.start_time = time.perf_counter()
+        self.start_evaluations = 0
+        self.previous: Optional[ImprovementCallback] = None
+
+    def attach(self, optimiser: Optimiser) -> "ConvergenceTrace":
+        """
+        Records the improvements of an optimiser from now on, chained before its
+        current on_improvement callback
+
+        :param optimiser: The optimiser
+        :return: The trace itself
+        """
+        if optimiser.on_improvement is not self:
+            self.previous = optimiser.on_improvement
+            optimiser.on_improvement = self
+        self.start_time = time.perf_counter()
+        self.start_evaluations = optimiser.evaluation_count()
+        return self
+
+    def __call__(self, optimiser: Optimiser, iteration: int, fitness: float) -> None:
+        evaluations = optimiser.evaluation_count() - self.start_evaluations
+        self.record(evaluations, iteration, fitness)
+        if self.previous is not None:
+            self.previous(optimiser, iteration, fitness)
+
+    def record(self, evaluations: int, iteration: int, best: float) -> None:
+        """
+        Appends a row if the fitness improves on the last one recorded
+
+        :param evaluations: The number of evaluations so far
+        :param iteration: The number of iterations so far
+        :param best: The fitness of the best solution
+        """
+        if self.size > 0 and best >= self.buffer[self.size - 1]["best"]:
+            return
+        if self.size == len(self.buffer):
+            grown = np.empty(2 * len(self.buffer), dtype=TRACE_DTYPE)
+            grown[: self.size] = self.buffer
+            self.buffer = grown
+        self.buffer[self.size] = (
+            time.perf_counter() - self.start_time,
+            evaluations,
+            iteration,
+            best,
+        )
+        self.size += 1
+
+    @property
+    def rows(self) -> np.ndarray:
+        """
+        The recorded rows, a view of the buffer
+        """
+        return self.buffer[: self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def save(self, path: str) -> None:
+        """
+        Writes the recorded rows to a .npy file
+
+        :param path: Path of the file
+        """
+        np.save(path, self.rows)
+
+    @classmethod
+    def load(cls, path: str) -> "ConvergenceTrace":
+        """
+        Reads a trace written by save
+
+        :param path: Path of the file
+        :return: The trace
+        """
+        rows = np.load(path)
+        trace = cls(len(rows))
+        trace.buffer[: len(rows)] = rows
+        trace.size = len(rows)
+        return trace
@@ -1,5 +1,6 @@
 import random
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 from optimisation.problem import Problem
 from problem.acs_solution import ACSolution
 from problem.airplane import Airplane
@@ -24,8 +25,23 @@ class ACS(Problem[ACSolution]):
         The list of airplanes that are taking off.
     all_ac : list[Airplane]
         The list of all airplanes.
+    evaluations : int
+        The number of solutions evaluated so far, without those answered from the
+        fitness cache.
+    neighbours : int
+        The number of neighbours generated so far.
+    runway_groups : list[int]
+        The group of every runway, runways with identical eta_etd for all airplanes
+        share a group and are interchangeable.
+    fitness_cache_size : int
+        The number of canonical solutions whose fitness is cached, 0 to disable.
+    cache_hits : int
+        The number of evaluations answered from the fitness cache.
     """
 
+    # Evaluations are counted below the fitness cache, cache hits are not
+    COUNTED_METHODS = {"compute_cost": "evaluations", "next": "neighbours"}
+
     def __init__(
         self,
         no_of_runways: int,
@@ -33,6 +49,7 @@ class ACS(Problem[ACSolution]):
         separation_matrix: List[List[float]],
         landing_ac: List[Airplane],
         takeoff_ac: List[Airplane],
+        fitness_cache_size: int = 0,
     ):
         """
         Constructor for the ACS class.
@@ -42,6 +59,7 @@ class ACS(Problem[ACSolution]):
         :param separation_matrix: The separation matrix between the different types of airplanes.
         :param landing_ac: The list of airplanes that are landing.
         :param takeoff_ac: The list of airplanes that are taking off.
+        :param fitness_cache_size: The number of canonical solutions whose fitness is cached.
         """
         super().__init__()
         self.no_of_runways = no_of_runways
@@ -55,6 +73,87 @@ class ACS(Problem[ACSolution]):
         for ac in self.all_ac:
             assert len(ac.eta_etd) == self.no_of_runways
 
+        self.runway_groups = self.find_runway_groups()
+        self.has_symmetric_runways = len(set(self.runway_groups)) < self.no_of_runways
+        self.fitness_cache_size = fitness_cache_size
+        self.fitness_cache: OrderedDict = OrderedDict()
+        self.cache_hits = 0
+
+    def find_runway_groups(self) -> List[int]:
+        """
+        Groups the runways that have identical eta_etd for all airplanes. Such runways
+        are interchangeable, so solutions that only differ by their labels are equal.
+
+        :return: The group of every runway, the index of its first identical runway.
+        """
+        first_runway: Dict[Tuple, int] = {}
+        groups = []
+        for runway in range(self.no_of_runways):
+            column = tuple(ac.eta_etd[runway] for ac in self.all_ac)
+            groups.append(first_runway.setdefault(column, runway))
+        return groups
+
+    def min_landing_gaps(self) -> List[List[float]]:
+        """
+        Returns the smallest time between the landing of an airplane of type a and
+        any later landing of type b on the same runway. Without landings in between
+        the gap is the separation plus one second, otherwise it is the sum of the
+        gaps of the chain, so the result is the shortest path closure of the gaps.
+        It equals the separation plus one when the separation matrix satisfies the
+        triangle inequality.
+
+        :return: The gaps, indexed by the types minus one.
+        """
+        gaps = [[gap + 1 for gap in row] for row in self.separation_matrix]
+        types = range(len(gaps))
+        for k in types:
+            for a in types:
+                for b in types:
+                    gaps[a][b] = min(gaps[a][b], gaps[a][k] + gaps[k][b])
+        return gaps
+
+    def has_metric_separation(self) -> bool:
+        """
+        Checks whether the separation plus one second satisfies the triangle
+        inequality, so that the separation between consecutive landings implies the
+        separation between all landings of a runway.
+
+        :return: Whether the separation matrix is metric.
+        """
+        gaps = self.min_landing_gaps()
+        return all(
+            gaps[a][b] == separation + 1
+            for a, row in enumerate(self.separation_matrix)
+            for b, separation in enumerate(row)
+        )
+
+    def canonical(self, solution: List[int]) -> List[int]:
+        """
+        Relabels the interchangeable runways of a solution in order of first use, so
+        that all solutions that only differ by such labels map to the same one.
+
+        :param solution: The solution to be relabelled.
+        :return: The canonical solution.
+        """
+        if not self.has_symmetric_runways:
+            return solution
+
+        free_runways: Dict[int, List[int]] = {}
+        for runway, group in enumerate(self.runway_groups):
+            free_runways.setdefault(group, []).append(runway + 1)
+        for runways in free_runways.values():
+            runways.reverse()
+
+        relabel: Dict[int, int] = {}
+        canonical = []
+        for runway in solution:
+            label = relabel.get(runway)
+            if label is None:
+                label = free_runways[self.runway_groups[runway - 1]].pop()
+                relabel[runway] = label
+            canonical.append(label)
+        return canonical
+
     def get_landing_times(self, solution: List[int]) -> List[Tuple[int, int]]:
         """
         Returns the landing times of the airplanes in the solution.
@@ -94,6 +193,42 @@ class ACS(Problem[ACSolution]):
 
         return landing_times
 
+    def independent_clusters(self) -> List[Tuple[int, int]]:
+        """
+        Splits all_ac into clusters that cannot affect each other's landing times.
+        An upper bound on the landing times of a cluster is kept by chaining its
+        aircrafts on a single runway with the largest separation and eta_etd. A new
+        cluster starts once every remaining airplane arrives after that bound plus
+        the largest separation, so the runways are free for it on any assignment.
+
+        :return: The (start, end) indices of the clusters in all_ac.
+        """
+        if len(self.all_ac) == 0:
+            return []
+
+        max_separation = max(max(row) for row in self.separation_matrix) + 1
+        suffix_min_eta = [0.0] * len(self.all_ac)
+        current_min = float("inf")
+        for i in range(len(self.all_ac) - 1, -1, -1):
+            current_min = min(current_min, min(self.all_ac[i].eta_etd))
+            suffix_min_eta[i] = current_min
+
+        clusters = []
+        cluster_start = 0
+        latest_landing = max(self.all_ac[0].eta_etd)
+        for i in range(1, len(self.all_ac)):
+            if suffix_min_eta[i] >= latest_landing + max_separation:
+                clusters.append((cluster_start, i))
+                cluster_start = i
+                latest_landing = max(self.all_ac[i].eta_etd)
+                continue
+            latest_landing = max(
+                max(self.all_ac[i].eta_etd), latest_landing + max_separation
+            )
+        clusters.append((cluster_start, len(self.all_ac)))
+
+        return clusters
+
     def evaluate_solution(self, solution: ACSolution) -> float:
         return self.evaluate(solution.value)
 
@@ -102,6 +237,31 @@ class ACS(Problem[ACSolution]):
         Function that evaluates the solution. The cost of the solution is the sum of
         the delay costs of all landing airplanes.
 
+        :param solution: The solution to be evaluated.
+        :return: The cost of the solution.
+        """
+        if self.fitness_cache_size > 0:
+            key = tuple(self.canonical(solution))
+            cost = self.fitness_cache.get(key)
+            if cost is not None:
+                self.cache_hits += 1
+                self.fitness_cache.move_to_end(key)
+                return cost
+
+        cost = self.compute_cost(solution)
+
+        if self.fitness_cache_size > 0:
+            self.fitness_cache[key] = cost
+            if len(self.fitness_cache) > self.fitness_cache_size:
+                self.fitness_cache.popitem(last=False)
+
+        return cost
+
+    def compute_cost(self, solution: List[int]) -> float:
+        """
+        Computes the cost of a solution from its landing times, without the fitness
+        cache. Calls of this method are counted as evaluations.
+
         :param solution: The solution to be evaluated.
         :return: The cost of the solution.
         """
@@ -114,13 +274,100 @@ class ACS(Problem[ACSolution]):
                 (time - self.all_ac[i].eta_etd[runway - 1])
                 * (self.all_ac[i].delay_cost),
             )
-
         return cost
 
+    def lower_bound(self) -> float:
+        """
+        Returns the cached combinatorial lower bound on the cost of any solution.
+
+        :return: The lower bound
+        """
+        # imported here as the lower bound module depends on this one
+        from problem.lower_bound import lower_bound
+
+        return lower_bound(self)
+
+    def repair(
+        self,
+        solution: ACSolution,
+        new_etas: Dict[int, List[int]],
+        time_window: int = 900,
+        swap_window: int = 5,
+    ) -> ACSolution:
+        """
+        Re-optimises a solution after the eta_etd of some airplanes changed. The new
+        eta_etd are set, the ending_time of every changed airplane is shifted by as
+        much as its earliest eta_etd, and all_ac is sorted by ending_time again, so
+        that a delayed airplane lands after the airplanes it now arrives behind.
+        Only the changed airplanes and the airplanes whose earliest eta_etd is within
+        time_window seconds of their old or new one may change runway, the rest of
+        the schedule stays fixed. A descent moves these airplanes to other runways
+        and swaps the runways of two of them at most swap_window apart, evaluating
+        every move incrementally, until no move improves the cost.
+
+        :param solution: The solution planned before the change.
+        :param new_etas: The new eta_etd of the changed airplanes by index in all_ac.
+        :param time_window: The time neighbourhood of the changed airplanes in seconds.
+        :param swap_window: The largest distance between two free airplanes swapped.
+        :return: The repaired solution, indexed by the re-sorted all_ac.
+        """
+        # imported here as these modules depend on this one
+        from optimisation.local_search import IMPROVEMENT_TOLERANCE
+        from problem.schedule_state import ScheduleState
+
+        changed_etas = []
+        for i, eta_etd in new_etas.items():
+            ac = self.all_ac[i]
+            old_eta, new_eta = min(ac.eta_etd), min(eta_etd)
+            ac.eta_etd = list(eta_etd)
+            ac.ending_time += new_eta - old_eta
+            changed_etas += [old_eta, new_eta]
+
+        order = sorted(
+            range(len(self.all_ac)), key=lambda i: self.all_ac[i].ending_time
+        )
+        changed = {k for k, i in enumerate(order) if i in new_etas}
+        self.all_ac = [self.all_ac[i] for i in order]
+        value = [solution.value[i] for i in order]
+
+        # the etas changed, so cached costs and runway groups may be stale
+        self.fitness_cache.clear()
+        self.runway_groups = self.find_runway_groups()
+        self.has_symmetric_runways = len(set(self.runway_groups)) < self.no_of_runways
+
+        free = [
+            i
+            for i, ac in enumerate(self.all_ac)
+            if i in changed
+            or any(abs(min(ac.eta_etd) - eta) <= time_window for eta in changed_etas)
+        ]
+
+        state = ScheduleState(self, value)
+        improved = True
+        while improved:
+            improved = False
+            for k, i in enumerate(free):
+                for runway in range(1, self.no_of_runways + 1):
+                    if runway == state.value[i]:
+                        continue
+                    if state.reassign_delta(i, runway) < -IMPROVEMENT_TOLERANCE:
+                        state.reassign(i, runway)
+                        improved = True
+                for j in free[k + 1 : k + 1 + swap_window]:
+                    if state.value[i] == state.value[j]:
+                        continue
+                    if state.swap_delta(i, j) < -IMPROVEMENT_TOLERANCE:
+                        state.swap(i, j)
+                        improved = True
+
+        value = self.canonical(state.value)
+        return ACSolution(value, self.evaluate(value), self.all_ac)
+
     def next(self, solution: ACSolution, companion: ACSolution) -> ACSolution:
         """
         Uses the next neighbour function to generate a new solution. The next neighbour
-        function is to swap the runways of two airplanes.
+        function is to swap the runways of two airplanes. Interchangeable runways are
+        relabelled in order of first use.
 
         :param solution: The solution to be changed.
         :param companion: The companion solution used to generate the new solution.
@@ -140,6 +387,7 @@ class ACS(Problem[ACSolution]):
         )
         new_solution.value[index] = max(1, new_solution.value[index])
         new_solution.value[index] = min(self.no_of_runways, new_solution.value[index])
+        new_solution.value = self.canonical(new_solution.value)
 
         new_solution.fitness = self.evaluate(new_solution.value)
 
@@ -150,9 +398,12 @@ class ACS(Problem[ACSolution]):
         Generates a random solution to the problem. The solution is a list of integers,
         where the index of the list represents the airplane and the value at that
         index represents the runway. The order of the airplanes in the list is the
-        order in which they are scheduled on a specific runway.
+        order in which they are scheduled on a specific runway. Interchangeable runways
+        are relabelled in order of first use.
         """
-        solution = [random.randint(1, self.no_of_runways) for airplane in self.all_ac]
+        solution = self.canonical(
+            [random.randint(1, self.no_of_runways) for airplane in self.all_ac]
+        )
         acs_solution = ACSolution(solution, self.evaluate(solution), self.all_ac)
         return acs_solution
 
@@ -15,9 +15,28 @@ class ACSolution(Solution):
         The fitness of the solution
     aircraft_sequence : list[Airplane]
         The sequence of aircrafts
+    landing_times : Optional[List[float]]
+        The landing time of every aircraft if it is known, e.g. from RHCSolver
     """
     def __init__(
-        self, value: Optional[List[int]], fitness: float, aircraft_sequence: list[Airplane]
+        self,
+        value: Optional[List[int]],
+        fitness: float,
+        aircraft_sequence: list[Airplane],
+        landing_times: Optional[List[float]] = None,
     ):
         super().__init__(value, fitness)
         self.aircraft_sequence = aircraft_sequence
+        self.landing_times = landing_times
+
+    def export(self, path: str, problem=None) -> None:
+        """
+        Writes the schedule of the solution to a csv file, or a .npy file
+
+        :param path: Path of the file
+        :param problem: The problem of the solution, needed without landing times
+        """
+        # imported here as the export module depends on this one
+        from problem.schedule_export import export_schedule
+
+        export_schedule(path, self, problem)
@@ -0,0 +1,192 @@
+import multiprocessing
+import time
+import traceback
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, Union
+import pandas as pd
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+from utils.input import read_csv_input, read_input
+from utils.instance_file import BINARY_EXTENSION, load_acs
+
+InstanceSource = Union[str, pd.DataFrame, ACS]
+
+
+class BatchResult:
+    """
+    Class to store the result of solving one instance of a batch
+
+    Attributes
+    ----------
+    index : int
+        Position of the instance in the batch
+    source : str
+        Description of the instance, the path for files
+    solution : Optional[ACSolution]
+        The solution found, None if the instance failed
+    elapsed : float
+        Wall time spent on the instance in seconds
+    error : Optional[str]
+        Reason of the failure, None if the instance was solved
+    """
+
+    index: int
+    source: str
+    solution: Optional[ACSolution]
+    elapsed: float
+    error: Optional[str]
+
+    def __init__(
+        self,
+        index: int,
+        source: str,
+        solution: Optional[ACSolution],
+        elapsed: float,
+        error: Optional[str] = None,
+    ):
+        self.index = index
+        self.source = source
+        self.solution = solution
+        self.elapsed = elapsed
+        self.error = error
+
+    def __repr__(self):
+        outcome = self.error if self.error is not None else self.solution.fitness
+        return f"BatchResult({self.index}: {self.source}, {outcome}, {self.elapsed:.3f}s)"
+
+
+def load_instance(source: InstanceSource, num_runways: int) -> ACS:
+    """
+    Builds the problem of an instance source. Csv files and dataframes are read in
+    the IKLI format, binary instance files are mapped and any other path is read as
+    an input file.
+
+    :param source: Path, dataframe or problem
+    :param num_runways: Number of runways for csv files and dataframes
+    :return: The problem
+    """
+    if isinstance(source, ACS):
+        return source
+    if isinstance(source, pd.DataFrame) or source.endswith(".csv"):
+        return ACS(*read_csv_input(source, num_runways))
+    if source.endswith(BINARY_EXTENSION):
+        return load_acs(source)
+    return ACS(*read_input(source))
+
+
+def describe_source(index: int, source: InstanceSource) -> str:
+    """
+    Returns a short description of an instance source
+
+    :param index: Position of the instance in the batch
+    :param source: Path, dataframe or problem
+    :return: The description
+    """
+    if isinstance(source, str):
+        return source
+    return f"<{source.__class__.__name__} {index}>"
+
+
+def solve_instance(
+    connection,
+    source: InstanceSource,
+    num_runways: int,
+    optimiser_class: Type[Optimiser[ACSolution]],
+    optimiser_params: Dict[str, Any],
+) -> None:
+    """
+    Solves a single instance in a worker process and sends back the solution or the
+    traceback of the failure.
+
+    :param connection: Pipe connection to the batch process
+    :param source: Path, dataframe or problem
+    :param num_runways: Number of runways for csv files and dataframes
+    :param optimiser_class: The optimiser used to solve the instance
+    :param optimiser_params: The parameters of the optimiser
+    """
+    try:
+        problem = load_instance(source, num_runways)
+        solution = optimiser_class(problem, **optimiser_params).optimise()
+        connection.send((solution, None))
+    except Exception:  # pylint: disable=broad-except
+        connection.send((None, traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+def solve_batch(
+    sources: Sequence[InstanceSource],
+    optimiser_class: Type[Optimiser[ACSolution]],
+    optimiser_params: Dict[str, Any],
+    num_runways: int = 3,
+    max_workers: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> Iterator[BatchResult]:
+    """
+    Solves many instances across worker processes and yields the results as each
+    instance finishes. Every instance runs in its own process, so an instance that
+    crashes or exceeds the time limit is reported as failed without affecting the
+    rest of the batch.
+
+    :param sources: Paths, dataframes or problems to be solved
+    :param optimiser_class: The optimiser used to solve every instance
+    :param optimiser_params: The parameters of the optimiser
+    :param num_runways: Number of runways for csv files and dataframes
+    :param max_workers: Number of instances solved at once, all cpus by default
+    :param time_limit: Wall time limit per instance in seconds
+    :return: Iterator over the results in order of completion
+    """
+    max_workers = max_workers or multiprocessing.cpu_count()
+    queue = list(enumerate(sources))
+    queue.reverse()
+    # connection -> (index, process, start time)
+    running: Dict[Any, tuple] = {}
+
+    try:
+        while len(queue) > 0 or len(running) > 0:
+            while len(queue) > 0 and len(running) < max_workers:
+                index, source = queue.pop()
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=solve_instance,
+                    args=(sender, source, num_runways, optimiser_class, optimiser_params),
+                    daemon=True,
+                )
+                process.start()
+                sender.close()
+                running[receiver] = (index, source, process, time.perf_counter())
+
+            timeout = None
+            if time_limit is not None:
+                earliest_start = min(start for _, _, _, start in running.values())
+                timeout = max(0.0, earliest_start + time_limit - time.perf_counter())
+
+            ready: List[Any] = wait(list(running.keys()), timeout)
+            now = time.perf_counter()
+
+            for receiver in list(running.keys()):
+                index, source, process, start = running[receiver]
+                if receiver in ready:
+                    try:
+                        solution, error = receiver.recv()
+                    except EOFError:
+                        process.join()
+                        solution, error = None, f"worker exited with code {process.exitcode}"
+                elif time_limit is not None and now - start >= time_limit:
+                    process.kill()
+                    solution, error = None, f"time limit of {time_limit}s exceeded"
+                else:
+                    continue
+
+                receiver.close()
+                process.join()
+                del running[receiver]
+                yield BatchResult(
+                    index, describe_source(index, source), solution, now - start, error
+                )
+    finally:
+        for receiver, (_, _, process, _) in running.items():
+            process.kill()
+            process.join()
+            receiver.close()
@@ -0,0 +1,108 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+
+def solve_cluster(
+    problem: ACS,
+    optimiser_class: Type[Optimiser[ACSolution]],
+    optimiser_params: Dict[str, Any],
+) -> Tuple[List[int], float]:
+    """
+    Solves the problem of a single cluster. Defined at module level so that it can
+    be sent to the worker processes.
+
+    :param problem: The problem of the cluster
+    :param optimiser_class: The optimiser used to solve the cluster
+    :param optimiser_params: The parameters of the optimiser
+    :return: The runways assigned to the aircrafts and the cost of the cluster
+    """
+    solution = optimiser_class(problem, **optimiser_params).optimise()
+    return solution.value, solution.fitness
+
+
+class ClusterSolver(Optimiser[ACSolution]):
+    """
+    Class to represent the ClusterSolver
+    Splits the problem into clusters of aircrafts that cannot affect each other's
+    landing times and solves them in parallel. As the clusters are independent, the
+    cost of the merged solution is the sum of the costs of the clusters.
+
+    Attributes:
+        problem: The problem to be solved
+        optimiser_class: The optimiser used to solve every cluster
+        optimiser_params: The parameters of the optimiser
+        max_workers: The number of worker processes, all cpus by default
+        clusters: The (start, end) indices of the clusters in all_ac
+    """
+
+    def __init__(
+        self,
+        problem: ACS,
+        optimiser_class: Type[Optimiser[ACSolution]],
+        optimiser_params: Dict[str, Any],
+        max_workers: Optional[int] = None,
+    ):
+        super().__init__(problem)
+        self.problem = problem
+        self.optimiser_class = optimiser_class
+        self.optimiser_params = optimiser_params
+        self.max_workers = max_workers
+        self.clusters: List[Tuple[int, int]] = []
+
+    def cluster_problem(self, start: int, end: int) -> ACS:
+        """
+        Returns the problem made of the aircrafts of a cluster
+
+        :param start: The index of the first aircraft of the cluster
+        :param end: The index after the last aircraft of the cluster
+        :return: The problem of the cluster
+        """
+        return ACS(
+            self.problem.no_of_runways,
+            self.problem.no_ac_types,
+            self.problem.separation_matrix,
+            self.problem.all_ac[start:end],
+            [],
+            self.problem.fitness_cache_size,
+        )
+
+    def optimise(self) -> ACSolution:
+        self.clusters = self.problem.independent_clusters()
+        value: List[int] = [0] * len(self.problem.all_ac)
+        fitness = 0.0
+
+        # A single aircraft lands at its eta_etd on any runway
+        to_solve = []
+        for start, end in self.clusters:
+            if end - start == 1:
+                eta_etd = self.problem.all_ac[start].eta_etd
+                value[start] = eta_etd.index(min(eta_etd)) + 1
+            else:
+                to_solve.append((start, end))
+
+        problems = [self.cluster_problem(start, end) for start, end in to_solve]
+        if self.max_workers == 1 or len(problems) <= 1:
+            results = [
+                solve_cluster(problem, self.optimiser_class, self.optimiser_params)
+                for problem in problems
+            ]
+        else:
+            with ProcessPoolExecutor(self.max_workers) as executor:
+                results = list(
+                    executor.map(
+                        solve_cluster,
+                        problems,
+                        [self.optimiser_class] * len(problems),
+                        [self.optimiser_params] * len(problems),
+                    )
+                )
+
+        for (start, end), (cluster_value, cluster_fitness) in zip(to_solve, results):
+            value[start:end] = cluster_value
+            fitness += cluster_fitness
+
+        self.best_solution = ACSolution(value, fitness, self.problem.all_ac)
+        return self.best_solution
@@ -0,0 +1,117 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+
+class HorizonPolicy(ABC):
+    """
+    Class to represent the policy used by the RHCSolver to size each window
+    """
+
+    @abstractmethod
+    def window_length(
+        self,
+        start_time: int,
+        num_windows: int,
+        pending_etas: Sequence[int],
+        records: List,
+    ) -> int:
+        """
+        Returns the length of the window starting at start_time. The horizon solved
+        by the RHCSolver spans num_windows such windows.
+
+        :param start_time: The start time of the window
+        :param num_windows: The number of windows in the horizon
+        :param pending_etas: Sorted earliest eta_etd of the aircrafts yet to be scheduled
+        :param records: The WindowRecords of the windows solved so far
+        :return: The length of the window
+        """
+
+
+class FixedHorizon(HorizonPolicy):
+    """
+    Policy that uses the same window length for the whole run
+
+    Attributes
+    ----------
+    time_window : int
+        The length of every window
+    """
+
+    def __init__(self, time_window: int):
+        self.time_window = time_window
+
+    def window_length(self, start_time, num_windows, pending_etas, records) -> int:
+        return self.time_window
+
+
+class DensityAdaptiveHorizon(HorizonPolicy):
+    """
+    Policy that sizes each window from the density of the upcoming traffic. The
+    longest window within the bounds is chosen such that the horizon holds at most
+    max_aircraft aircrafts and its predicted solve time is at most max_solve_time.
+    The solve time is predicted from the time per aircraft of the windows solved so
+    far, so the shortest window is used until a window has been solved. If no length
+    satisfies the targets the shortest window is used.
+
+    Attributes
+    ----------
+    min_window : int
+        The shortest allowed window
+    max_window : int
+        The longest allowed window
+    max_aircraft : Optional[int]
+        The maximum number of aircrafts in a horizon
+    max_solve_time : Optional[float]
+        The maximum predicted solve time of a horizon in seconds
+    step : int
+        The granularity of the window lengths that are tried
+    """
+
+    def __init__(
+        self,
+        min_window: int,
+        max_window: int,
+        max_aircraft: Optional[int] = None,
+        max_solve_time: Optional[float] = None,
+        step: int = 60,
+    ):
+        assert 0 < min_window <= max_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.max_aircraft = max_aircraft
+        self.max_solve_time = max_solve_time
+        self.step = step
+
+    def aircraft_limit(self, records: List) -> float:
+        """
+        Returns the number of aircrafts a horizon may hold to meet both targets
+
+        :param records: The WindowRecords of the windows solved so far
+        :return: The maximum number of aircrafts in the horizon
+        """
+        limit = float("inf") if self.max_aircraft is None else self.max_aircraft
+
+        total_aircraft = sum(record.num_aircraft for record in records)
+        total_time = sum(record.solve_time for record in records)
+        if self.max_solve_time is not None:
+            if total_aircraft == 0:
+                return 0
+            time_per_aircraft = total_time / total_aircraft
+            if time_per_aircraft > 0:
+                limit = min(limit, self.max_solve_time / time_per_aircraft)
+
+        return limit
+
+    def window_length(self, start_time, num_windows, pending_etas, records) -> int:
+        limit = self.aircraft_limit(records)
+        start_index = bisect_left(pending_etas, start_time)
+
+        for length in range(self.max_window, self.min_window - 1, -self.step):
+            horizon_end = start_time + num_windows * length
+            # aircrafts overdue from earlier windows are always part of the horizon
+            num_aircraft = bisect_left(pending_etas, horizon_end, start_index)
+            if num_aircraft <= limit:
+                return length
+
+        return self.min_window
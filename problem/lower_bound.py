@@ -0,0 +1,119 @@
+import hashlib
+from collections import OrderedDict
+from problem.acs import ACS
+
+# largest problem whose landing slots are assigned exactly
+ASSIGNMENT_LIMIT = 2000
+
+# number of bounds kept, the least recently used is dropped beyond it
+BOUND_CACHE_SIZE = 256
+
+# bounds already computed, keyed by the instance key and the bound used
+_BOUND_CACHE: OrderedDict = OrderedDict()
+
+
+def instance_key(problem: ACS) -> str:
+    """
+    Returns a key identifying the instance of a problem from the data that defines
+    its cost: the runways, the separation matrix and the airplanes.
+
+    :param problem: The problem
+    :return: The key of the instance
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((problem.no_of_runways, problem.separation_matrix)).encode())
+    for ac in problem.all_ac:
+        digest.update(repr((ac.ac_type, ac.eta_etd, ac.delay_cost)).encode())
+    return digest.hexdigest()
+
+
+def separation_lower_bound(problem: ACS) -> float:
+    """
+    Combinatorial lower bound from the arrival density. Ignoring the order of all_ac,
+    the airplanes are released at their earliest eta_etd and every runway needs at
+    least the smallest separation between landings. The k-th landing over all runways
+    is then no earlier than max(e_k, L_{k - R} + s) for the sorted releases e. Every
+    airplane takes one of these landing slots, so the cheapest assignment of the
+    airplanes to the slots bounds the cost. Delays are measured from the latest
+    eta_etd of each airplane so that the bound holds on runways with different
+    eta_etd. Above ASSIGNMENT_LIMIT airplanes the total delay of the slots is priced
+    at the cheapest delay cost instead.
+
+    :param problem: The problem
+    :return: The lower bound on the cost
+    """
+    if len(problem.all_ac) == 0:
+        return 0.0
+
+    runways = problem.no_of_runways
+    separation = min(min(row) for row in problem.separation_matrix) + 1
+    releases = sorted(min(ac.eta_etd) for ac in problem.all_ac)
+
+    earliest_landing = []
+    for k, release in enumerate(releases):
+        if k >= runways:
+            release = max(release, earliest_landing[k - runways] + separation)
+        earliest_landing.append(release)
+
+    latest_eta = [max(ac.eta_etd) for ac in problem.all_ac]
+    costs = [ac.delay_cost for ac in problem.all_ac]
+    if len(problem.all_ac) > ASSIGNMENT_LIMIT:
+        total_delay = sum(earliest_landing) - sum(latest_eta)
+        return max(0.0, min(costs) * total_delay)
+
+    # imported here so that scipy is only loaded when a bound is computed
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+
+    slot_costs = np.array(costs)[:, None] * np.maximum(
+        0.0, np.array(earliest_landing)[None, :] - np.array(latest_eta)[:, None]
+    )
+    rows, columns = linear_sum_assignment(slot_costs)
+    return float(slot_costs[rows, columns].sum())
+
+
+def lp_lower_bound(problem: ACS) -> float:
+    """
+    Lower bound from the linear relaxation of the model used by the MIPOptimiser,
+    solved with HiGHS.
+
+    :param problem: The problem
+    :return: The lower bound on the cost
+    """
+    # imported here so that scipy is only loaded when the relaxation is used
+    from scipy.optimize import milp
+    from optimisation.mip import assignment_model
+
+    if len(problem.all_ac) == 0:
+        return 0.0
+
+    objective, constraints, _, bounds = assignment_model(problem)
+    result = milp(objective, constraints=constraints, bounds=bounds)
+    if result.x is None:
+        return 0.0
+    return max(0.0, result.fun)
+
+
+def lower_bound(problem: ACS, use_lp: bool = False) -> float:
+    """
+    Returns the best lower bound on the cost of any solution of the problem. The
+    last BOUND_CACHE_SIZE bounds are cached per instance, so repeated calls on the
+    same instance are free.
+
+    :param problem: The problem
+    :param use_lp: Whether the linear relaxation is solved as well
+    :return: The lower bound on the cost
+    """
+    key = (instance_key(problem), use_lp)
+    bound = _BOUND_CACHE.get(key)
+    if bound is not None:
+        _BOUND_CACHE.move_to_end(key)
+        return bound
+
+    bound = separation_lower_bound(problem)
+    if use_lp:
+        bound = max(bound, lp_lower_bound(problem))
+    _BOUND_CACHE[key] = bound
+    if len(_BOUND_CACHE) > BOUND_CACHE_SIZE:
+        _BOUND_CACHE.popitem(last=False)
+    return bound
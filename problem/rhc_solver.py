@@ -1,12 +1,111 @@
-from typing import Any, Dict, Tuple, Type
+import inspect
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
 from copy import deepcopy
+from optimisation.branch_and_bound import BranchAndBoundOptimiser
+from optimisation.fcfs import FCFS
 from optimisation.optimiser import Optimiser
 from problem.acs import ACS
+from problem.horizon_policy import FixedHorizon, HorizonPolicy
+from problem.window_cache import WindowSolutionCache
 
 from problem.acs_solution import ACSolution
 from problem.airplane import Airplane
 
 
+class WindowRecord:
+    """
+    Class to store the telemetry of a single receding horizon window
+
+    Attributes
+    ----------
+    start_time : int
+        Start time of the horizon
+    end_time : int
+        End time of the horizon
+    num_aircraft : int
+        Number of aircrafts in the trimmed problem
+    num_carried_over : int
+        Number of those aircrafts that were carried over from an earlier window
+    num_committed : int
+        Number of aircrafts that were committed in this window
+    solve_time : float
+        Wall time spent by the optimiser on the window in seconds
+    evaluations : int
+        Number of evaluations used by the optimiser on the window
+    committed_cost : float
+        Cost of the aircrafts committed in this window
+    cache_hit : bool
+        Whether the solution of the window was found in the window cache
+    neighbours : int
+        Number of neighbours generated by the optimiser on the window
+    iterations : int
+        Number of iterations of the optimiser on the window
+    improvements : int
+        Number of improvements of the best solution on the window
+    phase_times : Dict[str, float]
+        Time in seconds spent in every phase of the optimiser, empty unless the
+        phase timers are on
+    delta_evaluations : int
+        Number of incremental evaluations used by the optimiser on the window
+    """
+
+    start_time: int
+    end_time: int
+    num_aircraft: int
+    num_carried_over: int
+    num_committed: int
+    solve_time: float
+    evaluations: int
+    committed_cost: float
+    cache_hit: bool
+    neighbours: int
+    iterations: int
+    improvements: int
+    phase_times: Dict[str, float]
+    delta_evaluations: int
+
+    def __init__(
+        self,
+        start_time: int,
+        end_time: int,
+        num_aircraft: int,
+        num_carried_over: int,
+        num_committed: int,
+        solve_time: float,
+        evaluations: int,
+        committed_cost: float,
+        cache_hit: bool = False,
+        neighbours: int = 0,
+        iterations: int = 0,
+        improvements: int = 0,
+        phase_times: Optional[Dict[str, float]] = None,
+        delta_evaluations: int = 0,
+    ):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.num_aircraft = num_aircraft
+        self.num_carried_over = num_carried_over
+        self.num_committed = num_committed
+        self.solve_time = solve_time
+        self.evaluations = evaluations
+        self.committed_cost = committed_cost
+        self.cache_hit = cache_hit
+        self.neighbours = neighbours
+        self.iterations = iterations
+        self.improvements = improvements
+        self.phase_times = phase_times or {}
+        self.delta_evaluations = delta_evaluations
+
+    def __repr__(self):
+        return (
+            f"WindowRecord({self.start_time}-{self.end_time}, "
+            f"{self.num_aircraft} aircrafts, {self.num_carried_over} carried over, "
+            f"{self.solve_time:.4f}s, {self.evaluations} evaluations, "
+            f"cost {self.committed_cost}{', cache hit' if self.cache_hit else ''})"
+        )
+
+
 class RHCSolver(Optimiser[ACSolution]):
     """
     Class to represent the RHCSolver
@@ -16,9 +115,26 @@ class RHCSolver(Optimiser[ACSolution]):
         problem: The problem to be solved
         max_iter_per_horizon: The maximum number of iterations per horizon
         time_window: The time window for the horizon
+        horizon_policy: The policy that sizes each window, fixed to time_window by default
+        exact_window_size: Horizons with at most this many aircrafts are solved with the
+            BranchAndBoundOptimiser instead of the optimiser class
+        exact_optimiser_params: The parameters of the BranchAndBoundOptimiser
+        window_cache: Store of window solutions reused when a window has the same
+            signature as one solved before
+        cache_warm_start: Whether a cached solution is improved on by the optimiser
+            instead of being used directly. It seeds optimisers with a seeds parameter
+            and is kept as the incumbent of the others
+        accepts_seeds: Whether the optimiser class has a seeds parameter
         num_windows: The number of windows in the horizon
         trial_limit: The trial limit for the bee colony optimiser
         max_scouts: The maximum number of scouts for the bee colony optimiser
+        committed_cost: The cost of the aircrafts committed so far
+        window_records: The telemetry recorded for every solved window
+        phase_timers: Whether the phases of the window optimisers are timed
+        window_optimiser: The optimiser of the last window, None if its solution came
+            from the window cache
+        deadline: The perf_counter time after which the window optimisers stop and
+            the windows left are scheduled with FCFS, None for no time limit
     """
 
     def __init__(
@@ -28,6 +144,12 @@ class RHCSolver(Optimiser[ACSolution]):
         num_windows: int,
         optimiser_class: Type[Optimiser[ACSolution]],
         optimiser_params: Dict[str, Any],
+        horizon_policy: Optional[HorizonPolicy] = None,
+        exact_window_size: int = 0,
+        exact_optimiser_params: Optional[Dict[str, Any]] = None,
+        window_cache: Optional[WindowSolutionCache] = None,
+        cache_warm_start: bool = False,
+        phase_timers: bool = False,
     ):
         # Creating a copy of the problem for reference as we may need to change the ac eta_etd
         super().__init__(problem)
@@ -35,17 +157,34 @@ class RHCSolver(Optimiser[ACSolution]):
         self.original_problem = problem
         self.time_window = time_window
         self.num_windows = num_windows
+        self.horizon_policy = horizon_policy or FixedHorizon(time_window)
         self.optimiser_class = optimiser_class
         self.optimiser_params = optimiser_params
+        self.exact_window_size = exact_window_size
+        self.exact_optimiser_params = exact_optimiser_params or {}
+        self.window_cache = window_cache
+        self.cache_warm_start = cache_warm_start
+        self.accepts_seeds = "seeds" in inspect.signature(optimiser_class).parameters
         self.scheduled = set()
+        self.carried_over = set()
+        self.committed_cost = 0.0
+        self.window_records: List[WindowRecord] = []
+        self.phase_timers = phase_timers
+        self.window_optimiser: Optional[Optimiser[ACSolution]] = None
+        # key: airplane, value the time and runway assigned to it
+        self.solution_map: Dict[Airplane, Tuple[int, int]] = {}
+
+        # mapping from the copied aircrafts to the originals, whose eta_etd is never changed
+        self.original_ac = dict(zip(self.problem.all_ac, self.original_problem.all_ac))
 
         # beginning and end of the time horizon
-        self.time_start = min([min(ac.eta_etd) for ac in self.problem.all_ac])
-        self.time_end = max([min(ac.eta_etd) for ac in self.problem.all_ac])
+        self.time_start = min([min(ac.eta_etd) for ac in self.problem.all_ac], default=0)
+        self.time_end = max([min(ac.eta_etd) for ac in self.problem.all_ac], default=0)
 
     def trim_problem(self, start_time: int, end_time: int) -> ACS:
         """
-        Selects the aircrafts that are to be scheduled in the current horizon
+        Selects the aircrafts that are to be scheduled in the current horizon. Aircrafts
+        left unscheduled before start_time are part of the horizon as well.
 
         :param start_time: The start time of the horizon
         :param end_time: The end time of the horizon
@@ -55,8 +194,7 @@ class RHCSolver(Optimiser[ACSolution]):
         landing_ac = [
             ac
             for ac in self.problem.landing_ac
-            if min(ac.eta_etd) >= start_time
-            and min(ac.eta_etd) < end_time
+            if min(ac.eta_etd) < end_time
             and ac not in self.scheduled
         ]
 
@@ -66,68 +204,234 @@ class RHCSolver(Optimiser[ACSolution]):
             self.problem.separation_matrix,
             landing_ac,
             [],
+            self.problem.fitness_cache_size,
         )
+        new_acs.instrument(self.problem.instrumented)
 
         return new_acs
 
+    def pending_etas(self) -> List[int]:
+        """
+        Returns the sorted earliest eta_etd of the aircrafts yet to be scheduled
+
+        :return: The sorted earliest eta_etd
+        """
+        return sorted(
+            min(ac.eta_etd) for ac in self.problem.landing_ac if ac not in self.scheduled
+        )
+
+    def commit_cost(self, ac: Airplane, time: float, runway: int) -> float:
+        """
+        Returns the cost of committing an aircraft to a landing time and runway. The
+        cost is measured against the original eta_etd of the aircraft.
+
+        :param ac: The aircraft being committed
+        :param time: The landing time assigned to the aircraft
+        :param runway: The runway assigned to the aircraft
+        :return: The cost of the aircraft
+        """
+        original_ac = self.original_ac[ac]
+        return max(0, (time - original_ac.eta_etd[runway - 1]) * original_ac.delay_cost)
+
+    def load_until(self, end_time: int) -> None:
+        """
+        Makes sure all aircrafts with an eta_etd before end_time are part of the
+        problem. All aircrafts are known from the start, so there is nothing to load.
+
+        :param end_time: The end time of the horizon
+        """
+
+    def commit(self, ac: Airplane, landing_time: int, runway: int) -> float:
+        """
+        Commits an aircraft to a landing time and runway
+
+        :param ac: The aircraft being committed
+        :param landing_time: The landing time assigned to the aircraft
+        :param runway: The runway assigned to the aircraft
+        :return: The cost of the aircraft
+        """
+        self.solution_map[ac] = (landing_time, runway)
+        self.scheduled.add(ac)
+        return self.commit_cost(ac, landing_time, runway)
+
     def construct_solution(
         self, solution_map: Dict[Airplane, Tuple[int, int]]
     ) -> ACSolution:
         """
-        Constructs an ACS Solution from the solution map
+        Constructs an ACS Solution from the solution map. The runways and landing
+        times are ordered as the committed aircrafts of the original problem, which
+        are the aircraft sequence of the solution, and the fitness is the cost
+        accumulated while committing the aircrafts.
 
         :param solution_map: The solution map
         :return: The ACS Solution
         """
+        committed = [ac for ac in self.problem.all_ac if ac in solution_map]
         solution = self.problem.generate_empty_solution()
-        solution.value = []
+        solution.value = [solution_map[ac][1] for ac in committed]
+        solution.fitness = self.committed_cost
+        solution.landing_times = [solution_map[ac][0] for ac in committed]
+        # Setting the correct aircraft sequence, the originals keep their eta_etd
+        solution.aircraft_sequence = [self.original_ac[ac] for ac in committed]
+        return solution
 
-        for _, (_, runway) in solution_map.items():
-            solution.value.append(runway)
+    def solve_window(
+        self, trimmed_acs: ACS, start_time: int
+    ) -> Tuple[ACSolution, bool]:
+        """
+        Solves the trimmed problem of a window. Small windows are solved exactly and
+        the rest with the optimiser class. With a window cache, a cached solution of
+        the same signature is used directly or, with cache_warm_start, as a seed or
+        incumbent of the optimiser, and the solution found is stored. The window
+        optimiser stops at the deadline, after which windows are scheduled with FCFS
+        and no solution is stored.
 
-        # Calculating the fitness of the solution based on original problem
-        solution.fitness = self.original_problem.evaluate(solution.value)
-        # Setting the correct aircraft sequence
-        solution.aircraft_sequence = self.original_problem.all_ac
-        return solution
+        :param trimmed_acs: The trimmed problem of the window
+        :param start_time: The start time of the window
+        :return: The solution and whether it came from the window cache
+        """
+        signature, order, cached = None, None, None
+        self.window_optimiser = None
+        if self.window_cache is not None:
+            signature, order = self.window_cache.signature(trimmed_acs, start_time)
+            value = self.window_cache.get(signature)
+            if value is not None:
+                value = trimmed_acs.canonical(
+                    self.window_cache.from_signature_order(value, order)
+                )
+                cached = ACSolution(
+                    value, trimmed_acs.evaluate(value), trimmed_acs.all_ac
+                )
+                if not self.cache_warm_start:
+                    return cached, True
+
+        if self.out_of_time():
+            optimiser = FCFS(trimmed_acs)
+        elif len(trimmed_acs.all_ac) <= self.exact_window_size:
+            optimiser = BranchAndBoundOptimiser(
+                trimmed_acs, **self.exact_optimiser_params
+            )
+        elif cached is not None and self.accepts_seeds:
+            optimiser = self.optimiser_class(
+                trimmed_acs, **self.optimiser_params, seeds=[cached]
+            )
+        else:
+            optimiser = self.optimiser_class(trimmed_acs, **self.optimiser_params)
+        optimiser.enable_phase_timers(self.phase_timers)
+        optimiser.deadline = self.deadline
+        self.window_optimiser = optimiser
+        solution = optimiser.optimise()
+        # the cached solution is the incumbent of optimisers that take no seeds
+        if cached is not None and cached.fitness < solution.fitness:
+            solution = cached
+
+        # a solution cut short by the deadline is not stored
+        if signature is not None and not self.out_of_time():
+            self.window_cache.put(
+                signature,
+                self.window_cache.to_signature_order(solution.value, order),
+                solution.fitness,
+            )
+        return solution, cached is not None
+
+    def evaluation_count(self) -> int:
+        """
+        Returns the number of evaluations of the windows solved so far, whole and
+        incremental
+
+        :return: The number of evaluations
+        """
+        return sum(
+            record.evaluations + record.delta_evaluations
+            for record in self.window_records
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Aggregates the telemetry of the windows solved so far, e.g. to export the
+        metrics of a run
+
+        :return: The totals over the windows, with the phase times summed by phase
+        """
+        phase_times: Dict[str, float] = {}
+        for record in self.window_records:
+            for phase, seconds in record.phase_times.items():
+                phase_times[phase] = phase_times.get(phase, 0.0) + seconds
+        return {
+            "windows": len(self.window_records),
+            "cache_hits": sum(record.cache_hit for record in self.window_records),
+            "committed": sum(record.num_committed for record in self.window_records),
+            "committed_cost": self.committed_cost,
+            "solve_time": sum(record.solve_time for record in self.window_records),
+            "evaluations": sum(record.evaluations for record in self.window_records),
+            "delta_evaluations": sum(
+                record.delta_evaluations for record in self.window_records
+            ),
+            "neighbours": sum(record.neighbours for record in self.window_records),
+            "iterations": sum(record.iterations for record in self.window_records),
+            "improvements": sum(
+                record.improvements for record in self.window_records
+            ),
+            "phase_times": phase_times,
+        }
 
     def optimise(self):
-        # initialise the solution map key: airplane, value the time and runway assigned to it
-        scheduled_acs: Dict[Airplane, Tuple[int, int]] = dict()
+        self.solution_map = {}
         run = 0
-        for t in range(
-            self.time_start,
-            self.time_end + (self.num_windows * self.time_window) + 1,
-            self.time_window,
-        ):
+        t = self.time_start
+        pending_etas = self.pending_etas()
+        while len(pending_etas) > 0:
             run += 1
             # Initialising horizon bounds
+            time_window = self.horizon_policy.window_length(
+                t, self.num_windows, pending_etas, self.window_records
+            )
             horizon_start = t
-            horizon_end = t + self.num_windows * self.time_window
+            horizon_end = t + self.num_windows * time_window
+            t += time_window
 
             # initialise the trimmed problem: Consider only aircraft contained in the horizon
+            self.load_until(horizon_end)
             trimmed_acs = self.trim_problem(horizon_start, horizon_end)
             if len(trimmed_acs.all_ac) == 0:
-                break
-
-            # initialise the bee colony optimiser
-            optimiser = self.optimiser_class(trimmed_acs, **self.optimiser_params)
+                # skipping the empty windows up to the next aircraft
+                t += (pending_etas[0] - t) // time_window * time_window
+                continue
 
             # Finding a solution for the trimmed problem
-            solution = optimiser.optimise()
+            solve_start = time.perf_counter()
+            solution, cache_hit = self.solve_window(trimmed_acs, horizon_start)
+            record = WindowRecord(
+                horizon_start,
+                horizon_end,
+                len(trimmed_acs.all_ac),
+                sum(ac in self.carried_over for ac in trimmed_acs.all_ac),
+                0,
+                time.perf_counter() - solve_start,
+                trimmed_acs.evaluations,
+                0.0,
+                cache_hit,
+                trimmed_acs.neighbours,
+                delta_evaluations=trimmed_acs.delta_evaluations,
+            )
+            optimiser = self.window_optimiser
+            if optimiser is not None:
+                record.iterations = optimiser.iterations
+                record.improvements = optimiser.improvements
+                record.phase_times = dict(optimiser.phase_times or {})
 
             # Finding the assigned landing times and runways for the aircrafts
             landing_times = trimmed_acs.get_landing_times(solution.value)
-            schedule_window_end = horizon_start + self.time_window
+            schedule_window_end = horizon_start + time_window
 
             # Arrays to maintain the last landing time and type for each runway
             last_runway_landing_time = [0] * trimmed_acs.no_of_runways
             last_runway_landing_type = [0] * trimmed_acs.no_of_runways
 
             for i in range(len(solution.value)):
-                time, runway = landing_times[i]
+                landing_time, runway = landing_times[i]
 
-                if time > schedule_window_end:
+                if landing_time > schedule_window_end:
                     # If the landing time is outside the window, we need to update
                     # the eta_etd to lie in the next window
                     for j in range(trimmed_acs.no_of_runways):
@@ -141,12 +445,23 @@ class RHCSolver(Optimiser[ACSolution]):
                                 trimmed_acs.all_ac[i].eta_etd[j],
                             )
                         )
+                    self.carried_over.add(trimmed_acs.all_ac[i])
                 else:
                     # If the landing time is within the window, we can schedule the aircraft
-                    scheduled_acs[trimmed_acs.all_ac[i]] = landing_times[i]
-                    self.scheduled.add(trimmed_acs.all_ac[i])
-                    last_runway_landing_time[runway - 1] = time
+                    last_runway_landing_time[runway - 1] = landing_time
                     last_runway_landing_type[runway - 1] = trimmed_acs.all_ac[i].ac_type
 
+                    record.num_committed += 1
+                    record.committed_cost += self.commit(
+                        trimmed_acs.all_ac[i], landing_time, runway
+                    )
+
+            self.committed_cost += record.committed_cost
+            self.window_records.append(record)
+            self.end_iteration()
+            pending_etas = self.pending_etas()
+
         # Constructing the solution from the solution map
-        return self.construct_solution(scheduled_acs)
+        solution = self.construct_solution(self.solution_map)
+        self.report_improvement(solution.fitness)
+        return solution
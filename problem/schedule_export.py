@@ -0,0 +1,213 @@
+from typing import Dict, List, Optional, TextIO
+import numpy as np
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+from problem.airplane import Airplane
+
+# Columns of an exported schedule, one row per aircraft
+SCHEDULE_COLUMNS = ["id", "model", "type", "runway", "landing_time", "delay", "cost"]
+
+
+def schedule_dtype(model_width: int) -> np.dtype:
+    """
+    Returns the dtype of a schedule exported as a structured NumPy array
+
+    :param model_width: The length of the longest model name
+    :return: The dtype, with one field per column of SCHEDULE_COLUMNS
+    """
+    return np.dtype(
+        [
+            ("id", np.int64),
+            ("model", f"U{max(model_width, 1)}"),
+            ("type", np.int64),
+            ("runway", np.int64),
+            ("landing_time", np.float64),
+            ("delay", np.float64),
+            ("cost", np.float64),
+        ]
+    )
+
+
+def schedule_columns(
+    aircraft: List[Airplane],
+    runways: List[int],
+    landing_times: List[float],
+) -> Dict[str, np.ndarray]:
+    """
+    Builds the columns of a schedule. The delay is measured from the eta_etd of the
+    aircraft on its runway and the cost is the delay cost of a positive delay.
+
+    :param aircraft: The aircrafts of the schedule
+    :param runways: The runway of every aircraft, starting at 1
+    :param landing_times: The landing time of every aircraft
+    :return: The columns of the schedule, keyed by SCHEDULE_COLUMNS
+    """
+    runway_array = np.asarray(runways, dtype=np.int64)
+    landing_array = np.asarray(landing_times, dtype=np.float64)
+    eta = np.array([ac.eta_etd for ac in aircraft], dtype=np.float64)
+    eta = eta.reshape(len(aircraft), -1)
+    delay = landing_array - eta[np.arange(len(aircraft)), runway_array - 1]
+    delay_costs = np.array([ac.delay_cost for ac in aircraft], dtype=np.float64)
+    return {
+        "id": np.arange(len(aircraft)),
+        "model": np.array([ac.model for ac in aircraft], dtype=str),
+        "type": np.array([ac.ac_type for ac in aircraft], dtype=np.int64),
+        "runway": runway_array,
+        "landing_time": landing_array,
+        "delay": delay,
+        "cost": np.maximum(0.0, delay * delay_costs),
+    }
+
+
+def solution_columns(
+    solution: ACSolution, problem: Optional[ACS] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Builds the columns of the schedule of a solution. The landing times of the
+    solution are used if it has them, e.g. from RHCSolver, otherwise they are
+    computed with the problem.
+
+    :param solution: The solution
+    :param problem: The problem of the solution, needed without landing times
+    :return: The columns of the schedule, keyed by SCHEDULE_COLUMNS
+    """
+    aircraft = getattr(solution, "aircraft_sequence", None)
+    landing_times = getattr(solution, "landing_times", None)
+    if problem is None and (not aircraft or landing_times is None):
+        raise ValueError("the problem is needed for a solution without a schedule")
+    if not aircraft:
+        aircraft = problem.all_ac
+    if len(aircraft) != len(solution.value):
+        raise ValueError(
+            f"the solution assigns {len(solution.value)} aircrafts but lists "
+            f"{len(aircraft)} in its aircraft sequence"
+        )
+    if landing_times is None:
+        landing_times = [time for time, _ in problem.get_landing_times(solution.value)]
+    return schedule_columns(aircraft, solution.value, landing_times)
+
+
+def export_schedule(
+    path: str, solution: ACSolution, problem: Optional[ACS] = None
+) -> None:
+    """
+    Writes the schedule of a solution to a csv file, or to a structured NumPy array
+    if the path ends with .npy
+
+    :param path: Path of the file
+    :param solution: The solution
+    :param problem: The problem of the solution, needed without landing times
+    """
+    columns = solution_columns(solution, problem)
+    if path.endswith(".npy"):
+        model_width = max((len(model) for model in columns["model"]), default=1)
+        array = np.empty(len(columns["id"]), dtype=schedule_dtype(model_width))
+        for name in SCHEDULE_COLUMNS:
+            array[name] = columns[name]
+        np.save(path, array)
+    else:
+        # imported here so that pandas is only loaded for csv schedules
+        import pandas as pd
+
+        pd.DataFrame(columns, columns=SCHEDULE_COLUMNS).to_csv(path, index=False)
+
+
+class ScheduleWriter:
+    """
+    Class to write a schedule to a csv file incrementally, e.g. as the commit
+    callback of a StreamingRHCSolver or for the results of solve_batch. Rows are
+    buffered and formatted in batches of buffer_size.
+
+    Attributes
+    ----------
+    path : str
+        Path of the csv file
+    buffer_size : int
+        The number of rows buffered before they are written
+    num_rows : int
+        The number of rows written so far
+    """
+
+    def __init__(self, path: str, buffer_size: int = 10000):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.num_rows = 0
+        self.file: Optional[TextIO] = open(path, "w", encoding="utf-8", newline="")
+        self.file.write(",".join(SCHEDULE_COLUMNS) + "\n")
+        self.aircraft: List[Airplane] = []
+        self.runways: List[int] = []
+        self.landing_times: List[float] = []
+
+    def __call__(
+        self, ac: Airplane, landing_time: float, runway: int, cost: float = 0.0
+    ) -> None:
+        """
+        Adds an aircraft to the schedule. The arguments match the commit callback
+        of StreamingRHCSolver, the cost is computed again from the delay.
+
+        :param ac: The aircraft
+        :param landing_time: The landing time of the aircraft
+        :param runway: The runway of the aircraft
+        :param cost: The cost of the aircraft
+        """
+        self.aircraft.append(ac)
+        self.runways.append(runway)
+        self.landing_times.append(landing_time)
+        if len(self.aircraft) >= self.buffer_size:
+            self.flush()
+
+    def write_solution(
+        self, solution: ACSolution, problem: Optional[ACS] = None
+    ) -> None:
+        """
+        Adds the schedule of a whole solution
+
+        :param solution: The solution
+        :param problem: The problem of the solution, needed without landing times
+        """
+        self.flush()
+        self.write_columns(solution_columns(solution, problem))
+
+    def write_columns(self, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Writes the columns of a schedule, numbering the aircrafts on from the rows
+        already written
+
+        :param columns: The columns of the schedule
+        """
+        # imported here so that pandas is only loaded for csv schedules
+        import pandas as pd
+
+        num_rows = len(columns["id"])
+        columns["id"] = np.arange(self.num_rows, self.num_rows + num_rows)
+        pd.DataFrame(columns, columns=SCHEDULE_COLUMNS).to_csv(
+            self.file, index=False, header=False
+        )
+        self.num_rows += num_rows
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows
+        """
+        if len(self.aircraft) == 0:
+            return
+        self.write_columns(
+            schedule_columns(self.aircraft, self.runways, self.landing_times)
+        )
+        self.aircraft, self.runways, self.landing_times = [], [], []
+
+    def close(self) -> None:
+        """
+        Writes the buffered rows and closes the file
+        """
+        if self.file is None:
+            return
+        self.flush()
+        self.file.close()
+        self.file = None
+
+    def __enter__(self) -> "ScheduleWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
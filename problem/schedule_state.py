@@ -0,0 +1,226 @@
+from bisect import bisect_left, insort
+from typing import List, Optional, Tuple
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+
+
+class ScheduleState:
+    """
+    Class to evaluate changes to a runway assignment incrementally. A change to a
+    runway only affects the airplanes after it on that runway, and only until their
+    landing times are the same as before, so a move costs as much as the number of
+    airplanes it actually delays or advances. Every move evaluated is counted in
+    the delta_evaluations of an instrumented problem.
+
+    Attributes
+    ----------
+    problem : ACS
+        The problem the assignment belongs to
+    value : List[int]
+        The runway assigned to every airplane of all_ac
+    runways : List[List[int]]
+        The indices of the airplanes on every runway, in landing order
+    landing_times : List[float]
+        The landing time of every airplane
+    costs : List[float]
+        The cost of every airplane
+    fitness : float
+        The cost of the assignment
+    counted : bool
+        Whether the evaluated moves are counted, as the problem was instrumented
+    """
+
+    def __init__(self, problem: ACS, value: List[int]):
+        self.problem = problem
+        self.value = list(value)
+        self.eta = [ac.eta_etd for ac in problem.all_ac]
+        self.types = [ac.ac_type - 1 for ac in problem.all_ac]
+        self.delay_costs = [ac.delay_cost for ac in problem.all_ac]
+        self.separation = problem.separation_matrix
+        self.counted = problem.instrumented
+
+        self.runways: List[List[int]] = [[] for _ in range(problem.no_of_runways)]
+        for i, runway in enumerate(self.value):
+            self.runways[runway - 1].append(i)
+
+        self.landing_times = [time for time, _ in problem.get_landing_times(self.value)]
+        self.costs = [
+            max(
+                0,
+                (self.landing_times[i] - self.eta[i][runway - 1]) * self.delay_costs[i],
+            )
+            for i, runway in enumerate(self.value)
+        ]
+        self.fitness = sum(self.costs)
+
+    def runway_delta(
+        self, runway: int, remove: Optional[int] = None, insert: Optional[int] = None
+    ) -> Tuple[float, List[Tuple[int, float]]]:
+        """
+        Computes the change of cost of a runway when an airplane is removed from it
+        and another one is added to it, without changing the state.
+
+        :param runway: The runway that changes
+        :param remove: The airplane leaving the runway
+        :param insert: The airplane joining the runway
+        :return: The change of cost and the new landing times of the affected airplanes
+        """
+        r = runway - 1
+        sequence = self.runways[r]
+        positions = []
+        if remove is not None:
+            positions.append(bisect_left(sequence, remove))
+        if insert is not None:
+            positions.append(bisect_left(sequence, insert))
+        k = min(positions)
+
+        previous = sequence[k - 1] if k > 0 else None
+        previous_time = self.landing_times[previous] if previous is not None else 0.0
+        inserted = insert is None
+        removed = remove is None
+        delta = 0.0
+        updates = []
+
+        while True:
+            if not inserted and (k >= len(sequence) or sequence[k] > insert):
+                i = insert
+                inserted = True
+            elif k < len(sequence):
+                i = sequence[k]
+                k += 1
+                if i == remove:
+                    delta -= self.costs[i]
+                    removed = True
+                    continue
+            else:
+                break
+
+            if previous is None:
+                time = self.eta[i][r]
+            else:
+                separation = self.separation[self.types[previous]][self.types[i]]
+                time = max(self.eta[i][r], previous_time + separation + 1)
+
+            if i != insert and time == self.landing_times[i]:
+                if inserted and removed:
+                    # the rest of the runway lands as before
+                    break
+            else:
+                cost = max(0, (time - self.eta[i][r]) * self.delay_costs[i])
+                delta += cost if i == insert else cost - self.costs[i]
+                updates.append((i, time))
+
+            previous, previous_time = i, time
+
+        return delta, updates
+
+    def apply(
+        self,
+        runway: int,
+        updates: List[Tuple[int, float]],
+        remove: Optional[int] = None,
+        insert: Optional[int] = None,
+    ) -> None:
+        """
+        Applies a change computed by runway_delta to the state. The airplanes that
+        leave a runway must be detached beforehand.
+
+        :param runway: The runway that changes
+        :param updates: The new landing times returned by runway_delta
+        :param remove: The airplane leaving the runway
+        :param insert: The airplane joining the runway
+        """
+        r = runway - 1
+        if remove is not None:
+            self.runways[r].remove(remove)
+        if insert is not None:
+            insort(self.runways[r], insert)
+            self.value[insert] = runway
+
+        for i, time in updates:
+            cost = max(0, (time - self.eta[i][r]) * self.delay_costs[i])
+            self.fitness += cost - self.costs[i]
+            self.landing_times[i] = time
+            self.costs[i] = cost
+
+    def detach(self, i: int) -> None:
+        """
+        Removes the cost of an airplane that is about to change runway
+
+        :param i: The index of the airplane in all_ac
+        """
+        self.fitness -= self.costs[i]
+        self.costs[i] = 0.0
+
+    def reassign_delta(self, i: int, runway: int) -> float:
+        """
+        Returns the change of cost when airplane i moves to another runway
+
+        :param i: The index of the airplane in all_ac
+        :param runway: The new runway of the airplane
+        :return: The change of cost
+        """
+        if runway == self.value[i]:
+            return 0.0
+        if self.counted:
+            self.problem.delta_evaluations += 1
+        removed, _ = self.runway_delta(self.value[i], remove=i)
+        inserted, _ = self.runway_delta(runway, insert=i)
+        return removed + inserted
+
+    def reassign(self, i: int, runway: int) -> None:
+        """
+        Moves airplane i to another runway
+
+        :param i: The index of the airplane in all_ac
+        :param runway: The new runway of the airplane
+        """
+        old_runway = self.value[i]
+        if runway == old_runway:
+            return
+        _, removed = self.runway_delta(old_runway, remove=i)
+        _, inserted = self.runway_delta(runway, insert=i)
+        self.detach(i)
+        self.apply(old_runway, removed, remove=i)
+        self.apply(runway, inserted, insert=i)
+
+    def swap_delta(self, i: int, j: int) -> float:
+        """
+        Returns the change of cost when airplanes i and j exchange their runways
+
+        :param i: The index of the first airplane in all_ac
+        :param j: The index of the second airplane in all_ac
+        :return: The change of cost
+        """
+        if self.value[i] == self.value[j]:
+            return 0.0
+        if self.counted:
+            self.problem.delta_evaluations += 1
+        first, _ = self.runway_delta(self.value[i], remove=i, insert=j)
+        second, _ = self.runway_delta(self.value[j], remove=j, insert=i)
+        return first + second
+
+    def swap(self, i: int, j: int) -> None:
+        """
+        Exchanges the runways of airplanes i and j
+
+        :param i: The index of the first airplane in all_ac
+        :param j: The index of the second airplane in all_ac
+        """
+        runway_i, runway_j = self.value[i], self.value[j]
+        if runway_i == runway_j:
+            return
+        _, first = self.runway_delta(runway_i, remove=i, insert=j)
+        _, second = self.runway_delta(runway_j, remove=j, insert=i)
+        self.detach(i)
+        self.detach(j)
+        self.apply(runway_i, first, remove=i, insert=j)
+        self.apply(runway_j, second, remove=j, insert=i)
+
+    def solution(self) -> ACSolution:
+        """
+        Returns the assignment as a solution of the problem
+
+        :return: The solution
+        """
+        return ACSolution(list(self.value), self.fitness, self.problem.all_ac)
@@ -0,0 +1,141 @@
+from copy import copy
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
+from optimisation.optimiser import Optimiser
+from problem.acs import ACS
+from problem.acs_solution import ACSolution
+from problem.airplane import Airplane
+from problem.rhc_solver import RHCSolver
+
+# Called with the aircraft, its landing time, runway and cost when it is committed
+CommitCallback = Callable[[Airplane, int, int, float], None]
+
+
+class StreamingRHCSolver(RHCSolver):
+    """
+    Class to solve a stream of aircrafts with receding horizon control, for traffic
+    that does not fit in memory. The aircrafts arrive in chunks in order of their
+    earliest eta_etd, e.g. from read_input_chunks or read_csv_chunks. Chunks are
+    only read once the horizon reaches them, and committed aircrafts are handed to
+    the commit callback and dropped, so only the aircrafts of the current horizon
+    and the rest of the last chunk are kept.
+
+    Attributes:
+        chunks: The iterator over the chunks of aircrafts
+        on_commit: The function called for every committed aircraft
+        num_committed: The number of aircrafts committed so far
+        exhausted: Whether all chunks have been read
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[List[Airplane]],
+        no_of_runways: int,
+        no_of_ac_types: int,
+        separation_matrix: List[List[float]],
+        time_window: int,
+        num_windows: int,
+        optimiser_class: Type[Optimiser[ACSolution]],
+        optimiser_params: Dict[str, Any],
+        on_commit: Optional[CommitCallback] = None,
+        **kwargs,
+    ):
+        problem = ACS(no_of_runways, no_of_ac_types, separation_matrix, [], [])
+        super().__init__(
+            problem,
+            time_window,
+            num_windows,
+            optimiser_class,
+            optimiser_params,
+            **kwargs,
+        )
+        self.chunks: Iterator[List[Airplane]] = iter(chunks)
+        self.on_commit = on_commit
+        self.num_committed = 0
+        self.exhausted = False
+
+        if self.read_chunk():
+            self.time_start = min(min(ac.eta_etd) for ac in self.problem.landing_ac)
+
+    def read_chunk(self) -> bool:
+        """
+        Adds the next chunk of aircrafts to the problem. The eta_etd of the carried
+        over aircrafts is changed in place, so a copy keeps the original one.
+
+        :return: Whether a chunk was read
+        """
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.exhausted = True
+            return False
+        for ac in chunk:
+            original_ac = copy(ac)
+            original_ac.eta_etd = list(ac.eta_etd)
+            self.original_ac[ac] = original_ac
+        self.problem.landing_ac.extend(chunk)
+        return True
+
+    def drop_committed(self) -> None:
+        """
+        Removes the committed aircrafts from the problem
+        """
+        self.problem.landing_ac = [
+            ac for ac in self.problem.landing_ac if ac not in self.scheduled
+        ]
+        self.scheduled.clear()
+
+    def load_until(self, end_time: int) -> None:
+        """
+        Drops the committed aircrafts and reads chunks until an aircraft with an
+        eta_etd of at least end_time has been read or the stream ends
+
+        :param end_time: The end time of the horizon
+        """
+        self.drop_committed()
+        while not self.exhausted and (
+            len(self.problem.landing_ac) == 0
+            or min(self.problem.landing_ac[-1].eta_etd) < end_time
+        ):
+            self.read_chunk()
+
+    def pending_etas(self) -> List[int]:
+        """
+        Returns the sorted earliest eta_etd of the aircrafts read and not yet
+        committed, reading the next chunk if there are none
+
+        :return: The sorted earliest eta_etd
+        """
+        pending = super().pending_etas()
+        if len(pending) == 0 and not self.exhausted:
+            self.load_until(0)
+            pending = super().pending_etas()
+        return pending
+
+    def commit(self, ac: Airplane, landing_time: int, runway: int) -> float:
+        """
+        Commits an aircraft and hands it to the commit callback. The aircraft is
+        dropped from the problem before the next window.
+
+        :param ac: The aircraft being committed
+        :param landing_time: The landing time assigned to the aircraft
+        :param runway: The runway assigned to the aircraft
+        :return: The cost of the aircraft
+        """
+        cost = self.commit_cost(ac, landing_time, runway)
+        original_ac = self.original_ac.pop(ac)
+        self.scheduled.add(ac)
+        self.carried_over.discard(ac)
+        self.num_committed += 1
+        if self.on_commit is not None:
+            self.on_commit(original_ac, landing_time, runway, cost)
+        return cost
+
+    def construct_solution(self, solution_map) -> ACSolution:
+        """
+        Returns the cost of the committed aircrafts. The schedule itself was handed
+        to the commit callback, so the value of the solution is None.
+
+        :param solution_map: The solution map, empty as nothing is kept
+        :return: The ACS Solution
+        """
+        self.drop_committed()
+        return ACSolution(None, self.committed_cost, [])
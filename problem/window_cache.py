@@ -0,0 +1,149 @@
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from typing import List, Optional, Tuple
+from problem.acs import ACS
+
+
+class WindowSolutionCache:
+    """
+    Class to keep the solutions of receding horizon windows on disk, so that windows
+    with the same traffic on another day reuse them. A window is keyed by its
+    signature: the number of runways, the separation matrix and the sorted list of
+    the type, delay cost and eta_etd relative to the window start rounded down to
+    eta_quantum seconds of every aircraft. Sorting makes the signature independent of
+    the order of aircraft that tie on ending_time, so solutions are stored in the
+    order of the signature and mapped back to all_ac. The store is an sqlite
+    database that keeps at most max_entries solutions and evicts the least recently
+    used ones.
+
+    Attributes
+    ----------
+    path : str
+        Path of the sqlite database
+    max_entries : int
+        The maximum number of solutions kept
+    eta_quantum : int
+        The length in seconds of the eta_etd buckets of the signature
+    hits : int
+        The number of lookups answered from the cache
+    misses : int
+        The number of lookups not found in the cache
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, eta_quantum: int = 30):
+        self.path = path
+        self.max_entries = max_entries
+        self.eta_quantum = eta_quantum
+        self.hits = 0
+        self.misses = 0
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS windows ("
+                "signature TEXT PRIMARY KEY, value TEXT, fitness REAL, last_used REAL)"
+            )
+
+    def signature(self, problem: ACS, start_time: int) -> Tuple[str, List[int]]:
+        """
+        Returns the signature of a window and the order of all_ac it lists the
+        aircraft in
+
+        :param problem: The trimmed problem of the window
+        :param start_time: The start time of the window
+        :return: The signature and the indices in all_ac in the order of the signature
+        """
+        traffic = [
+            (
+                ac.ac_type,
+                ac.delay_cost,
+                [(eta - start_time) // self.eta_quantum for eta in ac.eta_etd],
+            )
+            for ac in problem.all_ac
+        ]
+        order = sorted(range(len(traffic)), key=traffic.__getitem__)
+        content = json.dumps(
+            [
+                problem.no_of_runways,
+                problem.separation_matrix,
+                [traffic[i] for i in order],
+            ]
+        )
+        return hashlib.sha256(content.encode()).hexdigest(), order
+
+    @staticmethod
+    def to_signature_order(value: List[int], order: List[int]) -> List[int]:
+        """
+        Reorders the value of a solution from all_ac to the order of the signature
+
+        :param value: The value of the solution in the order of all_ac
+        :param order: The order returned with the signature
+        :return: The value in the order of the signature
+        """
+        return [value[i] for i in order]
+
+    @staticmethod
+    def from_signature_order(value: List[int], order: List[int]) -> List[int]:
+        """
+        Reorders the value of a solution from the order of the signature to all_ac
+
+        :param value: The value of the solution in the order of the signature
+        :param order: The order returned with the signature
+        :return: The value in the order of all_ac
+        """
+        restored = [0] * len(value)
+        for runway, i in zip(value, order):
+            restored[i] = runway
+        return restored
+
+    def get(self, signature: str) -> Optional[List[int]]:
+        """
+        Returns the solution stored for a signature and marks it as recently used
+
+        :param signature: The signature of the window
+        :return: The value of the solution, None if the signature is not cached
+        """
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            row = connection.execute(
+                "SELECT value FROM windows WHERE signature = ?", (signature,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute(
+                "UPDATE windows SET last_used = ? WHERE signature = ?",
+                (time.time(), signature),
+            )
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, signature: str, value: List[int], fitness: float) -> None:
+        """
+        Stores the solution of a window unless a cheaper one is stored already, and
+        evicts the least recently used solutions beyond max_entries
+
+        :param signature: The signature of the window
+        :param value: The value of the solution
+        :param fitness: The fitness of the solution
+        """
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            connection.execute(
+                "INSERT INTO windows VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(signature) DO UPDATE SET "
+                "value = excluded.value, fitness = excluded.fitness, "
+                "last_used = excluded.last_used "
+                "WHERE excluded.fitness < windows.fitness",
+                (signature, json.dumps(value), fitness, time.time()),
+            )
+            (count,) = connection.execute("SELECT COUNT(*) FROM windows").fetchone()
+            if count > self.max_entries:
+                connection.execute(
+                    "DELETE FROM windows WHERE signature IN ("
+                    "SELECT signature FROM windows ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def __len__(self) -> int:
+        with closing(sqlite3.connect(self.path)) as connection:
+            return connection.execute("SELECT COUNT(*) FROM windows").fetchone()[0]
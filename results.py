@@ -4,17 +4,24 @@ import numpy as np
 import sys
 from typing import Any
 
-import matplotlib.pyplot as plt
 from optimisation import optimiser
 from optimisation.fcfs import FCFS
 from optimisation.bee_colony_optimiser import BeeColonyOptimiser
 from optimisation.ga import GeneticOptimiser
 from problem.acs import ACS
 from problem.rhc_solver import RHCSolver
-from utils.input import make_input_from_csv, read_input
+from utils.input import (
+    INSTANCE_CACHE_DIR,
+    load_acs_from_csv,
+    make_input_from_csv,
+    read_input,
+)
 
 
 def generate_and_save_plot(x, y, title, x_label, y_label, file_name):
+    # imported here so that matplotlib is only loaded when a plot is drawn
+    import matplotlib.pyplot as plt
+
     plt.plot(x, y)
     plt.title(title)
     plt.xlabel(x_label)
@@ -74,14 +81,17 @@ def generate_bco_results(
 
 
 def compare_optimizers(csv_filename: list[str], with_rhc: bool = False):
+    # imported here so that matplotlib is only loaded when a plot is drawn
+    import matplotlib.pyplot as plt
+
     number_of_aircrafts = []
     time_array = [[], [], []]
     cost = [[], [], []]
 
     for filename in csv_filename:
-        make_input_from_csv(filename, num_runways=3)
-        ac_input = read_input()
-        asp = ACS(*ac_input)
+        asp = load_acs_from_csv(
+            filename, num_runways=3, cache_dir=INSTANCE_CACHE_DIR
+        )
         number_of_aircrafts.append(len(asp.all_ac))
         print(asp)
 
@@ -184,9 +194,9 @@ def changing_runway_results(csv_filename, with_rhc: bool = False):
     cost = []
 
     for runway in range(2, 6):
-        make_input_from_csv(csv_filename, num_runways=4)
-        ac_input = read_input()
-        asp = ACS(*ac_input)
+        asp = load_acs_from_csv(
+            csv_filename, num_runways=4, cache_dir=INSTANCE_CACHE_DIR
+        )
         print(asp)
         print("Runway :", runway, end=" ")
         fitness = 0
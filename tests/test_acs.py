@@ -1,3 +1,4 @@
+import itertools
 import unittest
 from problem.acs import ACS, Airplane
 from problem.acs_solution import ACSolution
@@ -84,3 +85,103 @@ class ACSTest(unittest.TestCase):
         new_solution = new_acs.next(solution, companion)
         self.assertIsInstance(new_solution, solution.__class__)
         self.assertIsInstance(new_solution.value, solution.value.__class__)
+
+    def test_independent_clusters(self):
+        """
+        Testing the split of the airplanes into independent clusters
+        """
+        planes = [
+            Airplane("A1", 1, 0, 0, 0, [0, 0], 10, 10),
+            Airplane("A2", 2, 0, 0, 1, [1, 1], 10, 10),
+            Airplane("A3", 3, 0, 0, 100, [100, 100], 10, 10),
+            Airplane("A4", 1, 0, 0, 110, [110, 110], 10, 10),
+            Airplane("A5", 2, 0, 0, 300, [300, 300], 10, 10),
+        ]
+        acs = ACS(2, 3, self.sep_matrix, planes, [])
+        self.assertEqual(acs.independent_clusters(), [(0, 2), (2, 4), (4, 5)])
+
+    def test_canonical(self):
+        """
+        Testing the relabelling of interchangeable runways
+        """
+        self.assertEqual(self.acs.runway_groups, [0, 0])
+        self.assertEqual(self.acs.canonical([2, 1, 2]), [1, 2, 1])
+        self.assertEqual(self.acs.canonical([1, 1, 2]), [1, 1, 2])
+
+        planes = [
+            Airplane("A1", 1, 0, 0, 0, [0, 5, 0], 10, 10),
+            Airplane("A2", 2, 0, 0, 1, [1, 5, 1], 10, 10),
+        ]
+        acs = ACS(3, 3, self.sep_matrix, planes, [])
+        self.assertEqual(acs.runway_groups, [0, 1, 0])
+        self.assertEqual(acs.canonical([3, 2]), [1, 2])
+        self.assertEqual(acs.canonical([2, 3]), [2, 1])
+
+    def test_min_landing_gaps(self):
+        """
+        Testing that the landing gaps are shortened by chains of landings when the
+        separation matrix is not metric
+        """
+        self.assertTrue(self.acs.has_metric_separation())
+        self.assertEqual(self.acs.min_landing_gaps()[0][2], 31)
+
+        acs = ACS(2, 3, [[5, 60, 5], [5, 10, 20], [5, 5, 20]], self.planes, [])
+        self.assertFalse(acs.has_metric_separation())
+        self.assertEqual(acs.min_landing_gaps()[0][1], 12)
+
+    def test_fitness_cache(self):
+        """
+        Testing that symmetric solutions share the cached fitness
+        """
+        acs = ACS(2, 3, self.sep_matrix, self.planes, [], fitness_cache_size=10)
+        self.assertEqual(acs.evaluate([1, 2, 1]), 310)
+        self.assertEqual(acs.evaluate([2, 1, 2]), 310)
+        self.assertEqual(acs.evaluations, 1)
+        self.assertEqual(acs.cache_hits, 1)
+
+    def test_repair(self):
+        """
+        Testing that a repair only moves airplanes near the changed one and never
+        worsens the previous solution
+        """
+        planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta + 1], 5 + 3 * (i % 4), 5)
+            for i, eta in enumerate(range(0, 200, 4))
+        ]
+        acs = ACS(2, 3, self.sep_matrix, planes, [])
+        previous = ACSolution([1, 2] * 25, 0, acs.all_ac)
+        runways = dict(zip(map(id, acs.all_ac), previous.value))
+
+        repaired = acs.repair(previous, {10: [60, 61]}, time_window=20)
+        kept = [runways[id(ac)] for ac in acs.all_ac]
+        self.assertLessEqual(repaired.fitness, acs.evaluate(kept))
+        self.assertAlmostEqual(repaired.fitness, acs.evaluate(repaired.value))
+        for i, ac in enumerate(acs.all_ac):
+            if abs(ac.eta_etd[0] - 60) > 20 and abs(ac.eta_etd[0] - 40) > 20:
+                self.assertEqual(repaired.value[i], kept[i])
+
+    def test_repair_reorders(self):
+        """
+        Testing that an airplane delayed past its successors lands after them and
+        the repair finds the optimum around its old and new slots
+        """
+        planes = [
+            Airplane(f"A{i}", i % 2 + 1, 0, 0, 10 * i, [10 * i, 10 * i + 2], 10, 10)
+            for i in range(8)
+        ]
+        acs = ACS(2, 2, [[9, 14], [4, 9]], planes, [])
+        delayed = acs.all_ac[1]
+        previous = ACSolution([1, 2] * 4, 0, acs.all_ac)
+
+        repaired = acs.repair(previous, {1: [45, 47]}, time_window=30)
+        self.assertEqual(delayed.ending_time, 45)
+        self.assertIs(acs.all_ac[4], delayed)
+        self.assertEqual(
+            [ac.ending_time for ac in acs.all_ac], [0, 20, 30, 40, 45, 50, 60, 70]
+        )
+        self.assertIs(repaired.aircraft_sequence, acs.all_ac)
+        optimum = min(
+            acs.evaluate(list(solution))
+            for solution in itertools.product([1, 2], repeat=len(planes))
+        )
+        self.assertAlmostEqual(repaired.fitness, optimum)
@@ -0,0 +1,41 @@
+import unittest
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.batch_solver import solve_batch
+
+
+class BatchSolverTest(unittest.TestCase):
+    """
+    Test class for the batch solver
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane("A123", 3, 120, 0, 400, [1, 1], 10, 10),
+            Airplane("A345", 1, 0, 0, 100, [1, 1], 10, 10),
+            Airplane("A678", 2, 120, 0, 200, [1, 1], 10, 10),
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_solve_batch(self):
+        """
+        Testing that failures are reported without stopping the batch
+        """
+        sources = [self.acs, "./data/missing_input.txt", self.acs]
+        results = sorted(
+            solve_batch(sources, FCFS, {}, max_workers=2, time_limit=30),
+            key=lambda result: result.index,
+        )
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(results[0].solution.fitness, 210)
+        self.assertEqual(results[2].solution.fitness, 210)
+        self.assertIsNone(results[1].solution)
+        self.assertIn("FileNotFoundError", results[1].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
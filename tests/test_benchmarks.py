@@ -0,0 +1,83 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.suite import TRACE_OVERHEAD_LIMIT, compare, main, run_suite
+
+
+class BenchmarkTest(unittest.TestCase):
+    """
+    Test class for the benchmark suite
+    """
+    def test_run_suite(self):
+        """
+        Testing that every benchmark reports a result for the selected instance
+        """
+        results = run_suite(sizes=[], min_time=0.01, only="alp_7_30")
+        self.assertEqual(
+            sorted(results["results"]),
+            [
+                "alp_7_30/bco",
+                "alp_7_30/evaluate",
+                "alp_7_30/ga",
+                "alp_7_30/next",
+                "alp_7_30/time_to_target",
+                "alp_7_30/trace_overhead",
+            ],
+        )
+        self.assertGreater(results["results"]["alp_7_30/evaluate"]["value"], 0)
+        self.assertEqual(compare(results, results, 0.0), [])
+        self.assertLess(
+            results["results"]["alp_7_30/trace_overhead"]["value"],
+            TRACE_OVERHEAD_LIMIT,
+        )
+
+    def test_compare(self):
+        """
+        Testing that slower rates, slower times and missed targets are regressions
+        """
+        def results(evaluate, target):
+            return {
+                "results": {
+                    "a/evaluate": {"value": evaluate, "unit": "evals/s"},
+                    "a/time_to_target": {"value": target, "unit": "s"},
+                }
+            }
+
+        baseline = results(1000.0, 1.0)
+        self.assertEqual(compare(results(900.0, 1.2), baseline, 0.25), [])
+        self.assertEqual(len(compare(results(700.0, 1.0), baseline, 0.25)), 1)
+        self.assertEqual(len(compare(results(1000.0, 1.3), baseline, 0.25)), 1)
+        self.assertEqual(len(compare(results(1000.0, None), baseline, 0.25)), 1)
+        self.assertEqual(compare(results(1000.0, 5.0), results(1000.0, None), 0.25), [])
+
+    def test_compare_overhead(self):
+        """
+        Testing that an overhead above the limit is a regression without a baseline
+        """
+        def results(overhead):
+            result = {"value": overhead, "unit": "fraction"}
+            return {"results": {"a/trace_overhead": result}}
+
+        empty = {"results": {}}
+        self.assertEqual(compare(results(TRACE_OVERHEAD_LIMIT / 2), empty, 0.25), [])
+        regressions = compare(results(TRACE_OVERHEAD_LIMIT * 2), empty, 0.25)
+        self.assertEqual(len(regressions), 1)
+
+    def test_missing_baseline(self):
+        """
+        Testing that a run without a baseline to compare with fails
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            argv = ["--sizes", "--min-time", "0.01", "--only", "alp_7_30"]
+            argv += ["--baseline", os.path.join(directory, "baseline.json")]
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(main(argv), 1)
+                self.assertEqual(main(argv + ["--update-baseline"]), 0)
+                self.assertEqual(main(argv + ["--tolerance", "10"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
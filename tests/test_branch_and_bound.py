@@ -0,0 +1,66 @@
+import itertools
+import unittest
+
+from optimisation.branch_and_bound import BranchAndBoundOptimiser
+from problem.acs import ACS
+from problem.airplane import Airplane
+
+
+class BranchAndBoundTest(unittest.TestCase):
+    """
+    Test class for the BranchAndBoundOptimiser class
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta + 4, eta], 10 + i, 10)
+            for i, eta in enumerate([0, 1, 2, 3, 4, 6, 7, 9])
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(3, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_optimal(self):
+        """
+        Testing that the solution matches the brute force optimum
+        """
+        optimum = min(
+            self.acs.evaluate(list(solution))
+            for solution in itertools.product([1, 2, 3], repeat=len(self.planes))
+        )
+        optimiser = BranchAndBoundOptimiser(self.acs)
+        solution = optimiser.optimise()
+
+        self.assertTrue(optimiser.optimal)
+        self.assertAlmostEqual(solution.fitness, optimum)
+        self.assertAlmostEqual(self.acs.evaluate(solution.value), optimum)
+
+    def test_non_metric_separation(self):
+        """
+        Testing that the search stays exact when the separation matrix violates the
+        triangle inequality
+        """
+        acs = ACS(3, 3, [[5, 60, 5], [5, 10, 20], [5, 5, 20]], self.planes, [])
+        optimum = min(
+            acs.evaluate(list(solution))
+            for solution in itertools.product([1, 2, 3], repeat=len(self.planes))
+        )
+        optimiser = BranchAndBoundOptimiser(acs)
+        solution = optimiser.optimise()
+
+        self.assertTrue(optimiser.optimal)
+        self.assertAlmostEqual(solution.fitness, optimum)
+
+    def test_node_budget(self):
+        """
+        Testing that the incumbent is returned when the budget runs out
+        """
+        optimiser = BranchAndBoundOptimiser(self.acs, max_nodes=1)
+        solution = optimiser.optimise()
+
+        self.assertFalse(optimiser.optimal)
+        self.assertEqual(len(solution.value), len(self.planes))
+        self.assertAlmostEqual(self.acs.evaluate(solution.value), solution.fitness)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from cli.solve import main
+from utils.synthetic import generate_instance_file
+
+
+class CliTest(unittest.TestCase):
+    """
+    Test class for the command line solver
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "instance.acsb")
+        generate_instance_file(self.path, 200, 2, seed=0)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return super().tearDown()
+
+    def run_cli(self, *argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(list(argv))
+        return status, json.loads(output.getvalue())
+
+    def test_result(self):
+        """
+        Testing that the result is printed as JSON and the schedule and trace are
+        written
+        """
+        schedule = os.path.join(self.directory.name, "schedule.csv")
+        trace = os.path.join(self.directory.name, "trace.npy")
+        status, result = self.run_cli(
+            self.path,
+            "tabu",
+            "-p",
+            "max_iter=20",
+            "--seed",
+            "1",
+            "--schedule",
+            schedule,
+            "--trace",
+            trace,
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(result["num_aircraft"], 200)
+        self.assertEqual(result["params"], {"max_iter": 20})
+        self.assertGreaterEqual(result["cost"], 0)
+        self.assertIn("solve", result["timings"])
+        with open(schedule, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 201)
+        self.assertAlmostEqual(np.load(trace)["best"][-1], result["cost"])
+
+        _, fcfs = self.run_cli(self.path, "fcfs")
+        self.assertLessEqual(result["cost"], fcfs["cost"])
+
+    def test_time_limit(self):
+        """
+        Testing that optimisers stop at the time limit, also when solving with
+        receding horizon control
+        """
+        status, result = self.run_cli(
+            self.path,
+            "bco",
+            "-p",
+            "number_of_bees=10",
+            "-p",
+            "max_iter=1000000",
+            "-p",
+            "trial_limit=5",
+            "--time-limit",
+            "0.2",
+        )
+        self.assertEqual(status, 0)
+        self.assertTrue(result["time_limit_applied"])
+        self.assertLess(result["timings"]["solve"], 2)
+
+        for optimiser, params in [
+            ("tabu", ["max_iter=1000000", "max_no_improve=null"]),
+            ("ga", ["population_size=20", "generations=1000000"]),
+        ]:
+            for window in [[], ["--time-window", "600"]]:
+                args = [self.path, optimiser, "--time-limit", "0.2"] + window
+                for param in params:
+                    args += ["-p", param]
+                status, result = self.run_cli(*args)
+                self.assertEqual(status, 0)
+                self.assertLess(result["timings"]["solve"], 2)
+
+    def test_time_limit_rejected(self):
+        """
+        Testing that optimisers that cannot stop early reject a time limit
+        """
+        status, result = self.run_cli(self.path, "cps-dp", "--time-limit", "1")
+        self.assertEqual(status, 1)
+        self.assertIn("--time-limit", result["error"])
+
+    def test_error(self):
+        """
+        Testing that failures are reported as JSON with a non zero status
+        """
+        status, result = self.run_cli("./dataset/ikli_datasets/data_7_11.csv", "fcfs")
+        self.assertEqual(status, 1)
+        self.assertIn("--runways", result["error"])
+
+    def test_lazy_imports(self):
+        """
+        Testing that solving a binary instance does not import pandas or scipy
+        """
+        code = (
+            "import sys; from cli.solve import main; main([sys.argv[1], 'fcfs']); "
+            "print(sorted({'pandas', 'scipy', 'matplotlib'} & set(sys.modules)))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code, self.path],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        self.assertEqual(output.splitlines()[-1], "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.cluster_solver import ClusterSolver
+
+
+class ClusterSolverTest(unittest.TestCase):
+    """
+    Test class for the ClusterSolver class
+    """
+    def setUp(self) -> None:
+        etas = [0, 1, 2, 3, 200, 201, 202, 500, 900, 901]
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 10, 10)
+            for i, eta in enumerate(etas)
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_merged_solution(self):
+        """
+        Testing that the merged solution has the cost of the whole problem
+        """
+        for max_workers in [1, 2]:
+            solver = ClusterSolver(self.acs, FCFS, {}, max_workers=max_workers)
+            solution = solver.optimise()
+
+            self.assertEqual(len(solver.clusters), 4)
+            self.assertEqual(len(solution.value), len(self.planes))
+            self.assertAlmostEqual(solution.fitness, self.acs.evaluate(solution.value))
+            self.assertAlmostEqual(
+                solution.fitness, FCFS(self.acs).optimise().fitness
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from optimisation.bee_colony_optimiser import BeeColonyOptimiser
+from optimisation.constructive import (
+    CostWeightedGreedy,
+    LookAheadGreedy,
+    WakeBatchingGreedy,
+)
+from optimisation.fcfs import FCFS
+from optimisation.ga import GeneticOptimiser
+from problem.acs import ACS
+from problem.airplane import Airplane
+
+
+class ConstructiveTest(unittest.TestCase):
+    """
+    Test class for the constructive heuristics
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 5 + 3 * (i % 4), 5)
+            for i, eta in enumerate(range(0, 60, 4))
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_heuristics(self):
+        """
+        Testing that every heuristic returns a complete solution with its own cost
+        """
+        for heuristic in [
+            CostWeightedGreedy(self.acs),
+            WakeBatchingGreedy(self.acs),
+            LookAheadGreedy(self.acs),
+        ]:
+            solution = heuristic.optimise()
+            self.assertEqual(len(solution.value), len(self.planes))
+            self.assertTrue(all(runway in [1, 2] for runway in solution.value))
+            self.assertAlmostEqual(solution.fitness, self.acs.evaluate(solution.value))
+
+    def test_no_blocking_weight_is_fcfs(self):
+        """
+        Testing that without the blocking term the cost weighted greedy lands every
+        airplane as early as FCFS does
+        """
+        solution = CostWeightedGreedy(self.acs, blocking_weight=0).optimise()
+        self.assertAlmostEqual(solution.fitness, FCFS(self.acs).optimise().fitness)
+
+    def test_seeds(self):
+        """
+        Testing that seed solutions are part of the first population of BCO and GA
+        """
+        seed = LookAheadGreedy(self.acs).optimise()
+        bco = BeeColonyOptimiser(self.acs, 10, 5, 3, seeds=[seed])
+        self.assertIs(bco.employed_bees[0].solution, seed)
+        bco.optimise()
+        self.assertLessEqual(bco.best_solution.solution.fitness, seed.fitness)
+
+        ga = GeneticOptimiser(self.acs, 10, 5, seeds=[seed])
+        population = ga.generate_population()
+        self.assertEqual(len(population), 10)
+        self.assertIs(population[0], seed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import itertools
+import unittest
+
+from optimisation.cps_dp import CPSDynamicProgrammingOptimiser
+from problem.acs import ACS
+from problem.airplane import Airplane
+
+
+class CPSDynamicProgrammingTest(unittest.TestCase):
+    """
+    Test class for the CPSDynamicProgrammingOptimiser class
+    """
+    def setUp(self) -> None:
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        return super().setUp()
+
+    def brute_force(self, acs: ACS) -> float:
+        return min(
+            acs.evaluate(list(solution))
+            for solution in itertools.product(
+                range(1, acs.no_of_runways + 1), repeat=len(acs.all_ac)
+            )
+        )
+
+    def test_optimal(self):
+        """
+        Testing that the solution matches the brute force optimum with identical
+        and distinct runways
+        """
+        planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta + 4, eta], 10 + i, 10)
+            for i, eta in enumerate([0, 1, 2, 3, 4, 6, 7, 9])
+        ]
+        acs = ACS(3, 3, self.sep_matrix, planes, [])
+        solution = CPSDynamicProgrammingOptimiser(acs, max_states=None).optimise()
+
+        self.assertAlmostEqual(solution.fitness, self.brute_force(acs))
+        self.assertAlmostEqual(acs.evaluate(solution.value), solution.fitness)
+
+    def test_truncated(self):
+        """
+        Testing that a small state budget still returns a valid solution
+        """
+        planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 10, 10)
+            for i, eta in enumerate(range(0, 20, 2))
+        ]
+        acs = ACS(2, 3, self.sep_matrix, planes, [])
+        optimiser = CPSDynamicProgrammingOptimiser(acs, max_states=2)
+        solution = optimiser.optimise()
+
+        self.assertTrue(optimiser.truncated)
+        self.assertEqual(len(solution.value), len(planes))
+        self.assertAlmostEqual(acs.evaluate(solution.value), solution.fitness)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.horizon_policy import DensityAdaptiveHorizon, FixedHorizon
+from problem.rhc_solver import RHCSolver
+
+
+class HorizonPolicyTest(unittest.TestCase):
+    """
+    Test class for the horizon policies
+    """
+    def test_fixed_horizon(self):
+        """
+        Testing that the fixed policy always returns the same window
+        """
+        policy = FixedHorizon(30)
+        self.assertEqual(policy.window_length(0, 2, [0, 10, 20], []), 30)
+
+    def test_density_adaptive_horizon(self):
+        """
+        Testing that dense traffic shrinks the window down to the bounds
+        """
+        policy = DensityAdaptiveHorizon(10, 100, max_aircraft=3, step=10)
+        sparse = [0, 150, 300]
+        dense = list(range(0, 40, 2))
+
+        self.assertEqual(policy.window_length(0, 2, sparse, []), 100)
+        self.assertEqual(policy.window_length(0, 2, [0, 30, 60, 90], []), 40)
+        self.assertEqual(policy.window_length(0, 2, dense, []), 10)
+
+    def test_rhc_with_adaptive_horizon(self):
+        """
+        Testing that every aircraft is scheduled when the windows are resized
+        """
+        planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 10, 10)
+            for i, eta in enumerate([0, 1, 2, 3, 4, 5, 100, 400, 401])
+        ]
+        acs = ACS(2, 3, [[5, 20, 30], [5, 10, 20], [5, 10, 20]], planes, [])
+        policy = DensityAdaptiveHorizon(10, 100, max_aircraft=4, step=10)
+        solver = RHCSolver(acs, 50, 2, FCFS, {}, policy)
+        solution = solver.optimise()
+
+        self.assertEqual(len(solution.value), len(planes))
+        for record in solver.window_records:
+            self.assertLessEqual(record.end_time - record.start_time, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import shutil
+import unittest
+
+import numpy as np
+
+from utils.input import (
+    cached_csv_arrays,
+    load_acs_from_csv,
+    make_input_from_csv,
+    read_csv_input,
+    read_input,
+)
+
+
+class CsvInputTest(unittest.TestCase):
+    """
+    Test class for the csv loaders
+    """
+    def test_same_as_input_file(self):
+        """
+        Testing that the csv loaders build the same airplanes as the input file
+        """
+        path = "./dataset/ikli_datasets/data_7_11.csv"
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, "input.txt")
+            make_input_from_csv(path, 3, output_path)
+            from_file = read_input(output_path)
+        from_csv = read_csv_input(path, 3)
+
+        self.assertEqual(from_csv[:3], from_file[:3])
+        self.assertEqual(len(from_csv[3]), len(from_file[3]))
+        for csv_ac, file_ac in zip(from_csv[3], from_file[3]):
+            self.assertEqual(vars(csv_ac), vars(file_ac))
+        # every airplane owns its eta_etd, as RHCSolver changes them in place
+        self.assertIsNot(from_csv[3][0].eta_etd, from_csv[3][1].eta_etd)
+
+    def test_instance_columns(self):
+        """
+        Testing that the instance files with the cost_300 column are read
+        """
+        acs = load_acs_from_csv("./dataset/ikli_instances/alp_11_30.csv", 2)
+        self.assertEqual(len(acs.all_ac), 30)
+        self.assertEqual(acs.no_of_runways, 2)
+        self.assertTrue(all(ac.delay_cost > 0 for ac in acs.all_ac))
+
+    def test_instance_cache(self):
+        """
+        Testing that cached instances are mapped from disk until the file changes
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            cache_dir = os.path.join(directory, "cache")
+            shutil.copy("./dataset/ikli_datasets/data_7_11.csv", path)
+
+            parsed = cached_csv_arrays(path, 3, cache_dir)
+            cached = cached_csv_arrays(path, 3, cache_dir)
+            self.assertIsInstance(cached.eta_etd, np.memmap)
+            np.testing.assert_array_equal(cached.eta_etd, parsed.eta_etd)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            cached_csv_arrays(path, 2, cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("A320,Medium,23:00:00,82800,23:00:00,82800,1,1,1,1\n")
+            changed = load_acs_from_csv(path, 3, cache_dir=cache_dir)
+            self.assertEqual(len(changed.all_ac), len(parsed) + 1)
+            # the entry of the previous content is replaced
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_instance_cache_eviction(self):
+        """
+        Testing that the least recently used instances are removed beyond the limit
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            cache_dir = os.path.join(directory, "cache")
+            paths = []
+            for name in ["first", "second", "third"]:
+                paths.append(os.path.join(directory, f"{name}.csv"))
+                shutil.copy("./dataset/ikli_datasets/data_7_11.csv", paths[-1])
+
+            cached_csv_arrays(paths[0], 3, cache_dir, max_entries=2)
+            cached_csv_arrays(paths[1], 3, cache_dir, max_entries=2)
+            for age, entry in enumerate(sorted(os.listdir(cache_dir))):
+                entry_path = os.path.join(cache_dir, entry)
+                os.utime(entry_path, (1000 + age, 1000 + age))
+            # a hit marks the first instance as recently used
+            cached_csv_arrays(paths[0], 3, cache_dir, max_entries=2)
+            cached_csv_arrays(paths[2], 3, cache_dir, max_entries=2)
+
+            entries = sorted(entry.split("-")[0] for entry in os.listdir(cache_dir))
+            self.assertEqual(entries, ["first", "third"])
+
+
+if __name__ == "__main__":
+    unittest.main()
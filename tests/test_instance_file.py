@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from utils.input import InstanceArrays, csv_arrays
+from utils.instance_file import load_acs, load_instance, save_instance
+
+
+class InstanceFileTest(unittest.TestCase):
+    """
+    Test class for the binary instance files
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "instance.acsb")
+        self.arrays = csv_arrays("./dataset/ikli_datasets/data_7_11.csv", 3)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return super().tearDown()
+
+    def test_round_trip(self):
+        """
+        Testing that a saved instance is mapped back unchanged
+        """
+        save_instance(self.path, self.arrays)
+        loaded = load_instance(self.path)
+
+        self.assertIsInstance(loaded.eta_etd, np.memmap)
+        self.assertEqual(loaded.num_runways, 3)
+        for name in ["separation_matrix", "types", "eta_etd", "delay_costs"]:
+            np.testing.assert_array_equal(
+                getattr(loaded, name), getattr(self.arrays, name)
+            )
+
+        problem = load_acs(self.path)
+        expected = self.arrays.to_acs()
+        for loaded_ac, expected_ac in zip(problem.all_ac, expected.all_ac):
+            self.assertEqual(vars(loaded_ac), vars(expected_ac))
+        np.testing.assert_array_equal(
+            InstanceArrays.from_acs(problem).eta_etd, self.arrays.eta_etd
+        )
+
+    def test_invalid_file(self):
+        """
+        Testing that other files and other versions are rejected
+        """
+        save_instance(self.path, self.arrays)
+        with open(self.path, "r+b") as f:
+            f.seek(8)
+            f.write((99).to_bytes(4, "little"))
+        with self.assertRaises(ValueError):
+            load_instance(self.path)
+        with self.assertRaises(ValueError):
+            load_instance("./dataset/ikli_datasets/data_7_11.csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
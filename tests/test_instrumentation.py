@@ -0,0 +1,128 @@
+import pickle
+import random
+import unittest
+from copy import deepcopy
+
+from optimisation.bee_colony_optimiser import BeeColonyOptimiser
+from optimisation.ga import GeneticOptimiser
+from optimisation.tabu_search import TabuSearchOptimiser
+from problem.rhc_solver import RHCSolver
+from utils.input import load_acs_from_csv
+
+
+class InstrumentationTest(unittest.TestCase):
+    """
+    Test class for the counters of the problem and the hooks of the optimisers
+    """
+    def setUp(self) -> None:
+        random.seed(0)
+        self.acs = load_acs_from_csv("./dataset/ikli_instances/alp_7_30.csv", 2)
+        return super().setUp()
+
+    def test_counters(self):
+        """
+        Testing that evaluations and neighbours are counted until switched off, and
+        that copies count on their own
+        """
+        solution = self.acs.generate_solution()
+        self.acs.next(solution, solution)
+        self.assertEqual((self.acs.evaluations, self.acs.neighbours), (2, 1))
+
+        for copied in (deepcopy(self.acs), pickle.loads(pickle.dumps(self.acs))):
+            copied.evaluate(solution.value)
+            self.assertEqual(copied.evaluations, 3)
+        self.assertEqual(self.acs.evaluations, 2)
+
+        self.acs.instrument(False)
+        self.assertNotIn("compute_cost", vars(self.acs))
+        self.acs.next(solution, solution)
+        self.assertEqual((self.acs.evaluations, self.acs.neighbours), (2, 1))
+        self.assertFalse(deepcopy(self.acs).instrumented)
+
+    def test_bco_hooks(self):
+        """
+        Testing the phase timers and callbacks of the bee colony optimiser
+        """
+        iterations, improvements = [], []
+        optimiser = BeeColonyOptimiser(self.acs, 10, 20, 5)
+        optimiser.on_iteration = lambda _, iteration: iterations.append(iteration)
+        optimiser.on_improvement = lambda _, __, fitness: improvements.append(fitness)
+        optimiser.enable_phase_timers()
+        solution = optimiser.optimise()
+
+        self.assertEqual(iterations, list(range(1, 21)))
+        self.assertEqual(improvements, sorted(improvements, reverse=True))
+        self.assertEqual(improvements[-1], solution.fitness)
+        self.assertEqual(sorted(optimiser.phase_times), ["employed", "onlooker", "scout"])
+
+    def test_hooks_off(self):
+        """
+        Testing that optimisers count iterations without timers or callbacks
+        """
+        optimiser = GeneticOptimiser(self.acs, 10, 5)
+        optimiser.optimise()
+        self.assertEqual(optimiser.iterations, 5)
+        self.assertGreaterEqual(optimiser.improvements, 1)
+        self.assertIsNone(optimiser.phase_times)
+        # 10 initial solutions, then 6 evaluations per pair of children
+        self.assertEqual(self.acs.evaluations, 10 + 5 * 5 * 6)
+
+    def test_delta_evaluations(self):
+        """
+        Testing that the moves of tabu search are counted as incremental evaluations
+        """
+        optimiser = TabuSearchOptimiser(self.acs, 200)
+        optimiser.optimise()
+        self.assertGreaterEqual(self.acs.delta_evaluations, 200)
+        self.assertEqual(
+            optimiser.evaluation_count(),
+            self.acs.evaluations + self.acs.delta_evaluations,
+        )
+
+        self.acs.reset_counters()
+        self.acs.instrument(False)
+        TabuSearchOptimiser(self.acs, 20).optimise()
+        self.assertEqual(self.acs.delta_evaluations, 0)
+
+        params = {"max_iter": 20}
+        self.acs.instrument(True)
+        solver = RHCSolver(self.acs, 20 * 60, 2, TabuSearchOptimiser, params)
+        solver.optimise()
+        metrics = solver.metrics()
+        self.assertGreater(metrics["delta_evaluations"], 0)
+        self.assertEqual(
+            solver.evaluation_count(),
+            metrics["evaluations"] + metrics["delta_evaluations"],
+        )
+
+    def test_rhc_metrics(self):
+        """
+        Testing that the receding horizon solver aggregates the telemetry of the
+        window optimisers
+        """
+        params = {"number_of_bees": 10, "max_iter": 5, "trial_limit": 5}
+        solver = RHCSolver(
+            self.acs, 20 * 60, 2, BeeColonyOptimiser, params, phase_timers=True
+        )
+        solver.optimise()
+        metrics = solver.metrics()
+
+        self.assertEqual(metrics["windows"], len(solver.window_records))
+        self.assertEqual(metrics["committed"], len(self.acs.all_ac))
+        self.assertEqual(metrics["iterations"], 5 * metrics["windows"])
+        self.assertEqual(
+            metrics["neighbours"], sum(r.neighbours for r in solver.window_records)
+        )
+        self.assertGreater(metrics["neighbours"], 0)
+        self.assertIn("employed", metrics["phase_times"])
+        self.assertEqual(solver.iterations, metrics["windows"])
+
+        self.acs.instrument(False)
+        solver = RHCSolver(self.acs, 20 * 60, 2, BeeColonyOptimiser, params)
+        solver.optimise()
+        self.assertEqual(solver.metrics()["evaluations"], 0)
+        self.assertEqual(solver.metrics()["phase_times"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
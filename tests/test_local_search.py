@@ -0,0 +1,59 @@
+import unittest
+
+from optimisation.fcfs import FCFS
+from optimisation.local_search import LocalSearchPolisher
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.rhc_solver import RHCSolver
+from utils.input import load_acs_from_csv
+
+
+class LocalSearchPolisherTest(unittest.TestCase):
+    """
+    Test class for the LocalSearchPolisher class
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 5 + 3 * (i % 4), 5)
+            for i, eta in enumerate(range(0, 60, 4))
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_polish(self):
+        """
+        Testing that polishing never worsens the solution and ends in a local optimum
+        """
+        fcfs_cost = FCFS(self.acs).optimise().fitness
+        polisher = LocalSearchPolisher(FCFS(self.acs))
+        solution = polisher.optimise()
+
+        self.assertLessEqual(solution.fitness, fcfs_cost)
+        self.assertAlmostEqual(solution.fitness, self.acs.evaluate(solution.value))
+        for i in range(len(self.planes)):
+            for runway in [1, 2]:
+                moved = list(solution.value)
+                moved[i] = runway
+                self.assertGreaterEqual(
+                    self.acs.evaluate(moved) + 1e-9, solution.fitness
+                )
+
+    def test_polish_rhc(self):
+        """
+        Testing that the solution of an RHCSolver is polished and evaluated on the
+        original problem, whose etas are not carried over
+        """
+        original = load_acs_from_csv("./dataset/ikli_instances/alp_7_50.csv", 2)
+        rhc_cost = RHCSolver(original, 600, 2, FCFS, {}).optimise().fitness
+        solution = LocalSearchPolisher(RHCSolver(original, 600, 2, FCFS, {})).optimise()
+
+        self.assertAlmostEqual(solution.fitness, original.evaluate(solution.value))
+        self.assertLessEqual(solution.fitness, rhc_cost)
+        self.assertIs(solution.aircraft_sequence, original.all_ac)
+        times = [time for time, _ in original.get_landing_times(solution.value)]
+        self.assertEqual(solution.landing_times, times)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import itertools
+import unittest
+from unittest import mock
+
+from optimisation.bee_colony_optimiser import BeeColonyOptimiser
+from optimisation.optimiser import optimality_gap
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem import lower_bound as lower_bound_module
+from problem.lower_bound import lower_bound, lp_lower_bound, separation_lower_bound
+
+
+class LowerBoundTest(unittest.TestCase):
+    """
+    Test class for the lower bounds of the ACS problem
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 10 + i, 10)
+            for i, eta in enumerate([0, 1, 2, 3, 4, 5, 6, 7])
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        self.optimum = min(
+            self.acs.evaluate(list(solution))
+            for solution in itertools.product([1, 2], repeat=len(self.planes))
+        )
+        return super().setUp()
+
+    def test_bounds(self):
+        """
+        Testing that the bounds are valid and the combinatorial one is not trivial
+        """
+        self.assertGreater(separation_lower_bound(self.acs), 0)
+        self.assertLessEqual(separation_lower_bound(self.acs), self.optimum)
+        self.assertLessEqual(lp_lower_bound(self.acs), self.optimum + 1e-6)
+        self.assertLessEqual(lower_bound(self.acs, use_lp=True), self.optimum + 1e-6)
+        self.assertEqual(self.acs.lower_bound(), separation_lower_bound(self.acs))
+
+    def test_bound_cache(self):
+        """
+        Testing that the cache of bounds drops the least recently used instance
+        """
+        other = ACS(2, 3, self.sep_matrix, self.planes[:4], [])
+        third = ACS(1, 3, self.sep_matrix, [Airplane("A", 1, 0, 0, 0, [0], 1, 1)], [])
+        with mock.patch.object(lower_bound_module, "BOUND_CACHE_SIZE", 2):
+            lower_bound_module._BOUND_CACHE.clear()
+            lower_bound(self.acs)
+            lower_bound(other)
+            lower_bound(self.acs)
+            lower_bound(third)
+            keys = [key for key, _ in lower_bound_module._BOUND_CACHE]
+        key = lower_bound_module.instance_key
+        self.assertEqual(keys, [key(self.acs), key(third)])
+
+    def test_optimality_gap(self):
+        """
+        Testing the relative gap
+        """
+        self.assertEqual(optimality_gap(100, 75), 0.25)
+        self.assertEqual(optimality_gap(0, 0), 0)
+
+    def test_target_gap(self):
+        """
+        Testing that the optimiser stops once it is within the target gap
+        """
+        bco = BeeColonyOptimiser(
+            self.acs, number_of_bees=10, max_iter=100, trial_limit=10, target_gap=1.0
+        )
+        evaluations = self.acs.evaluations
+        bco.optimise()
+        self.assertEqual(self.acs.evaluations - evaluations, 5)
+        self.assertEqual(bco.lower_bound, self.acs.lower_bound())
+
+
+if __name__ == "__main__":
+    unittest.main()
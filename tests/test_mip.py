@@ -0,0 +1,59 @@
+import itertools
+import unittest
+
+from optimisation.fcfs import FCFS
+from optimisation.mip import MIPOptimiser
+from problem.acs import ACS
+from problem.airplane import Airplane
+
+
+class MIPOptimiserTest(unittest.TestCase):
+    """
+    Test class for the MIPOptimiser class
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta + 3], 10 + i, 10)
+            for i, eta in enumerate([0, 2, 3, 5, 8, 9, 12])
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_optimal(self):
+        """
+        Testing that the solution matches the brute force optimum
+        """
+        optimum = min(
+            self.acs.evaluate(list(solution))
+            for solution in itertools.product([1, 2], repeat=len(self.planes))
+        )
+        solution = MIPOptimiser(self.acs).optimise()
+
+        self.assertAlmostEqual(solution.fitness, optimum)
+        self.assertAlmostEqual(self.acs.evaluate(solution.value), optimum)
+        self.assertLessEqual(solution.fitness, FCFS(self.acs).optimise().fitness)
+
+    def test_non_metric_separation(self):
+        """
+        Testing that a separation matrix violating the triangle inequality gives a
+        relaxed model whose bound stays below the brute force optimum
+        """
+        acs = ACS(2, 3, [[5, 60, 5], [5, 10, 20], [5, 5, 20]], self.planes, [])
+        optimum = min(
+            acs.evaluate(list(solution))
+            for solution in itertools.product([1, 2], repeat=len(self.planes))
+        )
+        optimiser = MIPOptimiser(acs)
+        solution = optimiser.optimise()
+
+        self.assertTrue(MIPOptimiser(self.acs).exact)
+        self.assertFalse(optimiser.exact)
+        self.assertIn("relaxed", optimiser.status)
+        self.assertLessEqual(optimiser.lower_bound, optimum + 1e-6)
+        self.assertAlmostEqual(acs.evaluate(solution.value), solution.fitness)
+        self.assertGreaterEqual(solution.fitness, optimum)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import multiprocessing
+import os
+import struct
+import time
+import unittest
+
+from optimisation.bee_colony_optimiser import BeeColonyOptimiser
+from optimisation.constructive import LookAheadGreedy
+from optimisation.fcfs import FCFS
+from optimisation.ga import GeneticOptimiser
+from optimisation.portfolio import PortfolioOptimiser, ResultCollector
+from problem.acs import ACS
+from problem.airplane import Airplane
+
+
+class PortfolioOptimiserTest(unittest.TestCase):
+    """
+    Test class for the PortfolioOptimiser class
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 5 + 3 * (i % 4), 5)
+            for i, eta in enumerate(range(0, 60, 4))
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_race(self):
+        """
+        Testing that the portfolio returns the best member solution by the deadline,
+        even when a member would run far longer
+        """
+        members = [
+            (FCFS, {}),
+            (LookAheadGreedy, {}),
+            (
+                BeeColonyOptimiser,
+                {"number_of_bees": 10, "max_iter": 10**9, "trial_limit": 3},
+            ),
+        ]
+        portfolio = PortfolioOptimiser(self.acs, members, time_limit=1.0)
+        start = time.perf_counter()
+        solution = portfolio.optimise()
+
+        self.assertLess(time.perf_counter() - start, 5.0)
+        self.assertIn(portfolio.winner, [0, 1, 2])
+        self.assertAlmostEqual(solution.fitness, self.acs.evaluate(solution.value))
+        self.assertLessEqual(solution.fitness, FCFS(self.acs).optimise().fitness)
+        self.assertLessEqual(solution.fitness, LookAheadGreedy(self.acs).optimise().fitness)
+
+    def test_stop(self):
+        """
+        Testing that members with optimise_iter stop after their current chunk and
+        the others are killed at the deadline
+        """
+        members = [
+            (
+                BeeColonyOptimiser,
+                {"number_of_bees": 10, "max_iter": 10**9, "trial_limit": 3},
+            ),
+            (GeneticOptimiser, {"population_size": 20, "generations": 10**9}),
+        ]
+        portfolio = PortfolioOptimiser(
+            self.acs, members, time_limit=0.5, cancel_ratio=None
+        )
+        solution = portfolio.optimise()
+
+        self.assertEqual(portfolio.killed, [1])
+        self.assertEqual(portfolio.winner, 0)
+        self.assertAlmostEqual(solution.fitness, self.acs.evaluate(solution.value))
+
+    def test_collector(self):
+        """
+        Testing that the collector keeps the best report and drops a pipe that ends
+        in the middle of a report, as when its member is killed
+        """
+        collector = ResultCollector(2)
+        for member, fitness in enumerate([20.0, 10.0]):
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            collector.add(member, receiver)
+            sender.send(([member + 1], fitness))
+            if member == 1:
+                # the length of a message of 100 bytes followed by 3 of them
+                os.write(sender.fileno(), struct.pack("!i", 100) + b"abc")
+            sender.close()
+
+        collector.collect()
+        self.assertEqual(collector.best(), ([2], 10.0, 1))
+        self.assertEqual(collector.member_fitness, [20.0, 10.0])
+        self.assertEqual(collector.connections, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.rhc_solver import RHCSolver
+
+
+class RHCSolverTest(unittest.TestCase):
+    """
+    Test class for the RHCSolver class
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane("A123", 3, 0, 0, 10, [10, 10], 10, 10),
+            Airplane("A345", 1, 0, 0, 12, [12, 12], 5, 5),
+            Airplane("A678", 2, 0, 0, 13, [13, 13], 10, 10),
+            Airplane("A910", 1, 0, 0, 40, [40, 40], 10, 10),
+            Airplane("A112", 2, 0, 0, 41, [41, 41], 10, 10),
+            Airplane("A314", 3, 0, 0, 70, [70, 70], 10, 10),
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_committed_cost(self):
+        """
+        Testing that the fitness is accumulated from the committed windows
+        """
+        solver = RHCSolver(self.acs, 20, 2, FCFS, {})
+        solution = solver.optimise()
+
+        self.assertEqual(len(solution.value), len(self.planes))
+        self.assertEqual(solution.aircraft_sequence, self.acs.all_ac)
+        self.assertAlmostEqual(
+            solution.fitness,
+            sum(record.committed_cost for record in solver.window_records),
+        )
+        self.assertEqual(
+            sum(record.num_committed for record in solver.window_records),
+            len(self.planes),
+        )
+
+    def test_window_records(self):
+        """
+        Testing the per window telemetry
+        """
+        solver = RHCSolver(self.acs, 20, 2, FCFS, {})
+        solver.optimise()
+
+        for record in solver.window_records:
+            self.assertGreater(record.num_aircraft, 0)
+            self.assertLessEqual(record.num_carried_over, record.num_aircraft)
+            self.assertGreaterEqual(record.solve_time, 0)
+            self.assertEqual(record.evaluations, 1)
+        # The original problem is left untouched
+        self.assertEqual(self.planes[0].eta_etd, [10, 10])
+
+    def test_exact_window_size(self):
+        """
+        Testing that small horizons are solved by the exact optimiser
+        """
+        solver = RHCSolver(self.acs, 20, 2, FCFS, {}, exact_window_size=10)
+        solution = solver.optimise()
+        fcfs_solution = RHCSolver(self.acs, 20, 2, FCFS, {}).optimise()
+
+        self.assertEqual(len(solution.value), len(self.planes))
+        self.assertLessEqual(solution.fitness, fcfs_solution.fitness)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.rhc_solver import RHCSolver
+from problem.schedule_export import SCHEDULE_COLUMNS, ScheduleWriter
+
+
+class ScheduleExportTest(unittest.TestCase):
+    """
+    Test class for the schedule exporters
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane("A123", 3, 0, 0, 10, [10, 10], 10, 10),
+            Airplane("A345", 1, 0, 0, 12, [12, 12], 5, 5),
+            Airplane("A678", 2, 0, 0, 13, [13, 13], 10, 10),
+            Airplane("A910", 1, 0, 0, 40, [40, 40], 10, 10),
+            Airplane("A112", 2, 0, 0, 41, [41, 41], 10, 10),
+            Airplane("A314", 3, 0, 0, 70, [70, 70], 10, 10),
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        self.directory = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return super().tearDown()
+
+    def test_export(self):
+        """
+        Testing that the exported costs add up to the fitness in both formats
+        """
+        solution = FCFS(self.acs).optimise()
+        csv_path = os.path.join(self.directory.name, "schedule.csv")
+        npy_path = os.path.join(self.directory.name, "schedule.npy")
+        solution.export(csv_path, self.acs)
+        solution.export(npy_path, self.acs)
+
+        schedule = pd.read_csv(csv_path)
+        self.assertEqual(list(schedule.columns), SCHEDULE_COLUMNS)
+        self.assertEqual(list(schedule["runway"]), solution.value)
+        self.assertAlmostEqual(schedule["cost"].sum(), solution.fitness)
+        array = np.load(npy_path)
+        np.testing.assert_allclose(array["landing_time"], schedule["landing_time"])
+
+    def test_rhc_landing_times(self):
+        """
+        Testing that RHC solutions are exported with their committed landing times,
+        and that streamed rows match a whole solution
+        """
+        solution = RHCSolver(self.acs, 20, 2, FCFS, {}).optimise()
+        self.assertEqual(len(solution.landing_times), len(self.planes))
+
+        whole_path = os.path.join(self.directory.name, "whole.csv")
+        streamed_path = os.path.join(self.directory.name, "streamed.csv")
+        solution.export(whole_path)
+        with ScheduleWriter(streamed_path, buffer_size=4) as writer:
+            for ac, runway, landing_time in zip(
+                solution.aircraft_sequence, solution.value, solution.landing_times
+            ):
+                writer(ac, landing_time, runway)
+
+        whole = pd.read_csv(whole_path)
+        self.assertAlmostEqual(whole["cost"].sum(), solution.fitness)
+        pd.testing.assert_frame_equal(whole, pd.read_csv(streamed_path))
+
+    def test_rhc_with_takeoffs(self):
+        """
+        Testing that an RHC solution with take-offs, which it does not schedule, is
+        exported with the rows of the committed aircrafts only, and that long model
+        names are kept in the .npy schedule
+        """
+        self.planes[0].model = "Airbus A350-1000 XWB"
+        takeoffs = [Airplane("T1", 1, 0, 0, 11, [11, 11], 10, 10)]
+        acs = ACS(2, 3, self.sep_matrix, self.planes, takeoffs)
+        solution = RHCSolver(acs, 20, 2, FCFS, {}).optimise()
+        path = os.path.join(self.directory.name, "schedule.npy")
+        solution.export(path)
+
+        schedule = np.load(path)
+        self.assertEqual(list(schedule["model"]), [ac.model for ac in acs.landing_ac])
+        self.assertEqual(list(schedule["runway"]), solution.value)
+        self.assertTrue(np.all(schedule["delay"] >= 0))
+        self.assertAlmostEqual(schedule["cost"].sum(), solution.fitness)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.schedule_state import ScheduleState
+
+
+class ScheduleStateTest(unittest.TestCase):
+    """
+    Test class for the ScheduleState class
+    """
+    def setUp(self) -> None:
+        random.seed(0)
+        self.planes = [
+            Airplane(f"A{i}", random.randint(1, 3), 0, 0, eta, [eta, eta + 2, eta], 5 + i, 5)
+            for i, eta in enumerate(range(0, 120, 3))
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(3, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_moves(self):
+        """
+        Testing that incremental moves agree with a full evaluation
+        """
+        n = len(self.planes)
+        state = ScheduleState(self.acs, [random.randint(1, 3) for _ in range(n)])
+        self.assertAlmostEqual(state.fitness, self.acs.evaluate(state.value))
+
+        for _ in range(500):
+            before = state.fitness
+            i = random.randrange(n)
+            if random.random() < 0.5:
+                runway = random.randint(1, 3)
+                delta = state.reassign_delta(i, runway)
+                state.reassign(i, runway)
+            else:
+                j = random.randrange(n)
+                delta = state.swap_delta(i, j)
+                state.swap(i, j)
+
+            cost = self.acs.evaluate(state.value)
+            self.assertAlmostEqual(state.fitness, cost)
+            self.assertAlmostEqual(before + delta, cost)
+            self.assertEqual(
+                state.landing_times,
+                [time for time, _ in self.acs.get_landing_times(state.value)],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
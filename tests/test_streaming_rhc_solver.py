@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.rhc_solver import RHCSolver
+from problem.streaming_rhc_solver import StreamingRHCSolver
+from utils.input import (
+    SEPARATION_MATRIX,
+    make_input_from_csv,
+    read_csv_chunks,
+    read_csv_input,
+    read_input_chunks,
+)
+
+
+class StreamingRHCSolverTest(unittest.TestCase):
+    """
+    Test class for the StreamingRHCSolver class
+    """
+    def setUp(self) -> None:
+        self.path = "./dataset/ikli_datasets/data_7_11.csv"
+        self.sep_matrix = [[float(x) for x in row] for row in SEPARATION_MATRIX]
+        return super().setUp()
+
+    def test_same_as_rhc(self):
+        """
+        Testing that streaming the aircrafts commits the same schedule as RHCSolver
+        """
+        expected = RHCSolver(ACS(*read_csv_input(self.path, 3)), 600, 2, FCFS, {})
+        expected_solution = expected.optimise()
+
+        committed = []
+        solver = StreamingRHCSolver(
+            read_csv_chunks(self.path, 3, chunk_size=20),
+            3,
+            3,
+            self.sep_matrix,
+            600,
+            2,
+            FCFS,
+            {},
+            on_commit=lambda *args: committed.append(args),
+        )
+        solution = solver.optimise()
+
+        self.assertAlmostEqual(solution.fitness, expected_solution.fitness)
+        self.assertEqual(len(committed), len(expected_solution.value))
+        self.assertAlmostEqual(sum(cost for *_, cost in committed), solution.fitness)
+        # committed aircrafts are reported with their original eta_etd
+        for ac, landing_time, _, _ in committed:
+            self.assertGreaterEqual(landing_time, min(ac.eta_etd))
+        self.assertEqual(len(solver.problem.landing_ac), 0)
+
+    def test_input_chunks(self):
+        """
+        Testing that input files are read in chunks and must be in eta_etd order
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, "input.txt")
+            make_input_from_csv(self.path, 3, output_path)
+            chunks = list(read_input_chunks(output_path, chunk_size=50))
+        self.assertEqual([len(chunk) for chunk in chunks], [50, 50, 50, 35])
+
+        with self.assertRaises(ValueError):
+            list(read_input_chunks("./data/previous_work_input.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
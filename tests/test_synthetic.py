@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from utils.instance_file import load_acs
+from utils.synthetic import (
+    fit_profile,
+    generate_acs,
+    generate_arrays,
+    generate_instance_file,
+)
+
+
+class SyntheticTest(unittest.TestCase):
+    """
+    Test class for the synthetic traffic generator
+    """
+    def setUp(self) -> None:
+        self.profile = fit_profile()
+        return super().setUp()
+
+    def test_seeded(self):
+        """
+        Testing that the same seed generates the same instance
+        """
+        first = generate_arrays(500, 2, seed=3, profile=self.profile)
+        second = generate_arrays(500, 2, seed=3, profile=self.profile)
+        other = generate_arrays(500, 2, seed=4, profile=self.profile)
+
+        np.testing.assert_array_equal(first.eta_etd, second.eta_etd)
+        np.testing.assert_array_equal(first.types, second.types)
+        self.assertFalse(np.array_equal(first.eta_etd, other.eta_etd))
+
+    def test_calibration(self):
+        """
+        Testing that large instances keep the arrival rate and wake mix of the
+        datasets
+        """
+        arrays = generate_arrays(100000, 4, seed=0, profile=self.profile)
+        self.assertEqual(len(arrays), 100000)
+        self.assertEqual(arrays.eta_etd.shape, (100000, 4))
+        self.assertTrue(np.all(np.diff(arrays.ending_times) >= 0))
+
+        mix = np.bincount(arrays.types, minlength=4)[1:] / len(arrays)
+        np.testing.assert_allclose(mix, self.profile.type_mix(), atol=0.01)
+
+        hours = (arrays.eta_etd[:, 0] // 3600) % 24
+        days = np.ceil(len(arrays) / self.profile.daily_traffic())
+        rate = np.bincount(hours, minlength=24) / days
+        np.testing.assert_allclose(rate, self.profile.hourly_rate, rtol=0.1, atol=1)
+
+    def test_outputs(self):
+        """
+        Testing that the problem and the binary file hold the same airplanes
+        """
+        acs = generate_acs(100, 3, seed=1, profile=self.profile)
+        self.assertEqual(len(acs.all_ac), 100)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "synthetic.acsb")
+            generate_instance_file(path, 100, 3, seed=1, profile=self.profile)
+            loaded = load_acs(path)
+        self.assertEqual(
+            [vars(ac) for ac in loaded.all_ac], [vars(ac) for ac in acs.all_ac]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from optimisation.fcfs import FCFS
+from optimisation.tabu_search import TabuSearchOptimiser
+from problem.acs import ACS
+from problem.airplane import Airplane
+
+
+class TabuSearchOptimiserTest(unittest.TestCase):
+    """
+    Test class for the TabuSearchOptimiser class
+    """
+    def setUp(self) -> None:
+        self.planes = [
+            Airplane(f"A{i}", i % 3 + 1, 0, 0, eta, [eta, eta], 5 + 3 * (i % 4), 5)
+            for i, eta in enumerate(range(0, 60, 4))
+        ]
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        self.acs = ACS(2, 3, self.sep_matrix, self.planes, [])
+        return super().setUp()
+
+    def test_optimise(self):
+        """
+        Testing that tabu search never returns a solution worse than FCFS, with and
+        without sampling the candidate moves
+        """
+        random.seed(0)
+        fcfs_cost = FCFS(self.acs).optimise().fitness
+        for candidate_size in [None, 10]:
+            optimiser = TabuSearchOptimiser(
+                self.acs, 100, candidate_size=candidate_size, max_no_improve=30
+            )
+            solution = optimiser.optimise()
+            self.assertLessEqual(solution.fitness, fcfs_cost)
+            self.assertAlmostEqual(solution.fitness, self.acs.evaluate(solution.value))
+            self.assertEqual(solution.value, self.acs.canonical(solution.value))
+
+    def test_target_fitness(self):
+        """
+        Testing that tabu search stops once it reaches the target fitness, before
+        the first iteration if the FCFS solution reaches it
+        """
+        random.seed(0)
+        optimiser = TabuSearchOptimiser(self.acs, 1000)
+        optimiser.target_fitness = FCFS(self.acs).optimise().fitness
+        solution = optimiser.optimise()
+        self.assertLessEqual(solution.fitness, optimiser.target_fitness)
+        self.assertEqual(optimiser.iterations, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
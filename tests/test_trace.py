@@ -0,0 +1,108 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from optimisation.bee_colony_optimiser import BeeColonyOptimiser
+from optimisation.fcfs import FCFS
+from optimisation.tabu_search import TabuSearchOptimiser
+from optimisation.trace import ConvergenceTrace
+from problem.rhc_solver import RHCSolver
+from utils.input import load_acs_from_csv
+
+
+class ConvergenceTraceTest(unittest.TestCase):
+    """
+    Test class for the convergence trace
+    """
+    def setUp(self) -> None:
+        random.seed(0)
+        self.acs = load_acs_from_csv("./dataset/ikli_datasets/data_7_11.csv", 3)
+        return super().setUp()
+
+    def test_record(self):
+        """
+        Testing that only improvements are kept and the buffer grows
+        """
+        trace = ConvergenceTrace(capacity=2)
+        for i, best in enumerate([10.0, 12.0, 9.0, 9.0, 8.0, 7.0, 7.5, 1.0]):
+            trace.record(i, i, best)
+        self.assertEqual(len(trace), 5)
+        self.assertEqual(len(trace.buffer), 8)
+        np.testing.assert_array_equal(trace.rows["best"], [10.0, 9.0, 8.0, 7.0, 1.0])
+        np.testing.assert_array_equal(trace.rows["iteration"], [0, 2, 4, 5, 7])
+
+    def test_optimiser(self):
+        """
+        Testing that an attached optimiser records its convergence, which is saved
+        and loaded unchanged
+        """
+        self.acs.evaluate(FCFS(self.acs).optimise().value)
+        optimiser = TabuSearchOptimiser(self.acs, 100)
+        trace = ConvergenceTrace().attach(optimiser)
+        solution = optimiser.optimise()
+
+        rows = trace.rows
+        self.assertGreater(len(rows), 1)
+        self.assertTrue(np.all(np.diff(rows["best"]) < 0))
+        self.assertTrue(np.all(np.diff(rows["elapsed"]) >= 0))
+        self.assertTrue(np.all(np.diff(rows["iteration"]) > 0))
+        # the moves of tabu search are evaluated incrementally and counted as well
+        self.assertTrue(np.all(np.diff(rows["evaluations"]) > 0))
+        self.assertAlmostEqual(rows["best"][-1], solution.fitness)
+        # counted from the attach, the evaluation before is not part of the trace
+        self.assertEqual(rows["evaluations"][0], 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.npy")
+            trace.save(path)
+            loaded = ConvergenceTrace.load(path)
+        np.testing.assert_array_equal(loaded.rows, rows)
+
+    def test_rhc(self):
+        """
+        Testing that the receding horizon solver records its final cost with the
+        evaluations of its windows
+        """
+        solver = RHCSolver(self.acs, 30 * 60, 2, FCFS, {})
+        trace = ConvergenceTrace().attach(solver)
+        solution = solver.optimise()
+        self.assertEqual(len(trace), 1)
+        self.assertAlmostEqual(trace.rows["best"][0], solution.fitness)
+        self.assertEqual(trace.rows["evaluations"][0], len(solver.window_records))
+
+    def test_chained(self):
+        """
+        Testing that an attached trace keeps calling the callback it replaces
+        """
+        optimiser = TabuSearchOptimiser(self.acs, 20)
+        improvements = []
+        optimiser.on_improvement = lambda _, __, fitness: improvements.append(fitness)
+        first = ConvergenceTrace().attach(optimiser)
+        second = ConvergenceTrace().attach(optimiser)
+        second.attach(optimiser)
+        optimiser.optimise()
+
+        self.assertIs(second.previous, first)
+        self.assertEqual(len(improvements), optimiser.improvements)
+        np.testing.assert_array_equal(first.rows["best"], improvements)
+        np.testing.assert_array_equal(second.rows["best"], improvements)
+
+    def test_bee_colony(self):
+        """
+        Testing that a trace of BCO starts from its first food sources, as the traces
+        of the other optimisers start from their first solution
+        """
+        optimiser = BeeColonyOptimiser(self.acs, 10, 20, 5)
+        start = min(bee.solution.fitness for bee in optimiser.employed_bees)
+        trace = ConvergenceTrace().attach(optimiser)
+        optimiser.optimise()
+
+        self.assertEqual(trace.rows["iteration"][0], 0)
+        self.assertAlmostEqual(trace.rows["best"][0], start)
+
+
+if __name__ == "__main__":
+    unittest.main()
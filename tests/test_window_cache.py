@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+
+from optimisation.fcfs import FCFS
+from problem.acs import ACS
+from problem.airplane import Airplane
+from problem.rhc_solver import RHCSolver
+from problem.window_cache import WindowSolutionCache
+
+
+class WindowSolutionCacheTest(unittest.TestCase):
+    """
+    Test class for the WindowSolutionCache class
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "windows.sqlite")
+        self.sep_matrix = [[5, 20, 30], [5, 10, 20], [5, 10, 20]]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return super().tearDown()
+
+    def day(self, offset: int) -> ACS:
+        """
+        Returns the same traffic shifted by offset seconds
+        """
+        planes = [
+            Airplane("A123", 3, 0, 0, offset + 10, [offset + 10] * 2, 10, 10),
+            Airplane("A345", 1, 0, 0, offset + 12, [offset + 12] * 2, 5, 5),
+            Airplane("A678", 2, 0, 0, offset + 13, [offset + 13] * 2, 10, 10),
+            Airplane("A910", 1, 0, 0, offset + 40, [offset + 40] * 2, 10, 10),
+            Airplane("A112", 2, 0, 0, offset + 41, [offset + 41] * 2, 10, 10),
+        ]
+        return ACS(2, 3, self.sep_matrix, planes, [])
+
+    def test_eviction(self):
+        """
+        Testing that the least recently used solutions are evicted
+        """
+        cache = WindowSolutionCache(self.path, max_entries=2)
+        cache.put("a", [1], 1.0)
+        cache.put("b", [2], 1.0)
+        self.assertEqual(cache.get("a"), [1])
+        cache.put("c", [1], 1.0)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), [1])
+        cache.put("c", [2], 2.0)
+        self.assertEqual(cache.get("c"), [1])
+
+    def test_repeated_day(self):
+        """
+        Testing that the windows of a repeated day are all answered from the cache
+        """
+        cache = WindowSolutionCache(self.path)
+        first = RHCSolver(self.day(0), 20, 2, FCFS, {}, window_cache=cache)
+        first_solution = first.optimise()
+        second = RHCSolver(self.day(86400), 20, 2, FCFS, {}, window_cache=cache)
+        second_solution = second.optimise()
+
+        self.assertFalse(any(record.cache_hit for record in first.window_records))
+        self.assertTrue(all(record.cache_hit for record in second.window_records))
+        self.assertAlmostEqual(second_solution.fitness, first_solution.fitness)
+
+    def test_tied_order(self):
+        """
+        Testing that windows listing tied aircraft in another order share the
+        signature and get the cached solution in their own order
+        """
+        cache = WindowSolutionCache(self.path)
+        planes = [
+            Airplane("A1", 1, 0, 0, 10, [10, 10], 10, 10),
+            Airplane("A2", 3, 0, 0, 10, [10, 10], 10, 10),
+        ]
+        first = ACS(2, 3, self.sep_matrix, planes, [])
+        second = ACS(2, 3, self.sep_matrix, planes[::-1], [])
+        signature, order = cache.signature(first, 0)
+        other_signature, other_order = cache.signature(second, 0)
+        self.assertEqual(signature, other_signature)
+
+        cache.put(signature, cache.to_signature_order([1, 2], order), 0.0)
+        value = cache.from_signature_order(cache.get(signature), other_order)
+        self.assertEqual(value, [2, 1])
+
+    def test_warm_start_without_seeds(self):
+        """
+        Testing that a warm start keeps the cached solution as the incumbent of an
+        optimiser without seeds
+        """
+        cache = WindowSolutionCache(self.path)
+        first = RHCSolver(self.day(0), 20, 2, FCFS, {}, window_cache=cache)
+        first_solution = first.optimise()
+        second = RHCSolver(
+            self.day(86400), 20, 2, FCFS, {}, window_cache=cache, cache_warm_start=True
+        )
+        second_solution = second.optimise()
+
+        self.assertFalse(second.accepts_seeds)
+        self.assertTrue(all(record.cache_hit for record in second.window_records))
+        self.assertLessEqual(second_solution.fitness, first_solution.fitness)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,34 +1,198 @@
+import glob
+import hashlib
+import os
+import tempfile
 import typing
-import pandas as pd
+import numpy as np
+from problem.acs import ACS
 from problem.airplane import Airplane
 
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+# Types and separation matrix of the categories in the IKLI dataset
+CATEGORIES = {"Light": 1, "Medium": 2, "Heavy": 3}
+SEPARATION_MATRIX = [[82, 69, 60], [131, 69, 60], [196, 157, 96]]
+# Names of the delay cost column, the instances name the 5 minute cost by seconds
+COST_COLUMNS = ["cost_5", "cost_300"]
+# Directory of the compiled instances cached by cached_csv_arrays
+INSTANCE_CACHE_DIR = "./.instance_cache"
+# Number of compiled instances kept, the least recently used are removed beyond it
+INSTANCE_CACHE_MAX_ENTRIES = 64
+# Version of csv_arrays, part of the cache key so that changes to it miss the cache
+CSV_LOADER_VERSION = 1
+
+
+class InstanceArrays:
+    """
+    Class to hold a problem as columns of NumPy arrays, one entry per airplane, in
+    the order of the source
+
+    Attributes
+    ----------
+    num_runways : int
+        The number of runways
+    separation_matrix : np.ndarray
+        The separation matrix between the types of airplanes
+    models : np.ndarray
+        The model of every airplane
+    types : np.ndarray
+        The type of every airplane, starting at 1
+    input_times : np.ndarray
+        The input time of every airplane
+    starting_times : np.ndarray
+        The starting time of every airplane
+    ending_times : np.ndarray
+        The ending time of every airplane
+    eta_etd : np.ndarray
+        The eta_etd of every airplane on every runway, of shape (airplanes, runways)
+    delay_costs : np.ndarray
+        The delay cost of every airplane
+    pre_costs : np.ndarray
+        The cost of arriving early of every airplane
+    """
+
+    num_runways: int
+    separation_matrix: np.ndarray
+    models: np.ndarray
+    types: np.ndarray
+    input_times: np.ndarray
+    starting_times: np.ndarray
+    ending_times: np.ndarray
+    eta_etd: np.ndarray
+    delay_costs: np.ndarray
+    pre_costs: np.ndarray
+
+    def __init__(
+        self,
+        num_runways: int,
+        separation_matrix: np.ndarray,
+        models: np.ndarray,
+        types: np.ndarray,
+        input_times: np.ndarray,
+        starting_times: np.ndarray,
+        ending_times: np.ndarray,
+        eta_etd: np.ndarray,
+        delay_costs: np.ndarray,
+        pre_costs: np.ndarray,
+    ):
+        self.num_runways = num_runways
+        self.separation_matrix = separation_matrix
+        self.models = models
+        self.types = types
+        self.input_times = input_times
+        self.starting_times = starting_times
+        self.ending_times = ending_times
+        self.eta_etd = eta_etd
+        self.delay_costs = delay_costs
+        self.pre_costs = pre_costs
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def airplanes(self) -> typing.List[Airplane]:
+        """
+        Creates the airplanes of the arrays. The columns are converted to Python
+        values at once, and every airplane gets its own eta_etd list.
+
+        :return: List of Airplane objects
+        """
+        return [
+            Airplane(*fields)
+            for fields in zip(
+                self.models.astype(str).tolist(),
+                self.types.tolist(),
+                self.input_times.tolist(),
+                self.starting_times.tolist(),
+                self.ending_times.tolist(),
+                self.eta_etd.tolist(),
+                self.delay_costs.tolist(),
+                self.pre_costs.tolist(),
+            )
+        ]
+
+    @classmethod
+    def from_acs(cls, problem: ACS) -> "InstanceArrays":
+        """
+        Creates the arrays of the airplanes of a problem, in the order of all_ac
+
+        :param problem: The problem
+        :return: The arrays of the problem
+        """
+        all_ac = problem.all_ac
+        return cls(
+            problem.no_of_runways,
+            np.array(problem.separation_matrix, dtype=np.float64),
+            np.array([ac.model for ac in all_ac], dtype=object),
+            np.array([ac.ac_type for ac in all_ac], dtype=np.int64),
+            np.array([ac.input_time for ac in all_ac], dtype=np.int64),
+            np.array([ac.starting_time for ac in all_ac], dtype=np.int64),
+            np.array([ac.ending_time for ac in all_ac], dtype=np.int64),
+            np.array(
+                [ac.eta_etd for ac in all_ac], dtype=np.int64
+            ).reshape(len(all_ac), problem.no_of_runways),
+            np.array([ac.delay_cost for ac in all_ac], dtype=np.float64),
+            np.array([ac.pre_cost for ac in all_ac], dtype=np.float64),
+        )
+
+    def to_input(self):
+        """
+        Returns the arrays as input values in the same form as read_input, with all
+        airplanes landing
+
+        :return: Tuple of input values
+        """
+        return (
+            self.num_runways,
+            len(self.separation_matrix),
+            self.separation_matrix.tolist(),
+            self.airplanes(),
+            [],
+        )
+
+    def to_acs(self, fitness_cache_size: int = 0) -> ACS:
+        """
+        Creates the problem of the arrays
+
+        :param fitness_cache_size: The number of solutions whose fitness is cached
+        :return: The problem
+        """
+        return ACS(*self.to_input(), fitness_cache_size=fitness_cache_size)
+
+
 def make_input_from_csv(
     path: str, num_runways: int, output_path: str = "./my_input.txt"
 ):
     """
-    Creates input file in the required format from csv file
+    Creates input file in the required format from csv file. Use load_acs_from_csv
+    to build the problem without an input file.
 
     :param path: Path to csv file
     :param num_runways: Number of runways
     :param output_path: Path to output file
     """
+    arrays = csv_arrays(path, num_runways)
+    columns = [
+        arrays.models,
+        arrays.types,
+        arrays.input_times,
+        arrays.starting_times,
+        arrays.ending_times,
+        *arrays.eta_etd.T,
+        arrays.delay_costs,
+        arrays.pre_costs,
+    ]
     with open(output_path, "w", encoding="utf-8") as f:
         f.writelines(str(num_runways) + "\n")
-        f.writelines("3\n")
-        f.writelines(["82 69 60\n", "131 69 60\n", "196 157 96\n"])
-        ac_df = pd.read_csv(path)
-
-        categories = {"Light": 1, "Medium": 2, "Heavy": 3}
-        f.writelines(f"{len(ac_df)}\n")
-        for _, row in ac_df.iterrows():
-            file_row = f"{row['mdl']} {categories[row['category']]} {row['sta_s'] - 60*40} \
-                {row['sta_s'] - 20*60} {row['sta_s'] + 20*60} "
-
-            for _ in range(num_runways):
-                file_row += f"{row['sta_s']} "
-
-            file_row += f"{row['cost_5']} {row['cost_5']}\n"
-            f.writelines(file_row)
+        f.writelines(f"{len(CATEGORIES)}\n")
+        f.writelines(
+            [" ".join(map(str, row)) + "\n" for row in SEPARATION_MATRIX]
+        )
+        f.writelines(f"{len(arrays)}\n")
+        f.writelines(
+            " ".join(map(str, row)) + "\n"
+            for row in zip(*(column.tolist() for column in columns))
+        )
         f.writelines("0\n")
 
 
@@ -57,6 +221,94 @@ def input_ac_details(no_of_ac: int, file: typing.TextIO):
     return ac_list
 
 
+def read_input_header(file: typing.TextIO):
+    """
+    Function to read the header of an input file, up to the number of landing
+    airplanes
+
+    :param file: File object to read from
+    :return: Tuple of no of runways, no of airplane types, separation matrix and
+    no of landing airplanes
+    """
+    no_of_runways = int(file.readline())
+    no_of_ac_types = int(file.readline())
+
+    separation_matrix = []
+    for _ in range(no_of_ac_types):
+        separation_matrix.append(list(map(float, file.readline().split())))
+
+    no_of_landing_ac = int(file.readline())
+    return no_of_runways, no_of_ac_types, separation_matrix, no_of_landing_ac
+
+
+def in_eta_order(
+    chunks: typing.Iterable[typing.List[Airplane]],
+) -> typing.Iterator[typing.List[Airplane]]:
+    """
+    Function to pass on chunks of airplanes while checking that their earliest
+    eta_etd never decreases, as streamed airplanes cannot be sorted
+
+    :param chunks: Chunks of airplanes
+    :return: Iterator over the same chunks
+    """
+    last_eta = None
+    for chunk in chunks:
+        for ac in chunk:
+            eta = min(ac.eta_etd)
+            if last_eta is not None and eta < last_eta:
+                raise ValueError(
+                    f"airplane {ac.model} with eta_etd {eta} comes after {last_eta}"
+                )
+            last_eta = eta
+        yield chunk
+
+
+def read_input_chunks(
+    path: str, chunk_size: int = 1000
+) -> typing.Iterator[typing.List[Airplane]]:
+    """
+    Function to read the landing airplanes of an input file in chunks, keeping at
+    most one chunk in memory. The airplanes must be in order of eta_etd.
+
+    :param path: Path to input file
+    :param chunk_size: The number of airplanes per chunk
+    :return: Iterator over chunks of Airplane objects
+    """
+
+    def chunks():
+        with open(path, "r", encoding="utf-8") as f:
+            remaining = read_input_header(f)[3]
+            while remaining > 0:
+                size = min(chunk_size, remaining)
+                yield input_ac_details(size, f)
+                remaining -= size
+
+    return in_eta_order(chunks())
+
+
+def read_csv_chunks(
+    path: str, num_runways: int, chunk_size: int = 1000
+) -> typing.Iterator[typing.List[Airplane]]:
+    """
+    Function to read the airplanes of a csv file in the format of the IKLI dataset
+    in chunks, keeping at most one chunk in memory. The airplanes must be in order
+    of sta_s.
+
+    :param path: Path to csv file
+    :param num_runways: Number of runways
+    :param chunk_size: The number of airplanes per chunk
+    :return: Iterator over chunks of Airplane objects
+    """
+    # imported here so that pandas is only loaded when a csv file is read
+    import pandas as pd
+
+    chunks = (
+        csv_arrays(ac_df, num_runways).airplanes()
+        for ac_df in pd.read_csv(path, chunksize=chunk_size)
+    )
+    return in_eta_order(chunks)
+
+
 def read_input(path: str = "./my_input.txt"):
     """
     Function to read input from file
@@ -66,14 +318,12 @@ def read_input(path: str = "./my_input.txt"):
     takeoff airplanes
     """
     with open(path, "r", encoding="utf-8") as f:
-        no_of_runways = int(f.readline())
-        no_of_ac_types = int(f.readline())
-
-        separation_matrix = []
-        for _ in range(no_of_ac_types):
-            separation_matrix.append(list(map(float, f.readline().split())))
-
-        no_of_landing_ac = int(f.readline())
+        (
+            no_of_runways,
+            no_of_ac_types,
+            separation_matrix,
+            no_of_landing_ac,
+        ) = read_input_header(f)
         landing_ac = input_ac_details(no_of_landing_ac, f)
 
         no_of_takeoff_ac = int(f.readline())
@@ -86,3 +336,200 @@ def read_input(path: str = "./my_input.txt"):
         landing_ac,
         takeoff_ac,
     )
+
+
+def csv_arrays(
+    source: typing.Union[str, "pd.DataFrame"], num_runways: int
+) -> InstanceArrays:
+    """
+    Function to build the arrays of a csv file or a dataframe in the format of the
+    IKLI dataset with column operations. The delay cost is read from cost_5, or
+    cost_300 in the instance files. Names and labels padded with spaces, as in
+    alp_7_30, are stripped.
+
+    :param source: Path to csv file or dataframe
+    :param num_runways: Number of runways
+    :return: The arrays of the problem
+    """
+    if isinstance(source, str):
+        # imported here so that pandas is only loaded when a csv file is read
+        import pandas as pd
+
+        ac_df = pd.read_csv(source)
+    else:
+        ac_df = source
+    ac_df = ac_df.rename(columns=str.strip)
+    cost_column = next(name for name in COST_COLUMNS if name in ac_df.columns)
+
+    return sta_arrays(
+        num_runways,
+        ac_df["mdl"].str.strip().to_numpy(dtype=object),
+        ac_df["category"].str.strip().map(CATEGORIES).to_numpy(dtype=np.int64),
+        ac_df["sta_s"].to_numpy(dtype=np.int64),
+        ac_df[cost_column].to_numpy(dtype=np.float64),
+    )
+
+
+def sta_arrays(
+    num_runways: int,
+    models: np.ndarray,
+    types: np.ndarray,
+    sta: np.ndarray,
+    costs: np.ndarray,
+) -> InstanceArrays:
+    """
+    Function to build the arrays of airplanes given by their scheduled time of
+    arrival, in the same way as make_input_from_csv. The eta_etd on every runway is
+    the sta and the delay cost is used for early arrivals as well.
+
+    :param num_runways: Number of runways
+    :param models: The model of every airplane
+    :param types: The type of every airplane, starting at 1
+    :param sta: The scheduled time of arrival of every airplane in seconds
+    :param costs: The delay cost of every airplane
+    :return: The arrays of the problem
+    """
+    return InstanceArrays(
+        num_runways,
+        np.array(SEPARATION_MATRIX, dtype=np.float64),
+        models,
+        types,
+        sta - 60 * 40,
+        sta - 20 * 60,
+        sta + 20 * 60,
+        np.repeat(sta[:, np.newaxis], num_runways, axis=1),
+        costs,
+        costs.copy(),
+    )
+
+
+def read_csv_input(
+    source: typing.Union[str, "pd.DataFrame"], num_runways: int
+):
+    """
+    Function to read input directly from a csv file or a dataframe in the format
+    of the IKLI dataset, without writing an intermediate input file
+
+    :param source: Path to csv file or dataframe
+    :param num_runways: Number of runways
+    :return: Tuple of input values in the same form as read_input
+    """
+    return csv_arrays(source, num_runways).to_input()
+
+
+def cache_key(path: str, num_runways: int) -> str:
+    """
+    Function to compute the key of a csv file in the instance cache from its content
+    and the parameters of the loader
+
+    :param path: Path to csv file
+    :param num_runways: Number of runways
+    :return: The key
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"{CSV_LOADER_VERSION}:{num_runways}".encode())
+    return digest.hexdigest()
+
+
+def source_key(path: str, num_runways: int) -> str:
+    """
+    Function to compute the key of a csv file in the instance cache from its path
+    and the parameters of the loader, which is the same for every content
+
+    :param path: Path to csv file
+    :param num_runways: Number of runways
+    :return: The key
+    """
+    source = f"{os.path.abspath(path)}:{num_runways}"
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def evict_instance_cache(cache_dir: str, max_entries: int) -> None:
+    """
+    Function to remove the least recently used compiled instances beyond max_entries
+
+    :param cache_dir: Directory of the cached instances
+    :param max_entries: The number of cached instances kept
+    """
+    # imported here as the instance file module depends on this one
+    from utils.instance_file import BINARY_EXTENSION
+
+    entries = sorted(
+        glob.glob(os.path.join(cache_dir, f"*{BINARY_EXTENSION}")), key=os.path.getmtime
+    )
+    for entry in entries[: max(0, len(entries) - max_entries)]:
+        os.remove(entry)
+
+
+def cached_csv_arrays(
+    path: str,
+    num_runways: int,
+    cache_dir: str = INSTANCE_CACHE_DIR,
+    max_entries: int = INSTANCE_CACHE_MAX_ENTRIES,
+) -> InstanceArrays:
+    """
+    Function to load the arrays of a csv file through an on disk cache of compiled
+    instances. The cache is keyed by the content of the file and the parameters of
+    the loader, so a changed file is compiled again and replaces the entry of its
+    previous content. A hit is memory mapped and does not parse the file. At most
+    max_entries instances are kept, the least recently used are removed.
+
+    :param path: Path to csv file
+    :param num_runways: Number of runways
+    :param cache_dir: Directory of the cached instances
+    :param max_entries: The number of cached instances kept
+    :return: The arrays of the problem
+    """
+    # imported here as the instance file module depends on this one
+    from utils.instance_file import BINARY_EXTENSION, load_instance, save_instance
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    prefix = os.path.join(cache_dir, f"{stem}-{source_key(path, num_runways)}-")
+    cached_path = f"{prefix}{cache_key(path, num_runways)}{BINARY_EXTENSION}"
+    if os.path.exists(cached_path):
+        # the modification time orders the entries for eviction
+        os.utime(cached_path)
+        return load_instance(cached_path)
+
+    arrays = csv_arrays(path, num_runways)
+    os.makedirs(cache_dir, exist_ok=True)
+    for stale_path in glob.glob(f"{glob.escape(prefix)}*{BINARY_EXTENSION}"):
+        os.remove(stale_path)
+    # written under another name first, so that no reader sees a partial file
+    fd, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        save_instance(temporary_path, arrays)
+        os.replace(temporary_path, cached_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    evict_instance_cache(cache_dir, max_entries)
+    return arrays
+
+
+def load_acs_from_csv(
+    source: typing.Union[str, "pd.DataFrame"],
+    num_runways: int,
+    fitness_cache_size: int = 0,
+    cache_dir: typing.Optional[str] = None,
+) -> ACS:
+    """
+    Function to build the problem of a csv file or a dataframe in the format of the
+    IKLI dataset in memory
+
+    :param source: Path to csv file or dataframe
+    :param num_runways: Number of runways
+    :param fitness_cache_size: The number of solutions whose fitness is cached
+    :param cache_dir: Directory of the instance cache used for csv files, None to
+        always parse the file
+    :return: The problem
+    """
+    if cache_dir is not None and isinstance(source, str):
+        arrays = cached_csv_arrays(source, num_runways, cache_dir)
+    else:
+        arrays = csv_arrays(source, num_runways)
+    return arrays.to_acs(fitness_cache_size)
@@ -0,0 +1,116 @@
+import struct
+from typing import List, Tuple
+import numpy as np
+from problem.acs import ACS
+from utils.input import InstanceArrays
+
+# Binary instance files start with the magic and the version of their layout
+MAGIC = b"ACSINST\0"
+FORMAT_VERSION = 1
+BINARY_EXTENSION = ".acsb"
+
+# magic, version, runways, types, model width, airplanes, padded to 64 bytes
+HEADER = struct.Struct("<8sIIIIQ")
+HEADER_SIZE = 64
+
+
+def instance_layout(
+    num_runways: int, num_types: int, model_width: int, num_aircraft: int
+) -> List[Tuple[str, np.dtype, Tuple[int, ...]]]:
+    """
+    Returns the columns of a binary instance file in the order they are stored
+
+    :param num_runways: The number of runways
+    :param num_types: The number of types of airplanes
+    :param model_width: The length in bytes of the model names
+    :param num_aircraft: The number of airplanes
+    :return: The name, dtype and shape of every column
+    """
+    return [
+        ("separation_matrix", np.dtype("<f8"), (num_types, num_types)),
+        ("types", np.dtype("<i8"), (num_aircraft,)),
+        ("input_times", np.dtype("<i8"), (num_aircraft,)),
+        ("starting_times", np.dtype("<i8"), (num_aircraft,)),
+        ("ending_times", np.dtype("<i8"), (num_aircraft,)),
+        ("eta_etd", np.dtype("<i8"), (num_aircraft, num_runways)),
+        ("delay_costs", np.dtype("<f8"), (num_aircraft,)),
+        ("pre_costs", np.dtype("<f8"), (num_aircraft,)),
+        ("models", np.dtype(f"S{model_width}"), (num_aircraft,)),
+    ]
+
+
+def save_instance(path: str, arrays: InstanceArrays) -> None:
+    """
+    Writes the arrays of a problem to a binary instance file. The file is a fixed
+    header followed by every column in the order of instance_layout, each starting
+    at a multiple of 8 bytes.
+
+    :param path: Path of the file
+    :param arrays: The arrays of the problem
+    """
+    models = np.asarray(arrays.models).astype(np.bytes_)
+    model_width = max(models.dtype.itemsize, 1)
+    layout = instance_layout(
+        arrays.num_runways, len(arrays.separation_matrix), model_width, len(arrays)
+    )
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        arrays.num_runways,
+        len(arrays.separation_matrix),
+        model_width,
+        len(arrays),
+    )
+
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for name, dtype, shape in layout:
+            column = models if name == "models" else getattr(arrays, name)
+            data = np.ascontiguousarray(column, dtype=dtype).reshape(shape).tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % 8))
+
+
+def load_instance(path: str) -> InstanceArrays:
+    """
+    Maps a binary instance file into memory. The columns are read only views of the
+    file, so loading takes the same time for any number of airplanes and processes
+    loading the same file share its pages.
+
+    :param path: Path of the file
+    :return: The arrays of the problem
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER.size or header[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a binary instance file")
+    _, version, num_runways, num_types, model_width, num_aircraft = HEADER.unpack(
+        header[: HEADER.size]
+    )
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"{path} has format version {version}, expected {FORMAT_VERSION}"
+        )
+
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    columns = {}
+    offset = HEADER_SIZE
+    for name, dtype, shape in instance_layout(
+        num_runways, num_types, model_width, num_aircraft
+    ):
+        size = dtype.itemsize * int(np.prod(shape))
+        columns[name] = data[offset : offset + size].view(dtype).reshape(shape)
+        offset += size + (-size % 8)
+
+    return InstanceArrays(num_runways=num_runways, **columns)
+
+
+def load_acs(path: str, fitness_cache_size: int = 0) -> ACS:
+    """
+    Builds the problem of a binary instance file
+
+    :param path: Path of the file
+    :param fitness_cache_size: The number of solutions whose fitness is cached
+    :return: The problem
+    """
+    return load_instance(path).to_acs(fitness_cache_size)
@@ -0,0 +1,214 @@
+import glob
+import typing
+import numpy as np
+import pandas as pd
+from problem.acs import ACS
+from utils.input import CATEGORIES, InstanceArrays, sta_arrays
+from utils.instance_file import save_instance
+
+# The IKLI datasets the traffic profile is fitted on
+DATASET_PATTERN = "./dataset/ikli_datasets/*.csv"
+# The cost columns of the datasets, the cost of a delay of 5 to 60 minutes
+PROFILE_COST_COLUMNS = ["cost_5", "cost_15", "cost_30", "cost_60"]
+
+
+class TrafficProfile:
+    """
+    Class to hold the traffic fitted on the IKLI datasets. The arrival rate is the
+    mean number of airplanes scheduled in every hour of the day, and the airplanes
+    themselves are kept as rows so that sampling them keeps the joint distribution
+    of model, wake category and costs.
+
+    Attributes
+    ----------
+    hourly_rate : np.ndarray
+        The mean number of airplanes with their sta in every hour of the day
+    models : np.ndarray
+        The model of every fitted airplane
+    types : np.ndarray
+        The type of every fitted airplane, starting at 1
+    costs : np.ndarray
+        The costs of every fitted airplane, one column per PROFILE_COST_COLUMNS
+    """
+
+    hourly_rate: np.ndarray
+    models: np.ndarray
+    types: np.ndarray
+    costs: np.ndarray
+
+    def __init__(
+        self,
+        hourly_rate: np.ndarray,
+        models: np.ndarray,
+        types: np.ndarray,
+        costs: np.ndarray,
+    ):
+        self.hourly_rate = hourly_rate
+        self.models = models
+        self.types = types
+        self.costs = costs
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def daily_traffic(self) -> float:
+        """
+        Returns the mean number of airplanes in a day
+
+        :return: The number of airplanes
+        """
+        return float(self.hourly_rate.sum())
+
+    def type_mix(self) -> np.ndarray:
+        """
+        Returns the share of every type of airplane, starting with type 1
+
+        :return: The shares of the types
+        """
+        return np.bincount(self.types, minlength=len(CATEGORIES) + 1)[1:] / len(self)
+
+
+def fit_profile(
+    paths: typing.Optional[typing.List[str]] = None,
+) -> TrafficProfile:
+    """
+    Fits the traffic profile on csv files in the format of the IKLI datasets. Every
+    file holds the airplanes of some hours of one day, so the rate of an hour is the
+    number of airplanes in that hour divided by the number of files covering it.
+
+    :param paths: Paths of the csv files, the IKLI datasets if None
+    :return: The traffic profile
+    """
+    if paths is None:
+        paths = sorted(glob.glob(DATASET_PATTERN))
+    if len(paths) == 0:
+        raise ValueError("no csv files to fit the traffic profile on")
+
+    counts = np.zeros(24)
+    coverage = np.zeros(24)
+    frames = []
+    for path in paths:
+        ac_df = pd.read_csv(path)
+        hours = (ac_df["sta_s"].to_numpy(dtype=np.int64) // 3600) % 24
+        counts += np.bincount(hours, minlength=24)
+        coverage[np.unique(hours)] += 1
+        frames.append(ac_df)
+    ac_df = pd.concat(frames, ignore_index=True)
+
+    return TrafficProfile(
+        np.divide(counts, coverage, out=np.zeros(24), where=coverage > 0),
+        ac_df["mdl"].to_numpy(dtype=object),
+        ac_df["category"].map(CATEGORIES).to_numpy(dtype=np.int64),
+        ac_df[PROFILE_COST_COLUMNS].to_numpy(dtype=np.float64),
+    )
+
+
+def sample_sta(
+    rng: np.random.Generator,
+    hourly_rate: np.ndarray,
+    num_aircraft: int,
+) -> np.ndarray:
+    """
+    Samples sorted scheduled times of arrival. The hours are filled from midnight of
+    the first day at their rate until num_aircraft are expected, the airplanes are
+    spread over these hours by a multinomial draw and placed on a whole minute of
+    their hour, like the sta of the datasets.
+
+    :param rng: The random generator
+    :param hourly_rate: The mean number of airplanes in every hour of the day
+    :param num_aircraft: Number of airplanes
+    :return: The sta of every airplane in seconds
+    """
+    num_days = int(np.ceil(num_aircraft / hourly_rate.sum()))
+    rates = np.tile(hourly_rate, num_days)
+    num_hours = int(np.searchsorted(np.cumsum(rates), num_aircraft)) + 1
+    rates = rates[:num_hours]
+
+    per_hour = rng.multinomial(num_aircraft, rates / rates.sum())
+    hours = np.repeat(np.arange(num_hours, dtype=np.int64), per_hour)
+    minutes = rng.integers(0, 60, size=num_aircraft)
+    return np.sort(hours * 3600 + minutes * 60)
+
+
+def generate_arrays(
+    num_aircraft: int,
+    num_runways: int,
+    seed: typing.Optional[int] = None,
+    profile: typing.Optional[TrafficProfile] = None,
+    rate_scale: float = 1.0,
+    cost_column: str = "cost_5",
+) -> InstanceArrays:
+    """
+    Generates a synthetic instance calibrated on a traffic profile. The sta follow
+    the hourly arrival rate of the profile and every airplane copies the model,
+    type and costs of a random fitted airplane. The times and costs are derived
+    from the sta as in csv_arrays.
+
+    :param num_aircraft: Number of airplanes
+    :param num_runways: Number of runways
+    :param seed: The seed of the random generator, the same seed gives the same
+        instance
+    :param profile: The traffic profile, fitted on the IKLI datasets if None
+    :param rate_scale: Factor of the arrival rate, above 1 for denser traffic
+    :param cost_column: The cost column used as delay cost, one of
+        PROFILE_COST_COLUMNS
+    :return: The arrays of the instance
+    """
+    if num_aircraft <= 0:
+        raise ValueError("the number of airplanes must be positive")
+    if profile is None:
+        profile = fit_profile()
+
+    rng = np.random.default_rng(seed)
+    sta = sample_sta(rng, profile.hourly_rate * rate_scale, num_aircraft)
+    rows = rng.integers(0, len(profile), size=num_aircraft)
+    costs = profile.costs[rows, PROFILE_COST_COLUMNS.index(cost_column)]
+    return sta_arrays(
+        num_runways, profile.models[rows], profile.types[rows], sta, costs
+    )
+
+
+def generate_acs(
+    num_aircraft: int,
+    num_runways: int,
+    seed: typing.Optional[int] = None,
+    profile: typing.Optional[TrafficProfile] = None,
+    fitness_cache_size: int = 0,
+    **kwargs,
+) -> ACS:
+    """
+    Generates a synthetic problem, see generate_arrays
+
+    :param num_aircraft: Number of airplanes
+    :param num_runways: Number of runways
+    :param seed: The seed of the random generator
+    :param profile: The traffic profile, fitted on the IKLI datasets if None
+    :param fitness_cache_size: The number of solutions whose fitness is cached
+    :param kwargs: The other parameters of generate_arrays
+    :return: The problem
+    """
+    arrays = generate_arrays(num_aircraft, num_runways, seed, profile, **kwargs)
+    return arrays.to_acs(fitness_cache_size)
+
+
+def generate_instance_file(
+    path: str,
+    num_aircraft: int,
+    num_runways: int,
+    seed: typing.Optional[int] = None,
+    profile: typing.Optional[TrafficProfile] = None,
+    **kwargs,
+) -> None:
+    """
+    Generates a synthetic instance and writes it to a binary instance file, which
+    load_acs or solve_batch can read without building the airplanes first
+
+    :param path: Path of the file
+    :param num_aircraft: Number of airplanes
+    :param num_runways: Number of runways
+    :param seed: The seed of the random generator
+    :param profile: The traffic profile, fitted on the IKLI datasets if None
+    :param kwargs: The other parameters of generate_arrays
+    """
+    arrays = generate_arrays(num_aircraft, num_runways, seed, profile, **kwargs)
+    save_instance(path, arrays)